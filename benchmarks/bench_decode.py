@@ -0,0 +1,108 @@
+"""Compare JSON decode paths on Uber Eats sized payloads.
+
+Decoders measured on the same bytes:
+
+  resp_json   aiohttp's resp.json(): decode bytes to str, then json.loads
+  json_bytes  json.loads on the raw bytes
+  orjson      orjson.loads on the raw bytes (skipped if not installed)
+
+Reports median time per decode and tracemalloc peak memory as JSON.
+
+    python benchmarks/bench_decode.py [--repeat 50] [--output results.json]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fixtures import STAGES, active_orders_payload, past_orders_pages, user_payload  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _decoders() -> dict:
+    decoders = {
+        "resp_json": lambda raw: json.loads(raw.decode("utf-8")),
+        "json_bytes": json.loads,
+    }
+    if orjson is not None:
+        decoders["orjson"] = orjson.loads
+    return decoders
+
+
+def _payloads() -> dict[str, bytes]:
+    pages = past_orders_pages(orders=50, page_size=50)
+    return {
+        "getUserV1": json.dumps(user_payload()).encode(),
+        "getActiveOrdersV1_0": json.dumps(active_orders_payload(())).encode(),
+        "getActiveOrdersV1_1": json.dumps(active_orders_payload(("en route",))).encode(),
+        "getActiveOrdersV1_3": json.dumps(active_orders_payload(STAGES[:3])).encode(),
+        "getPastOrdersV1_page50": json.dumps(pages[0]).encode(),
+    }
+
+
+def _time(decode, raw: bytes, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decode(raw)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _peak(decode, raw: bytes) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        decode(raw)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(repeat: int) -> dict:
+    results = {}
+    decoders = _decoders()
+    for name, raw in _payloads().items():
+        row = {"bytes": len(raw)}
+        for decoder_name, decode in decoders.items():
+            row[decoder_name] = {
+                "median_us": round(_time(decode, raw, repeat) * 1e6, 1),
+                "peak_kib": round(_peak(decode, raw) / 1024, 1),
+            }
+        baseline = row["resp_json"]["median_us"]
+        if "orjson" in row and row["orjson"]["median_us"]:
+            row["orjson_speedup"] = round(baseline / row["orjson"]["median_us"], 2)
+        results[name] = row
+    return {
+        "python": sys.version.split()[0],
+        "orjson": getattr(orjson, "__version__", None),
+        "repeat": repeat,
+        "payloads": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+    text = json.dumps(run(args.repeat), indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+"""Benchmark suite for the integration's hot paths.
+
+Runs the real coordinator code on a bare Home Assistant core against the
+local stub (stub.py), using the anonymized payloads from fixtures.py:
+
+  parse_single_order/<stage>   _parse_single_order, geocode cache warm
+  parse_orders/<n>             _parse_orders for 0, 1 and 3 orders
+  parse_cold/{serial,concurrent}
+                               3 orders, cold geocode cache, stub latency
+  statistics/*                 OrderStatistics full build, delta, summary
+  fetch_past_orders/*          full and incremental crawl over HTTP
+  poll/*                       one active-orders cycle, changed and unchanged
+  order_events/*               keyed order diff plus event dispatch (bus, TTS enabled)
+  geofence/<n>                 geofence pass for 1 and 3 couriers, rings and zones
+  websocket/*                  account summary and details builders, a past-orders
+                               page requested with the panel's message shape
+
+Results are written as JSON. With --compare, medians are checked against a
+previous result file and the run fails when any case slowed down by more
+than --tolerance.
+
+    python benchmarks/bench_integration.py --output bench.json
+    python benchmarks/bench_integration.py --compare bench.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from harness import (
+    ROOT,
+    TIME_ZONE,
+    async_create_hass,
+    async_measure,
+    create_coordinator,
+    patch_endpoints,
+)
+
+import stub
+from fixtures import STAGES, active_orders_payload, past_orders_pages, user_payload
+from homeassistant.const import __version__ as HA_VERSION
+from homeassistant.util import dt as dt_util
+
+from custom_components.uber_eats.const import (
+    CONF_DRIVER_NEARBY_AUTOMATION_ENABLED,
+    CONF_DRIVER_NEARBY_AUTOMATION_ENTITY,
+    CONF_TTS_ENABLED,
+    CONF_TTS_ENTITY_ID,
+    CONF_TTS_INTERVAL_ENABLED,
+    CONF_TTS_MEDIA_PLAYERS,
+    DOMAIN,
+)
+from custom_components.uber_eats.geocode import GeocodeCache
+from custom_components.uber_eats.order_events import diff_orders
+from custom_components.uber_eats.statistics import OrderStatistics
+from custom_components.uber_eats.websocket import (
+    _build_account_details,
+    _build_account_summary,
+    websocket_get_past_orders,
+)
+
+TTS_OPTIONS = {
+    CONF_TTS_ENABLED: True,
+    CONF_TTS_ENTITY_ID: "tts.bench",
+    CONF_TTS_MEDIA_PLAYERS: ["media_player.kitchen", "media_player.living_room"],
+    CONF_TTS_INTERVAL_ENABLED: True,
+    CONF_DRIVER_NEARBY_AUTOMATION_ENABLED: True,
+    CONF_DRIVER_NEARBY_AUTOMATION_ENTITY: "automation.bench_driver_nearby",
+}
+ORDER_COUNTS = (0, 1, 3)
+
+
+def _raw_orders(stages: tuple[str, ...]) -> list[dict]:
+    return active_orders_payload(stages)["data"]["orders"]
+
+
+async def _bench_parse(hass, coordinator, state, repeat: int, results: dict, comparisons: dict) -> None:
+    for stage in STAGES:
+        raw = _raw_orders((stage,))[0]
+        results[f"parse_single_order/{stage}"] = await async_measure(
+            lambda raw=raw: coordinator._parse_single_order(raw), repeat
+        )
+
+    for count in ORDER_COUNTS:
+        raw_orders = _raw_orders(STAGES[:count])
+
+        async def _parse(raw_orders=raw_orders):
+            coordinator._order_fingerprints = {}  # measure a full parse, not the reuse path
+            await coordinator._parse_orders(raw_orders)
+
+        results[f"parse_orders/{count}"] = await async_measure(_parse, repeat)
+
+    # Cold cache: every order waits on a (stubbed, delayed) Nominatim lookup
+    raw_orders = _raw_orders(("en route", "arriving", "picked up"))
+    cold_repeat = max(5, repeat // 10)
+
+    async def _serial():
+        coordinator._geocoder = GeocodeCache(hass)
+        for order in raw_orders:
+            await coordinator._parse_single_order(order)
+
+    async def _concurrent():
+        coordinator._geocoder = GeocodeCache(hass)
+        coordinator._order_fingerprints = {}
+        await coordinator._parse_orders(raw_orders)
+
+    state.latency = 0.05
+    try:
+        results["parse_cold/serial"] = await async_measure(_serial, cold_repeat, warmup=1)
+        results["parse_cold/concurrent"] = await async_measure(_concurrent, cold_repeat, warmup=1)
+    finally:
+        state.latency = 0.0
+    serial = results["parse_cold/serial"]["median_us"]
+    concurrent = results["parse_cold/concurrent"]["median_us"]
+    comparisons["parse_cold"] = {
+        "orders": len(raw_orders),
+        "geocode_latency_ms": 50,
+        "serial_median_us": serial,
+        "concurrent_median_us": concurrent,
+        "speedup": round(serial / concurrent, 2) if concurrent else None,
+    }
+
+
+async def _bench_past_orders(hass, coordinator, past_orders: int, repeat: int, results: dict) -> None:
+    fetch_repeat = max(5, repeat // 10)
+    orders = []
+
+    async def _collect(page):
+        orders.extend(page)
+
+    async def _discard(page):
+        pass
+
+    results[f"fetch_past_orders/full_{past_orders}"] = await async_measure(
+        lambda: coordinator.fetch_past_orders(_discard), fetch_repeat, warmup=1
+    )
+    await coordinator.fetch_past_orders(_collect)
+    known = {order["uuid"] for order in orders[10:]}
+    results["fetch_past_orders/incremental"] = await async_measure(
+        lambda: coordinator.fetch_past_orders(_discard, known_uuids=known), repeat
+    )
+
+    time_zone = dt_util.get_time_zone(TIME_ZONE)
+    year = int(orders[0]["completed_at"][:4])
+    results[f"statistics/full_build_{len(orders)}"] = await async_measure(
+        lambda: OrderStatistics.from_orders(orders, time_zone).summary(year), repeat
+    )
+    stats = OrderStatistics.from_orders(orders, time_zone)
+    delta = orders[:10]
+    results["statistics/replace_10"] = await async_measure(lambda: stats.replace_orders(delta, delta), repeat)
+
+    live = [next(order for order in orders if not order.get("is_cancelled"))]
+
+    def _summary():
+        stats.replace_orders(live, live)  # invalidate the cached summary
+        return stats.summary(year)
+
+    results["statistics/summary"] = await async_measure(_summary, repeat)
+
+
+async def _bench_poll(hass, coordinator, state, repeat: int, results: dict) -> None:
+    for count in ORDER_COUNTS:
+        state.set_active(active_orders_payload(STAGES[:count]))
+        await coordinator._async_fetch_active_orders()
+        results[f"poll/{count}_unchanged"] = await async_measure(coordinator._async_fetch_active_orders, repeat)
+
+        async def _changed():
+            coordinator._body_fingerprint = None  # as if the body changed
+            await coordinator._async_fetch_active_orders()
+
+        results[f"poll/{count}_changed"] = await async_measure(_changed, repeat)
+    await hass.async_block_till_done()
+
+
+async def _bench_order_events(hass, coordinator, repeat: int, results: dict) -> None:
+    parsed = await coordinator._parse_orders(_raw_orders(STAGES[:3]))
+    active = coordinator._build_current_data(parsed)
+    previous = {order.order_id: order for order in parsed}
+
+    def _unchanged():
+        coordinator._dispatch_order_events(diff_orders(previous, parsed), active)
+
+    def _transitions():
+        # Every order is new: new_order, driver_assigned and status_changed each
+        coordinator._last_interval_tts_time = None
+        coordinator._dispatch_order_events(diff_orders({}, parsed), active)
+
+    results["order_events/unchanged"] = await async_measure(_unchanged, repeat)
+    results["order_events/transitions"] = await async_measure(_transitions, repeat)
+    # Let the announcement tasks finish (no media players exist, so they return at once)
+    await hass.async_block_till_done()
+
+
+async def _bench_geofence(hass, coordinator, repeat: int, results: dict) -> None:
+    # A couple of HA zones besides the rings: one near home, one across town
+    hass.states.async_set("zone.work", "0", {"latitude": 40.7306, "longitude": -73.9866, "radius": 150})
+    hass.states.async_set("zone.gym", "0", {"latitude": 40.7150, "longitude": -74.0080, "radius": 100})
+    zones = coordinator._geofence_zones()
+    for count in ORDER_COUNTS[1:]:
+        parsed = await coordinator._parse_orders(_raw_orders(STAGES[1:1 + count]))
+        results[f"geofence/{count}"] = await async_measure(lambda: coordinator.geofence.update(parsed, zones), repeat)
+
+
+# What the panel's _fetchPastOrders sends for the first page with every filter set
+PANEL_PAST_ORDERS_REQUEST = {
+    "id": 1,
+    "type": "uber_eats/get_past_orders",
+    "sort": "date_desc",
+    "start_date": "2000-01-01",
+    "end_date": "2099-12-31",
+    "cancelled": False,
+}
+
+
+class _Connection:
+    """Collects what a websocket handler sends back."""
+
+    def __init__(self) -> None:
+        self.results: list = []
+
+    def send_result(self, msg_id: int, result=None) -> None:
+        self.results.append(result)
+
+    def send_error(self, msg_id: int, code: str, message: str) -> None:
+        raise RuntimeError(f"{code}: {message}")
+
+
+def _check_keys(name: str, payload: dict, keys: set) -> None:
+    """Fail the run when a payload lacks keys the panel reads."""
+    missing = keys - set(payload)
+    if missing:
+        raise AssertionError(f"{name} is missing {sorted(missing)}")
+
+
+async def _async_call_ws(hass, handler, msg: dict):
+    """Validate msg with the command's schema (as the websocket API does), then run it."""
+    connection = _Connection()
+    await handler.__wrapped__(hass, connection, handler._ws_schema(msg))
+    return connection.results[-1]
+
+
+async def _bench_websocket(hass, coordinator, repeat: int, results: dict) -> None:
+    entry = hass.config_entries.async_get_entry(coordinator.entry_id)
+    # The panel indexes accounts by entry_id, with or without a loaded coordinator
+    hass.data[DOMAIN].pop(entry.entry_id)
+    try:
+        _check_keys("account details (not loaded)", _build_account_details(hass, entry), {"entry_id"})
+    finally:
+        hass.data[DOMAIN][entry.entry_id] = coordinator
+    for count in ORDER_COUNTS:
+        parsed = await coordinator._parse_orders(_raw_orders(STAGES[:count]))
+        coordinator.data = coordinator._build_current_data(parsed)
+        results[f"websocket/summary_{count}"] = await async_measure(
+            lambda: _build_account_summary(hass, entry), repeat
+        )
+        results[f"websocket/details_{count}"] = await async_measure(
+            lambda: _build_account_details(hass, entry), repeat
+        )
+        _check_keys("account details", _build_account_details(hass, entry), {"entry_id", "orders"})
+
+    request = {**PANEL_PAST_ORDERS_REQUEST, "entry_id": coordinator.entry_id}
+    page = await _async_call_ws(hass, websocket_get_past_orders, request)
+    _check_keys("get_past_orders response", page, {"orders", "total", "next_cursor", "restaurants", "statistics"})
+    results["websocket/past_orders_page"] = await async_measure(
+        lambda: _async_call_ws(hass, websocket_get_past_orders, request), repeat
+    )
+
+
+async def async_run(repeat: int, past_orders: int) -> dict:
+    results: dict[str, dict] = {}
+    comparisons: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_create_hass(config_dir)
+        state = stub.StubState(active_orders_payload(()), past_orders_pages(past_orders), user_payload())
+        runner, base_url = await stub.async_start(state)
+        try:
+            with patch_endpoints(base_url):
+                coordinator = create_coordinator(hass, "bench", TTS_OPTIONS)
+                await _bench_parse(hass, coordinator, state, repeat, results, comparisons)
+                await _bench_past_orders(hass, coordinator, past_orders, repeat, results)
+                await _bench_poll(hass, coordinator, state, repeat, results)
+                await _bench_order_events(hass, coordinator, repeat, results)
+                await _bench_geofence(hass, coordinator, repeat, results)
+                await _bench_websocket(hass, coordinator, repeat, results)
+                await coordinator.async_shutdown()
+        finally:
+            await runner.cleanup()
+            await hass.async_stop(force=True)
+
+    manifest = json.loads((ROOT / "custom_components" / "uber_eats" / "manifest.json").read_text())
+    return {
+        "integration_version": manifest.get("version"),
+        "homeassistant": HA_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "timestamp": int(time.time()),
+        "repeat": repeat,
+        "past_orders": past_orders,
+        "results": results,
+        "comparisons": comparisons,
+    }
+
+
+def compare(current: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Cases whose median grew by more than tolerance (a fraction) over the baseline."""
+    regressions = []
+    for case, result in current["results"].items():
+        before = baseline.get("results", {}).get(case)
+        if not before or not before.get("median_us"):
+            continue
+        change = result["median_us"] / before["median_us"] - 1
+        if change > tolerance:
+            regressions.append(
+                f"{case}: {before['median_us']}us -> {result['median_us']}us (+{change:.0%})"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--past-orders", type=int, default=120)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--compare", type=Path, help="previous result file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    result = asyncio.run(async_run(args.repeat, args.past_orders))
+    text = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    print(text)
+
+    if args.compare:
+        regressions = compare(result, json.loads(args.compare.read_text()), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Event-loop lag during a large past-orders sync.
+
+Command-line wrapper around test_loop_lag.py (the pytest check) for other
+history sizes and bounds. Exits 1 when the worst observed lag exceeds
+--max-lag-ms.
+
+    python benchmarks/bench_loop_lag.py --orders 3000 --max-lag-ms 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+
+from test_loop_lag import MAX_LAG_MS, PAGE_SIZE, SYNC_ORDERS, async_run
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=SYNC_ORDERS)
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    parser.add_argument("--max-lag-ms", type=float, default=MAX_LAG_MS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    result = asyncio.run(async_run(args.orders, args.page_size))
+    result["max_lag_allowed_ms"] = args.max_lag_ms
+    print(json.dumps(result, indent=2))
+    if result["loop_lag"]["max_ms"] > args.max_lag_ms:
+        print(f"FAIL: event loop stalled {result['loop_lag']['max_ms']}ms during the sync", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""Anonymized Uber Eats payloads for the benchmarks.
+
+The builders reproduce the shape and rough size of recorded responses
+(feed cards, illustrations, route lines and cart items the integration never
+reads) with synthetic names, ids and coordinates. They are deterministic for
+a given seed, so runs are comparable across releases.
+"""
+from __future__ import annotations
+
+import random
+import uuid as uuid_lib
+from datetime import datetime, timedelta, timezone
+
+HOME = (40.7128, -74.0060)
+STAGES = ("preparing", "picked up", "en route", "arriving", "delivered", "complete")
+_PROGRESS = {stage: i for i, stage in enumerate(STAGES)}
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid_lib.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _illustration(rng: random.Random) -> dict:
+    return {
+        "url": f"https://cdn.example.invalid/illustrations/{_uuid(rng)}.png",
+        "darkModeUrl": f"https://cdn.example.invalid/illustrations/{_uuid(rng)}-dark.png",
+        "width": 375,
+        "height": 220,
+        "accessibilityText": "Order progress illustration",
+        "animation": {"frames": [{"t": i * 16, "opacity": round(rng.random(), 3)} for i in range(24)]},
+    }
+
+
+def _offset(point: tuple[float, float], rng: random.Random, spread: float) -> tuple[float, float]:
+    return point[0] + rng.uniform(-spread, spread), point[1] + rng.uniform(-spread, spread)
+
+
+def active_order(
+    rng: random.Random,
+    stage: str,
+    index: int = 0,
+    *,
+    store: tuple[float, float] | None = None,
+    courier: tuple[float, float] | None = None,
+    eta: str | None = None,
+) -> dict:
+    """One getActiveOrdersV1 order in the given stage.
+
+    store, courier and eta default to values derived from the stage; the
+    stand-in server passes them to move the courier along a scripted route.
+    """
+    if store is None:
+        store = _offset(HOME, rng, 0.03)
+    has_courier = stage in ("picked up", "en route", "arriving", "delivered")
+    if courier is None:
+        progress = 1 - _PROGRESS[stage] / 4 if has_courier else 1
+        courier = (
+            store[0] + (HOME[0] - store[0]) * (1 - progress),
+            store[1] + (HOME[1] - store[1]) * (1 - progress),
+        )
+    if eta is None:
+        eta = (datetime(2026, 1, 1, 19, 0) + timedelta(minutes=rng.randint(5, 50))).strftime("%-I:%M %p")
+    map_entities = [
+        {"type": "EATER", "latitude": HOME[0], "longitude": HOME[1]},
+        {"type": "STORE", "latitude": store[0], "longitude": store[1]},
+    ]
+    if has_courier:
+        map_entities.append({"type": "COURIER", "latitude": courier[0], "longitude": courier[1], "bearing": rng.randint(0, 359)})
+    feed_cards = [
+        {
+            "type": "status",
+            "status": {
+                "currentProgress": _PROGRESS[stage],
+                "totalProgress": 5,
+                "title": eta,
+                "timelineSummary": f"Order {index + 1}: {stage.title()}",
+                "titleSummary": {"summary": {"text": f"Your order is {stage}"}},
+                "statusSummary": {"text": f"Latest arrival by {eta}"},
+                "illustrations": [_illustration(rng) for _ in range(3)],
+            },
+        },
+        {
+            "type": "courier",
+            "courier": [{"iconUrl": f"https://cdn.example.invalid/couriers/{_uuid(rng)}.jpg", "title": "Courier"}] if has_courier else [],
+        },
+        {
+            "type": "orderSummary",
+            "orderSummary": {
+                "items": [
+                    {"title": f"Item {n}", "quantity": rng.randint(1, 3), "customizations": [{"title": f"Option {m}"} for m in range(4)]}
+                    for n in range(rng.randint(2, 6))
+                ],
+            },
+        },
+    ]
+    contacts = [{"type": "COURIER", "title": f"Courier {index + 1}", "formattedPhoneNumber": "+1 555-0100"}] if has_courier else []
+    return {
+        "uuid": _uuid(rng),
+        "feedCards": feed_cards,
+        "contacts": contacts,
+        "activeOrderOverview": {"title": f"Restaurant {rng.randint(1, 40)}", "subtitle": f"{rng.randint(1, 9)} items"},
+        "backgroundFeedCards": [
+            {
+                "mapEntity": map_entities,
+                "routeline": {"points": [_offset(courier, rng, 0.01) for _ in range(60)]},
+            }
+        ],
+        "orderInfo": {
+            "storeInfo": {"location": {"latitude": store[0], "longitude": store[1]}},
+            "customerInfos": [{"pictureUrl": "https://cdn.example.invalid/eaters/anonymous.jpg"}],
+        },
+    }
+
+
+def active_orders_payload(stages: tuple[str, ...] = (), seed: int = 1) -> dict:
+    """getActiveOrdersV1 response with one order per stage given."""
+    rng = random.Random(seed)
+    return {
+        "status": "success",
+        "data": {
+            "orders": [active_order(rng, stage, i) for i, stage in enumerate(stages)],
+            "appUpsellIllustration": _illustration(rng),
+        },
+    }
+
+
+def past_order(rng: random.Random, completed_at: datetime) -> tuple[str, dict]:
+    """One getPastOrdersV1 ordersMap entry."""
+    order_uuid = _uuid(rng)
+    store_uuid = f"store-{rng.randint(1, 25):03d}"
+    subtotal = round(rng.uniform(8, 60), 2)
+    fee = round(rng.choice((0, 0.49, 1.99, 2.99, 4.99)), 2)
+    tax = round(subtotal * 0.08875, 2)
+    promo = -round(rng.choice((0, 0, 0, 3, 5)), 2)
+    total = round(subtotal + fee + tax + promo, 2)
+    checkout = [
+        {"key": "eats_fare.subtotal", "type": "credit", "rawValue": subtotal, "label": "Subtotal"},
+        {"key": "eats.mp.charges.booking_fee", "type": "credit", "rawValue": fee, "label": "Delivery Fee"},
+        {"key": "eats.tax.base", "type": "credit", "rawValue": tax, "label": "Taxes"},
+        {"key": "eats.promotion", "type": "debit", "rawValue": promo, "label": "Promotion"},
+        {"key": "eats_fare.total", "type": "credit", "rawValue": total, "label": "Total"},
+    ]
+    return order_uuid, {
+        "baseEaterOrder": {
+            "uuid": order_uuid,
+            "completedAt": completed_at.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "isCancelled": rng.random() < 0.05,
+            "shoppingCart": {
+                "items": [
+                    {
+                        "title": f"Item {n}",
+                        "quantity": rng.randint(1, 3),
+                        "price": rng.randint(300, 2500),
+                        "customizations": [{"title": f"Option {m}", "price": 0} for m in range(rng.randint(0, 5))],
+                        "imageUrl": f"https://cdn.example.invalid/items/{_uuid(rng)}.jpg",
+                    }
+                    for n in range(rng.randint(1, 8))
+                ],
+            },
+        },
+        "storeInfo": {
+            "uuid": store_uuid,
+            "title": f"Restaurant {store_uuid[-3:]}",
+            "heroImageUrl": f"https://cdn.example.invalid/stores/{store_uuid}.jpg",
+            "location": {"address": {"eaterFormattedAddress": f"{rng.randint(1, 999)} Example St, , New York, NY"}},
+            "rating": {"ratingValue": round(rng.uniform(3.5, 5), 1), "reviewCount": rng.randint(10, 5000)},
+        },
+        "fareInfo": {"totalPrice": int(round(total * 100)), "checkoutInfo": checkout},
+        "illustrations": [_illustration(rng) for _ in range(2)],
+    }
+
+
+def past_orders_pages(orders: int = 120, page_size: int = 10, seed: int = 2) -> list[dict]:
+    """getPastOrdersV1 responses for a history of `orders` orders, newest first."""
+    rng = random.Random(seed)
+    now = datetime(2026, 10, 1, 19, 0, tzinfo=timezone.utc)
+    entries = [past_order(rng, now - timedelta(days=i * 3, hours=rng.randint(0, 6))) for i in range(orders)]
+    pages = []
+    for start in range(0, orders, page_size):
+        chunk = entries[start:start + page_size]
+        pages.append({
+            "status": "success",
+            "data": {
+                "ordersMap": dict(chunk),
+                "orderUuids": [order_uuid for order_uuid, _ in chunk],
+                "meta": {"hasMore": start + page_size < orders},
+            },
+        })
+    return pages
+
+
+def user_payload() -> dict:
+    """getUserV1 response."""
+    return {
+        "status": "success",
+        "data": {
+            "isLoggedIn": True,
+            "firstName": "Alex",
+            "lastName": "Example",
+            "pictureUrl": "https://cdn.example.invalid/eaters/anonymous.jpg",
+            "geoIpCountryCode": "US",
+            "email": "alex@example.invalid",
+        },
+    }
@@ -0,0 +1,156 @@
+"""Home Assistant harness shared by the integration benchmarks.
+
+Needs a Home Assistant install (the integration's own runtime). A bare
+HomeAssistant core is created in a temporary config dir; config entries are
+plain objects registered in BenchEntries, so coordinators run without the
+config-entry setup machinery.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from homeassistant import config_entries  # noqa: E402
+from homeassistant.config_entries import ConfigEntryState  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+from custom_components.uber_eats import coordinator as coordinator_module  # noqa: E402
+from custom_components.uber_eats import geocode as geocode_module  # noqa: E402
+from custom_components.uber_eats.const import (  # noqa: E402
+    CONF_ACCOUNT_NAME,
+    CONF_TIME_ZONE,
+    DATA_POLL_SCHEDULER,
+    DOMAIN,
+)
+from custom_components.uber_eats.coordinator import UberEatsCoordinator  # noqa: E402
+from custom_components.uber_eats.scheduler import UberEatsPollScheduler  # noqa: E402
+from fixtures import HOME  # noqa: E402
+from stub import ACTIVE_PATH, PAST_PATH, REVERSE_PATH, USER_PATH  # noqa: E402
+
+TIME_ZONE = "America/New_York"
+LAG_INTERVAL = 0.05  # seconds between event-loop lag probes
+
+
+class BenchEntry:
+    """The config entry attributes the integration reads."""
+
+    def __init__(self, entry_id: str, account_name: str, options: dict | None = None) -> None:
+        self.entry_id = entry_id
+        self.data = {CONF_ACCOUNT_NAME: account_name, CONF_TIME_ZONE: TIME_ZONE}
+        self.options = options or {}
+        self.state = ConfigEntryState.LOADED
+        self.reauth_requests = 0
+
+    def async_start_reauth(self, hass: HomeAssistant, *args, **kwargs) -> None:
+        """Count reauth requests (a 401 from the API)."""
+        self.reauth_requests += 1
+
+
+class BenchEntries:
+    """Lookup used in place of hass.config_entries."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, BenchEntry] = {}
+
+    def add(self, entry: BenchEntry) -> None:
+        self._entries[entry.entry_id] = entry
+
+    def async_get_entry(self, entry_id: str) -> BenchEntry | None:
+        return self._entries.get(entry_id)
+
+    def async_entries(self, domain: str | None = None) -> list[BenchEntry]:
+        return list(self._entries.values())
+
+
+async def async_create_hass(config_dir: str, throttle: bool = False) -> HomeAssistant:
+    """Bare Home Assistant core with home coordinates and time zone set.
+
+    Unless throttle is set, the integration's global request budget is lifted.
+    """
+    hass = HomeAssistant(config_dir)
+    hass.config.latitude, hass.config.longitude = HOME
+    await hass.config.async_set_time_zone(TIME_ZONE)
+    hass.config_entries = BenchEntries()
+    hass.data[DOMAIN] = {}
+    if not throttle:
+        # The global request budget is part of production behaviour, not of the
+        # code being measured; lift it so stub round-trips are never throttled
+        hass.data[DATA_POLL_SCHEDULER] = UberEatsPollScheduler(hass, requests_per_minute=10**9, burst=10**9)
+    return hass
+
+
+def create_coordinator(
+    hass: HomeAssistant, entry_id: str, options: dict | None = None, sid: str | None = None
+) -> UberEatsCoordinator:
+    """Create a coordinator for a new bench entry (sid identifies the account to the stand-in)."""
+    entry = BenchEntry(entry_id, f"Bench {entry_id}", options)
+    hass.config_entries.add(entry)
+    token = config_entries.current_entry.set(entry)
+    try:
+        coordinator = UberEatsCoordinator(
+            hass, entry_id, sid or f"sid-{entry_id}", "bench-session", entry.data[CONF_ACCOUNT_NAME], TIME_ZONE
+        )
+    finally:
+        config_entries.current_entry.reset(token)
+    hass.data[DOMAIN][entry_id] = coordinator
+    return coordinator
+
+
+@contextlib.contextmanager
+def patch_endpoints(base_url: str):
+    """Point the integration's Uber Eats and Nominatim URLs at the stub."""
+    with patch.multiple(
+        coordinator_module,
+        ENDPOINT=base_url + ACTIVE_PATH,
+        ENDPOINT_PAST_ORDERS=base_url + PAST_PATH,
+        ENDPOINT_GET_USER=base_url + USER_PATH,
+    ), patch.object(geocode_module, "NOMINATIM_REVERSE_URL", base_url + REVERSE_PATH):
+        yield
+
+
+def summarize(samples: list[float]) -> dict:
+    """Timing summary in microseconds."""
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))]
+    return {
+        "n": len(ordered),
+        "median_us": round(statistics.median(ordered) * 1e6, 1),
+        "p95_us": round(p95 * 1e6, 1),
+        "min_us": round(ordered[0] * 1e6, 1),
+        "max_us": round(ordered[-1] * 1e6, 1),
+    }
+
+
+async def async_measure(func, repeat: int, warmup: int = 3) -> dict:
+    """Time a sync or async callable."""
+    for _ in range(warmup):
+        result = func()
+        if inspect.isawaitable(result):
+            await result
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        if inspect.isawaitable(result):
+            await result
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+async def async_monitor_loop_lag(samples: list[float]) -> None:
+    """Record how late each short sleep wakes up (event-loop lag), until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(LAG_INTERVAL)
+        samples.append(max(0.0, loop.time() - start - LAG_INTERVAL))
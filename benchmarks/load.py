@@ -0,0 +1,157 @@
+"""Multi-account load generator against the stand-in server.
+
+Starts N coordinators on a bare Home Assistant core and lets them poll the
+stand-in (standin.py) on their own adaptive schedule for --duration seconds,
+then reports requests/sec, event-loop lag and cycle-time percentiles as JSON.
+
+    python benchmarks/load.py --accounts 8 --duration 300 --order-minutes 4
+    python benchmarks/load.py --accounts 20 --rate-429 0.05 --latency-ms 150
+    python benchmarks/load.py --url http://127.0.0.1:8765 --accounts 8
+
+By default the stand-in runs in-process; --url targets one started
+separately. The integration's global request budget applies unless
+--unthrottled is given.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import tempfile
+import time
+from pathlib import Path
+
+import aiohttp
+
+from harness import async_create_hass, async_monitor_loop_lag, create_coordinator, patch_endpoints, summarize
+
+import standin
+from homeassistant.const import __version__ as HA_VERSION
+
+from custom_components.uber_eats.scheduler import async_get_poll_scheduler
+
+
+def _instrument(coordinator, cycles: list[float]) -> None:
+    """Time every poll cycle of a coordinator."""
+    update = coordinator._async_update_data
+
+    async def _timed_update():
+        start = time.perf_counter()
+        try:
+            return await update()
+        finally:
+            cycles.append(time.perf_counter() - start)
+
+    coordinator._async_update_data = _timed_update
+
+
+async def _async_stats(session: aiohttp.ClientSession, base_url: str) -> dict:
+    async with session.get(f"{base_url}/stats") as resp:
+        return await resp.json()
+
+
+def _ms(samples: list[float]) -> dict:
+    if not samples:
+        return {"n": 0}
+    return {
+        key.replace("_us", "_ms"): round(value / 1000, 2) if key != "n" else value
+        for key, value in summarize(samples).items()
+    }
+
+
+async def async_run(args: argparse.Namespace) -> dict:
+    lag: list[float] = []
+    cycles: list[float] = []
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_create_hass(config_dir, throttle=not args.unthrottled)
+        runner = None
+        if args.url:
+            base_url = args.url.rstrip("/")
+        else:
+            runner, base_url = await standin.async_start(standin.config_from_args(args))
+        monitor = asyncio.create_task(async_monitor_loop_lag(lag))
+        try:
+            async with aiohttp.ClientSession() as stats_session:
+                with patch_endpoints(base_url):
+                    coordinators = [
+                        create_coordinator(hass, f"load{i}", sid=f"load-{i}") for i in range(args.accounts)
+                    ]
+                    unsubscribes = []
+                    for coordinator in coordinators:
+                        _instrument(coordinator, cycles)
+                        # A listener keeps the coordinator polling, as an entity would
+                        unsubscribes.append(coordinator.async_add_listener(lambda: None))
+
+                    before = await _async_stats(stats_session, base_url)
+                    started = time.monotonic()
+                    await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+                    if args.sync_past_orders:
+                        for coordinator in coordinators:
+                            coordinator.async_schedule_past_orders_refresh(force=True)
+                    await asyncio.sleep(args.duration)
+                    elapsed = time.monotonic() - started
+                    after = await _async_stats(stats_session, base_url)
+
+                    failed = sum(1 for coordinator in coordinators if not coordinator.last_update_success)
+                    reauth = sum(hass.config_entries.async_get_entry(c.entry_id).reauth_requests for c in coordinators)
+                    scheduler = async_get_poll_scheduler(hass).stats
+                    http = coordinators[0]._http.stats if coordinators else {}
+                    geocode = coordinators[0]._geocoder.stats if coordinators else {}
+                    for unsubscribe in unsubscribes:
+                        unsubscribe()
+                    for coordinator in coordinators:
+                        await coordinator.async_shutdown()
+        finally:
+            monitor.cancel()
+            if runner is not None:
+                await runner.cleanup()
+            await hass.async_stop(force=True)
+
+    requests = after["requests"] - before["requests"]
+    by_endpoint = {
+        key: count - before["by_endpoint"].get(key, 0)
+        for key, count in after["by_endpoint"].items()
+        if count - before["by_endpoint"].get(key, 0)
+    }
+    return {
+        "homeassistant": HA_VERSION,
+        "python": platform.python_version(),
+        "accounts": args.accounts,
+        "duration_s": round(elapsed, 1),
+        "throttled": not args.unthrottled,
+        "requests": requests,
+        "requests_per_sec": round(requests / elapsed, 2) if elapsed else None,
+        "by_endpoint": by_endpoint,
+        "cycles": len(cycles),
+        "cycle_time": _ms(cycles),
+        "loop_lag": _ms(lag),
+        "accounts_failing": failed,
+        "reauth_requests": reauth,
+        "scheduler": scheduler,
+        "http": http,
+        "geocode": geocode,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=120.0, help="seconds to run")
+    parser.add_argument("--url", help="use an already running stand-in instead of starting one")
+    parser.add_argument("--unthrottled", action="store_true", help="lift the global request budget")
+    parser.add_argument("--sync-past-orders", action="store_true", help="also sync each account's past orders")
+    parser.add_argument("--output", type=Path)
+    standin.add_arguments(parser)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    text = json.dumps(asyncio.run(async_run(args)), indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
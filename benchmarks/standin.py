@@ -0,0 +1,258 @@
+"""Local stand-in for the Uber Eats API with scripted order lifecycles.
+
+Serves getActiveOrdersV1, getPastOrdersV1 and getUserV1 (the paths in
+const.py) plus a Nominatim reverse endpoint. Accounts are keyed by the sid
+cookie and created on first request. Each account loops through orders:
+
+  preparing -> picked up (driver assigned) -> en route -> arriving -> delivered
+
+then stays idle until its next order. While a driver is assigned, the courier
+moves from the store to home in a straight line, so each poll returns new
+coordinates. Latency, 429 and 401 responses can be injected.
+
+    python benchmarks/standin.py --port 8765 --order-minutes 6 --rate-429 0.02
+
+GET /stats returns request counts by endpoint and status.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from aiohttp import web
+
+from fixtures import HOME, active_order, past_orders_pages, user_payload
+from stub import ACTIVE_PATH, PAST_PATH, REVERSE_PATH, USER_PATH
+
+# (stage, share of the order's lifetime)
+LIFECYCLE = (
+    ("preparing", 0.25),
+    ("picked up", 0.10),
+    ("en route", 0.40),
+    ("arriving", 0.15),
+    ("delivered", 0.10),
+)
+_ROUTE_START = {"picked up": 0.0, "en route": 0.0, "arriving": 0.85, "delivered": 1.0}
+_ROUTE_END = {"picked up": 0.0, "en route": 0.85, "arriving": 1.0, "delivered": 1.0}
+
+
+class StandinConfig:
+    """Lifecycle timing and fault injection."""
+
+    def __init__(
+        self,
+        order_minutes: float = 6.0,
+        idle_minutes: float = 2.0,
+        orders_per_account: int = 1,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        rate_429: float = 0.0,
+        rate_401: float = 0.0,
+        past_orders: int = 60,
+        time_zone: str = "America/New_York",
+        seed: int = 7,
+    ) -> None:
+        self.order_seconds = order_minutes * 60
+        self.idle_seconds = idle_minutes * 60
+        self.orders_per_account = max(1, orders_per_account)
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.rate_429 = rate_429
+        self.rate_401 = rate_401
+        self.past_orders = past_orders
+        self.time_zone = ZoneInfo(time_zone)
+        self.seed = seed
+
+
+class Account:
+    """Scripted order timeline for one sid."""
+
+    def __init__(self, sid: str, index: int, config: StandinConfig, started: float) -> None:
+        self.sid = sid
+        self.index = index
+        self.config = config
+        self.seed = zlib.crc32(sid.encode()) ^ config.seed
+        rng = random.Random(self.seed)
+        self.started = started + rng.uniform(0, config.idle_seconds)  # accounts do not start in lockstep
+        self.stores = [
+            (HOME[0] + rng.uniform(-0.03, 0.03), HOME[1] + rng.uniform(-0.03, 0.03))
+            for _ in range(config.orders_per_account)
+        ]
+        self.past = {}
+        cursor = ""
+        for page in past_orders_pages(config.past_orders, seed=self.seed):
+            self.past[cursor] = json.dumps(page).encode()
+            cursor = page["data"]["orderUuids"][-1] if page["data"]["orderUuids"] else cursor
+        user = user_payload()
+        user["data"]["firstName"] = f"Account {index + 1}"
+        self.user = json.dumps(user).encode()
+
+    def _order_state(self, now: float, slot: int) -> tuple[int, str, float, float] | None:
+        """(cycle, stage, stage progress, time left) for one order slot, or None when idle."""
+        period = self.config.order_seconds + self.config.idle_seconds
+        # Concurrent orders for the same account are spread across the active window
+        offset = slot * self.config.order_seconds / (self.config.orders_per_account + 1)
+        elapsed = now - self.started - offset
+        if elapsed < 0:
+            return None
+        cycle, position = divmod(elapsed, period)
+        if position >= self.config.order_seconds:
+            return None
+        share = position / self.config.order_seconds
+        for stage, length in LIFECYCLE:
+            if share < length:
+                return int(cycle), stage, share / length, self.config.order_seconds - position
+            share -= length
+        return None
+
+    def active_orders(self, now: float) -> bytes:
+        orders = []
+        for slot, store in enumerate(self.stores):
+            state = self._order_state(now, slot)
+            if state is None:
+                continue
+            cycle, stage, progress, remaining = state
+            if stage in _ROUTE_START:
+                share = _ROUTE_START[stage] + (_ROUTE_END[stage] - _ROUTE_START[stage]) * progress
+                courier = (store[0] + (HOME[0] - store[0]) * share, store[1] + (HOME[1] - store[1]) * share)
+            else:
+                courier = store
+            eta = (datetime.now(self.config.time_zone) + timedelta(seconds=remaining)).strftime("%-I:%M %p")
+            rng = random.Random(f"{self.seed}-{slot}-{cycle}")  # stable ids and padding per order
+            orders.append(active_order(rng, stage, slot, store=store, courier=courier, eta=eta))
+        return json.dumps({"status": "success", "data": {"orders": orders}}).encode()
+
+
+class Standin:
+    """aiohttp application state."""
+
+    def __init__(self, config: StandinConfig) -> None:
+        self.config = config
+        self.started = time.time()
+        self.accounts: dict[str, Account] = {}
+        self.counts: Counter[str] = Counter()
+        self.rng = random.Random(config.seed)
+
+    def account(self, request: web.Request) -> Account:
+        sid = request.cookies.get("sid") or "anonymous"
+        account = self.accounts.get(sid)
+        if account is None:
+            account = self.accounts[sid] = Account(sid, len(self.accounts), self.config, self.started)
+        return account
+
+    async def _respond(self, name: str, body: bytes, faults: bool = True) -> web.Response:
+        delay = self.config.latency + self.rng.uniform(0, self.config.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        if faults:
+            roll = self.rng.random()
+            if roll < self.config.rate_401:
+                self.counts[f"{name} 401"] += 1
+                return web.json_response({"error": {"code": "UNAUTHORIZED"}}, status=401)
+            if roll < self.config.rate_401 + self.config.rate_429:
+                self.counts[f"{name} 429"] += 1
+                return web.json_response({"error": {"code": "RATE_LIMITED"}}, status=429, headers={"Retry-After": "5"})
+        self.counts[f"{name} 200"] += 1
+        return web.Response(body=body, content_type="application/json")
+
+    async def active(self, request: web.Request) -> web.Response:
+        return await self._respond("active", self.account(request).active_orders(time.time()))
+
+    async def past(self, request: web.Request) -> web.Response:
+        account = self.account(request)
+        cursor = (await request.json()).get("lastWorkflowUUID") or ""
+        body = account.past.get(cursor) or json.dumps(
+            {"status": "success", "data": {"ordersMap": {}, "meta": {"hasMore": False}}}
+        ).encode()
+        return await self._respond("past", body)
+
+    async def user(self, request: web.Request) -> web.Response:
+        return await self._respond("user", self.account(request).user)
+
+    async def reverse(self, request: web.Request) -> web.Response:
+        lat = float(request.query.get("lat", HOME[0]))
+        lon = float(request.query.get("lon", HOME[1]))
+        block = int(abs(lat * 1000)) % 200 + 1
+        body = json.dumps({
+            "display_name": f"{block} Example St, Lower Manhattan, New York County, New York, United States",
+            "address": {
+                "road": f"{block % 20 + 1} Example St",
+                "suburb": "Manhattan",
+                "quarter": "Lower Manhattan" if lon < HOME[1] else "East Village",
+                "county": "New York County",
+            },
+        }).encode()
+        return await self._respond("reverse", body, faults=False)
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            "accounts": len(self.accounts),
+            "uptime_s": round(time.time() - self.started, 1),
+            "requests": sum(self.counts.values()),
+            "by_endpoint": dict(sorted(self.counts.items())),
+        })
+
+
+def create_app(config: StandinConfig) -> web.Application:
+    standin = Standin(config)
+    app = web.Application()
+    app["standin"] = standin
+    app.router.add_post(ACTIVE_PATH, standin.active)
+    app.router.add_post(PAST_PATH, standin.past)
+    app.router.add_post(USER_PATH, standin.user)
+    app.router.add_get(REVERSE_PATH, standin.reverse)
+    app.router.add_get("/stats", standin.stats)
+    return app
+
+
+async def async_start(config: StandinConfig, host: str = "127.0.0.1", port: int = 0) -> tuple[web.AppRunner, str]:
+    """Start the stand-in; returns the runner and its base URL."""
+    runner = web.AppRunner(create_app(config))
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    return runner, f"http://{host}:{runner.addresses[0][1]}"
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--order-minutes", type=float, default=6.0, help="length of one order, preparing to delivered")
+    parser.add_argument("--idle-minutes", type=float, default=2.0, help="gap between an account's orders")
+    parser.add_argument("--orders-per-account", type=int, default=1, help="concurrent orders per account")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0, help="share of Uber Eats requests answered with 429")
+    parser.add_argument("--rate-401", type=float, default=0.0, help="share of Uber Eats requests answered with 401")
+    parser.add_argument("--past-orders", type=int, default=60)
+
+
+def config_from_args(args: argparse.Namespace) -> StandinConfig:
+    return StandinConfig(
+        order_minutes=args.order_minutes,
+        idle_minutes=args.idle_minutes,
+        orders_per_account=args.orders_per_account,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_429=args.rate_429,
+        rate_401=args.rate_401,
+        past_orders=args.past_orders,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_arguments(parser)
+    args = parser.parse_args()
+    web.run_app(create_app(config_from_args(args)), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
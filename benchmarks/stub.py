@@ -0,0 +1,93 @@
+"""Local aiohttp stub of the Uber Eats and Nominatim endpoints.
+
+Serves pre-encoded fixture bodies so benchmarks exercise the real request,
+decode and parse path without network access.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+
+from aiohttp import web
+
+ACTIVE_PATH = "/api/getActiveOrdersV1"
+PAST_PATH = "/_p/api/getPastOrdersV1"
+USER_PATH = "/_p/api/getUserV1"
+REVERSE_PATH = "/reverse"
+
+REVERSE_RESULT = {
+    "display_name": "1 Example St, Lower Manhattan, New York County, New York, 10007, United States",
+    "address": {
+        "road": "Example St",
+        "suburb": "Manhattan",
+        "quarter": "Lower Manhattan",
+        "county": "New York County",
+    },
+}
+
+
+class StubState:
+    """Bodies served by the stub; replace them between benchmark cases."""
+
+    def __init__(self, active: dict, past_pages: list[dict], user: dict, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.requests = 0
+        self.set_active(active)
+        self.set_past_pages(past_pages)
+        self.user = json.dumps(user).encode()
+        self.reverse = json.dumps(REVERSE_RESULT).encode()
+
+    def set_active(self, payload: dict) -> None:
+        self.active = json.dumps(payload).encode()
+
+    def set_past_pages(self, pages: list[dict]) -> None:
+        """Index pages by the lastWorkflowUUID that requests them."""
+        self.past = {}
+        cursor = ""
+        for page in pages:
+            self.past[cursor] = json.dumps(page).encode()
+            uuids = page["data"]["orderUuids"]
+            if not uuids:
+                break
+            cursor = uuids[-1]
+
+
+def create_app(state: StubState) -> web.Application:
+    async def _respond(body: bytes) -> web.Response:
+        state.requests += 1
+        if state.latency:
+            await asyncio.sleep(state.latency)
+        return web.Response(body=body, content_type="application/json")
+
+    async def active(request: web.Request) -> web.Response:
+        return await _respond(state.active)
+
+    async def past(request: web.Request) -> web.Response:
+        cursor = (await request.json()).get("lastWorkflowUUID") or ""
+        body = state.past.get(cursor)
+        if body is None:
+            body = json.dumps({"status": "success", "data": {"ordersMap": {}, "meta": {"hasMore": False}}}).encode()
+        return await _respond(body)
+
+    async def user(request: web.Request) -> web.Response:
+        return await _respond(state.user)
+
+    async def reverse(request: web.Request) -> web.Response:
+        return await _respond(state.reverse)
+
+    app = web.Application()
+    app.router.add_post(ACTIVE_PATH, active)
+    app.router.add_post(PAST_PATH, past)
+    app.router.add_post(USER_PATH, user)
+    app.router.add_get(REVERSE_PATH, reverse)
+    return app
+
+
+async def async_start(state: StubState, host: str = "127.0.0.1", port: int = 0) -> tuple[web.AppRunner, str]:
+    """Start the stub; returns the runner and its base URL."""
+    runner = web.AppRunner(create_app(state))
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://{host}:{port}"
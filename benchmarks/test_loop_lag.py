@@ -0,0 +1,76 @@
+"""Event-loop lag bound during a large past-orders sync.
+
+Serves a long order history from the stub and runs _sync_past_orders (fetch,
+normalize, store, aggregate) while probing the event loop. The test fails when
+the worst observed lag exceeds MAX_LAG_MS, so a change that moves CPU-bound
+work back onto the loop shows up here. Needs Home Assistant installed:
+
+    python -m pytest benchmarks/test_loop_lag.py
+"""
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import time
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from harness import (  # noqa: E402
+    async_create_hass,
+    async_monitor_loop_lag,
+    create_coordinator,
+    patch_endpoints,
+    summarize,
+)
+
+import stub  # noqa: E402
+from fixtures import active_orders_payload, past_orders_pages, user_payload  # noqa: E402
+
+SYNC_ORDERS = 3000
+PAGE_SIZE = 20
+MAX_LAG_MS = 50.0
+
+
+async def async_run(orders: int = SYNC_ORDERS, page_size: int = PAGE_SIZE) -> dict:
+    """Run a full sync of `orders` past orders; return its timing and loop-lag summary."""
+    lag: list[float] = []
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_create_hass(config_dir)
+        state = stub.StubState(active_orders_payload(()), past_orders_pages(orders, page_size), user_payload())
+        runner, base_url = await stub.async_start(state)
+        try:
+            with patch_endpoints(base_url):
+                coordinator = create_coordinator(hass, "lag")
+                monitor = asyncio.create_task(async_monitor_loop_lag(lag))
+                start = time.perf_counter()
+                await coordinator._sync_past_orders()
+                elapsed = time.perf_counter() - start
+                monitor.cancel()
+                stored = await coordinator._history.async_run(coordinator._history.count, coordinator.entry_id)
+                synced = coordinator.statistics.years
+                await coordinator.async_shutdown()
+        finally:
+            await runner.cleanup()
+            await hass.async_stop(force=True)
+
+    lag_ms = {
+        key.replace("_us", "_ms"): round(value / 1000, 2) if key != "n" else value
+        for key, value in summarize(lag or [0.0]).items()
+    }
+    return {
+        "orders": orders,
+        "stored": stored,
+        "pages": state.requests,
+        "sync_s": round(elapsed, 2),
+        "years": synced,
+        "loop_lag": lag_ms,
+    }
+
+
+def test_full_sync_keeps_event_loop_responsive():
+    result = asyncio.run(async_run())
+    assert result["stored"] == SYNC_ORDERS
+    assert result["years"]
+    assert result["loop_lag"]["max_ms"] < MAX_LAG_MS, result
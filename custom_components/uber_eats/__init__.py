@@ -9,11 +9,13 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import label_registry as lr
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.components import frontend, panel_custom
 from homeassistant.components.http import StaticPathConfig
 
 from .coordinator import UberEatsCoordinator
-from .const import DOMAIN, CONF_SID, CONF_SESSION_ID, CONF_FULL_COOKIE, CONF_ACCOUNT_NAME, CONF_TIME_ZONE
+from .history_store import async_get_history_store
+from .const import DOMAIN, SIGNAL_ACCOUNT_UPDATED, CONF_SID, CONF_SESSION_ID, CONF_FULL_COOKIE, CONF_ACCOUNT_NAME, CONF_TIME_ZONE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -43,6 +45,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Uber Eats from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     
+    coordinator = None
     try:
         coordinator = UberEatsCoordinator(
             hass,
@@ -68,18 +71,44 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
 
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+        # Push coordinator updates to panel subscribers (uber_eats/subscribe)
+        entry.async_on_unload(
+            coordinator.async_add_listener(
+                lambda: async_dispatcher_send(hass, SIGNAL_ACCOUNT_UPDATED, entry.entry_id)
+            )
+        )
+        async_dispatcher_send(hass, SIGNAL_ACCOUNT_UPDATED, entry.entry_id)
         return True
     except ConfigEntryAuthFailed:
+        if coordinator is not None:
+            await coordinator.async_shutdown()
         raise  # Let HA handle reauth flow
     except Exception as e:
         _LOGGER.exception("Failed to setup Uber Eats integration: %s", e)
+        if coordinator is not None:
+            await coordinator.async_shutdown()
         raise ConfigEntryNotReady from e
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    hass.data[DOMAIN].pop(entry.entry_id, None)
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    coordinator = hass.data[DOMAIN].pop(entry.entry_id, None)
+    unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    # Releases the shared HTTP session (closed with the last account) and scheduler slot
+    if coordinator is not None:
+        await coordinator.async_shutdown()
+    async_dispatcher_send(hass, SIGNAL_ACCOUNT_UPDATED, None)
+    return unloaded
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete an account's stored past-order history when the entry is removed."""
+    store = async_get_history_store(hass)
+    try:
+        await hass.async_add_executor_job(store.delete_account, entry.entry_id)
+    except Exception as e:
+        _LOGGER.warning("Failed to delete past order history for %s: %s", entry.title, e)
 
 
 async def async_register_panel(hass: HomeAssistant) -> None:
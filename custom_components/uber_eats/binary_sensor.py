@@ -1,38 +1,87 @@
-from .const import DOMAIN, CONF_ACCOUNT_NAME
-from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.helpers.entity_registry import async_get as async_get_entity_reg
-
-async def async_setup_entry(hass, config_entry, async_add_entities):
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    account_name = config_entry.data[CONF_ACCOUNT_NAME]
-    entities = [UberEatsActiveOrder(coordinator, account_name)]
-    async_add_entities(entities)
-    # Apply label to the binary sensor
-    entity_reg = async_get_entity_reg(hass)
-    label_id = "uber_eats"
-    for entity in entities:
-        entity_id = entity.entity_id
-        if entity_id:
-            entity_reg.async_update_entity(entity_id, labels=[label_id])
-
-class UberEatsActiveOrder(BinarySensorEntity):
-    _attr_translation_key = "active_order"
-    def __init__(self, coordinator, account_name):
-        self.coordinator = coordinator
-        self._account_name = account_name.replace(" ", "_")
-        self._attr_unique_id = f"uber_eats_{self._account_name}_{self.translation_key}"
-
-    @property
-    def available(self):
-        return self.coordinator.last_update_success
-
-    async def async_update(self):
-        await self.coordinator.async_request_refresh()
-
-    @property
-    def name(self):
-        return f"{self._account_name} Uber Eats {self.translation_key.replace('_', ' ').title()}"
-
-    @property
-    def is_on(self):
-        return self.coordinator.data.get("active", False)
\ No newline at end of file
+from .const import DOMAIN, CONF_ACCOUNT_NAME, GEOFENCE_RINGS
+from .geofence import ha_zones
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
+from homeassistant.core import callback
+from homeassistant.helpers.entity_registry import async_get as async_get_entity_reg
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+async def async_setup_entry(hass, config_entry, async_add_entities):
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    account_name = config_entry.data[CONF_ACCOUNT_NAME]
+    entities = [UberEatsActiveOrder(coordinator, account_name)]
+    # One "driver nearby" sensor per geofence ring and per HA zone (zones added later need a reload)
+    zones = [(ring_id, name) for ring_id, name, _ in GEOFENCE_RINGS]
+    zones += [(zone.zone_id, zone.name) for zone in ha_zones(hass)]
+    entities += [UberEatsDriverNearby(coordinator, account_name, zone_id, name) for zone_id, name in zones]
+    async_add_entities(entities)
+    # Apply label to the binary sensor
+    entity_reg = async_get_entity_reg(hass)
+    label_id = "uber_eats"
+    for entity in entities:
+        entity_id = entity.entity_id
+        if entity_id:
+            entity_reg.async_update_entity(entity_id, labels=[label_id])
+
+class UberEatsActiveOrder(CoordinatorEntity, BinarySensorEntity):
+    _attr_translation_key = "active_order"
+    def __init__(self, coordinator, account_name):
+        super().__init__(coordinator)
+        self._account_name = account_name.replace(" ", "_")
+        self._attr_unique_id = f"uber_eats_{self._account_name}_{self.translation_key}"
+        self._attr_is_on = bool((coordinator.data or {}).get("active", False))
+        self._last_available = None
+
+    @property
+    def name(self):
+        return f"{self._account_name} Uber Eats {self.translation_key.replace('_', ' ').title()}"
+
+    @callback
+    def _handle_coordinator_update(self):
+        # Only write state when the active flag or availability actually changed
+        is_on = bool((self.coordinator.data or {}).get("active", False))
+        available = self.available
+        if is_on != self._attr_is_on or available != self._last_available:
+            self._attr_is_on = is_on
+            self._last_available = available
+            self.async_write_ha_state()
+
+
+class UberEatsDriverNearby(CoordinatorEntity, BinarySensorEntity):
+    """On while any of the account's couriers is inside one geofence (see geofence.py)."""
+
+    _attr_device_class = BinarySensorDeviceClass.PRESENCE
+
+    def __init__(self, coordinator, account_name, zone_id, zone_name):
+        super().__init__(coordinator)
+        self._account_name = account_name.replace(" ", "_")
+        self._zone_id = zone_id
+        self._attr_unique_id = f"uber_eats_{self._account_name}_driver_nearby_{zone_id.replace('.', '_')}"
+        self._attr_name = f"{self._account_name} Uber Eats Driver Nearby {zone_name}"
+        self._attr_is_on = False
+        self._attr_extra_state_attributes = {}
+        self._last_available = None
+        self._refresh_state()
+
+    def _refresh_state(self):
+        """Recompute from the coordinator's geofence status; return True if anything changed."""
+        status = ((self.coordinator.data or {}).get("geofence") or {}).get("zones", {}).get(self._zone_id) or {}
+        is_on = bool(status.get("orders"))
+        attrs = {
+            "zone": self._zone_id,
+            "radius_m": status.get("radius_m"),
+            "distance_m": status.get("distance_m"),
+            "orders": list(status.get("orders") or []),
+        }
+        if is_on == self._attr_is_on and attrs == self._attr_extra_state_attributes:
+            return False
+        self._attr_is_on = is_on
+        self._attr_extra_state_attributes = attrs
+        return True
+
+    @callback
+    def _handle_coordinator_update(self):
+        changed = self._refresh_state()
+        available = self.available
+        if changed or available != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
@@ -3,11 +3,12 @@ from __future__ import annotations
 import logging
 from typing import Any, Mapping
 
-import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
 
+from .decode import json_loads
+from .http_client import async_get_http_client
 from .const import (
     DOMAIN,
     CONF_COOKIE,
@@ -124,23 +125,23 @@ def _get_locale_code(tz: str) -> str:
     return "us"
 
 
-async def _fetch_user_profile(full_cookie: str, time_zone: str) -> dict[str, str] | None:
+async def _fetch_user_profile(hass, full_cookie: str, time_zone: str) -> dict[str, str] | None:
     """Fetch user profile from getUserV1 API.
     
     Returns dict with 'first_name' and 'last_name' on success, None on failure.
     """
     try:
-        async with aiohttp.ClientSession() as session:
+        async with async_get_http_client(hass).async_borrow() as session:
             locale_code = _get_locale_code(time_zone)
             url = f"{ENDPOINT_GET_USER}?localeCode={locale_code}"
             headers = HEADERS_TEMPLATE.copy()
             headers["Cookie"] = full_cookie
-            
+        
             async with session.post(url, json={}, headers=headers) as resp:
                 if resp.status != 200:
                     _LOGGER.debug("getUserV1 returned status %s", resp.status)
                     return None
-                data = await resp.json()
+                data = json_loads(await resp.read())
                 user_data = data.get("data", {})
                 if not user_data.get("isLoggedIn"):
                     return None
@@ -156,35 +157,35 @@ async def _fetch_user_profile(full_cookie: str, time_zone: str) -> dict[str, str
 async def _validate_credentials(hass, sid: str, session_id: str, time_zone: str) -> bool:
     """Validate credentials by making test API calls to both endpoints. Returns True if valid."""
     try:
-        async with aiohttp.ClientSession() as session:
+        async with async_get_http_client(hass).async_borrow() as session:
             locale_code = _get_locale_code(time_zone)
             headers = HEADERS_TEMPLATE.copy()
             headers["Cookie"] = f"sid={sid}; uev2.id.session={session_id}"
-            
+        
             # Test 1: getActiveOrdersV1
             url_active = f"{ENDPOINT}?localeCode={locale_code}"
             payload_active = {"orderUuid": None, "timezone": time_zone, "showAppUpsellIllustration": True}
-            
+        
             async with session.post(url_active, json=payload_active, headers=headers) as resp:
                 if resp.status != 200:
                     _LOGGER.debug("getActiveOrdersV1 returned status %s", resp.status)
                     return False
-                data = await resp.json()
+                data = json_loads(await resp.read())
                 if "data" not in data:
                     return False
-            
+        
             # Test 2: getPastOrdersV1
             url_past = f"{ENDPOINT_PAST_ORDERS}?localeCode={locale_code}"
             payload_past = {"lastWorkflowUUID": ""}
-            
+        
             async with session.post(url_past, json=payload_past, headers=headers) as resp:
                 if resp.status != 200:
                     _LOGGER.debug("getPastOrdersV1 returned status %s", resp.status)
                     return False
-                data = await resp.json()
+                data = json_loads(await resp.read())
                 if "data" not in data:
                     return False
-            
+        
             return True
     except Exception as e:
         _LOGGER.debug("Credential validation error: %s", e)
@@ -225,7 +226,7 @@ class UberEatsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         errors["base"] = "invalid_credentials"
                     else:
                         # Fetch user profile to get account name
-                        user_profile = await _fetch_user_profile(cookie_string, ha_tz)
+                        user_profile = await _fetch_user_profile(self.hass, cookie_string, ha_tz)
                         if not user_profile:
                             errors["base"] = "invalid_credentials"
                         else:
@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 DOMAIN = "uber_eats"
 
 # User input field
@@ -40,3 +42,113 @@ HEADERS_TEMPLATE = {
     "Content-Type": "application/json",
     "X-CSRF-Token": "x",
 }
+
+# Shared HTTP client (one pooled session for all accounts, see http_client.py)
+DATA_HTTP_CLIENT = f"{DOMAIN}_http_client"
+HTTP_CONNECTION_LIMIT = 20
+HTTP_CONNECTION_LIMIT_PER_HOST = 4
+HTTP_DNS_CACHE_TTL = 300  # seconds
+HTTP_KEEPALIVE_TIMEOUT = 60  # seconds; longer than the poll interval so sockets survive between cycles
+HTTP_REQUEST_TIMEOUT = 30  # seconds
+
+# Active orders are parsed concurrently (each may wait on a reverse geocode)
+MAX_CONCURRENT_ORDER_PARSE = 3
+
+# Reverse-geocode cache (see geocode.py)
+NOMINATIM_REVERSE_URL = "https://nominatim.openstreetmap.org/reverse"
+DATA_GEOCODE_CACHE = f"{DOMAIN}_geocode_cache"
+GEOCODE_CACHE_STORAGE_KEY = f"{DOMAIN}.geocode_cache"
+GEOCODE_CACHE_STORAGE_VERSION = 1
+GEOCODE_CACHE_PRECISION = 8  # geohash length; ~38 m x 19 m cells
+GEOCODE_CACHE_TTL = 7 * 24 * 3600  # seconds
+GEOCODE_CACHE_MAX_ENTRIES = 2048
+GEOCODE_CACHE_MAX_PERMANENT = 512  # store/home lookups
+GEOCODE_CACHE_SAVE_DELAY = 60  # seconds
+
+# User profile (getUserV1) is refreshed on its own TTL, not every poll
+PROFILE_REFRESH_INTERVAL = timedelta(hours=6)
+PROFILE_RETRY_INTERVAL = timedelta(minutes=5)
+
+# Adaptive polling (see polling.py); min/max bounds are user-configurable
+CONF_POLL_INTERVAL_MIN = "poll_interval_min"
+CONF_POLL_INTERVAL_MAX = "poll_interval_max"
+DEFAULT_POLL_INTERVAL_MIN = 5  # seconds
+DEFAULT_POLL_INTERVAL_MAX = 300  # seconds
+POLL_INTERVAL_IDLE_BASE = 30  # seconds; doubles each idle cycle up to max
+POLL_INTERVAL_PREPARING = 30  # seconds
+POLL_INTERVAL_EN_ROUTE = 15  # seconds
+POLL_NEAR_DISTANCE_FEET = 2640  # half a mile; poll at the minimum interval inside this
+
+# Integration-wide poll scheduler (see scheduler.py)
+DATA_POLL_SCHEDULER = f"{DOMAIN}_poll_scheduler"
+GLOBAL_REQUESTS_PER_MINUTE = 60  # Uber Eats requests across all accounts
+GLOBAL_REQUEST_BURST = 10
+POLL_JITTER_RATIO = 0.1  # +/-10% of the interval
+POLL_STAGGER_MAX_SHIFT = 0.25  # max per-cycle shift toward an account's phase slot
+
+# Past orders: incremental sync, with a periodic full crawl to catch cancellations
+PAST_ORDERS_FULL_SYNC_INTERVAL = timedelta(hours=24)
+PAST_ORDERS_KNOWN_UUIDS_LIMIT = 200  # most recent stored uuids used to stop incremental paging
+# Opening the panel only triggers a past-orders sync when the last one is older than this
+CONF_PAST_ORDERS_FRESHNESS = "past_orders_freshness_minutes"
+DEFAULT_PAST_ORDERS_FRESHNESS = 15  # minutes
+
+# Past-order history database (see history_store.py), stored under .storage
+DATA_HISTORY_STORE = f"{DOMAIN}_history_store"
+HISTORY_DB_FILENAME = "uber_eats_history.db"
+
+# Dispatcher signal sent with an entry_id (or None) whenever account data changes
+SIGNAL_ACCOUNT_UPDATED = f"{DOMAIN}_account_updated"
+# Dispatcher signal sent with an entry_id after every cycle or background job
+# that recorded metrics, including polls whose data did not change
+SIGNAL_METRICS_UPDATED = f"{DOMAIN}_metrics_updated"
+
+# Past orders websocket paging
+PAST_ORDERS_PAGE_SIZE = 24
+PAST_ORDERS_MAX_PAGE_SIZE = 100
+
+# Poll-cycle instrumentation (see metrics.py)
+METRICS_WINDOW = 120  # most recent samples kept per stage histogram
+
+# Courier trajectories (see trajectory.py): fixed memory per account
+TRAJECTORY_MAX_POINTS = 720  # per order; ring buffer drops the oldest beyond this
+TRAJECTORY_MAX_ORDERS = 5  # tracked orders per account; least recently updated evicted
+TRAJECTORY_MIN_DISTANCE_M = 15  # skip positions closer than this to the last kept point
+TRAJECTORY_MAX_INTERVAL = 60  # seconds; keep a point after this long even if stationary
+
+# Kinematic ETA from the courier trajectory (see eta.py)
+ETA_ROUTE_FACTOR = 1.3  # road distance per metre of straight line
+ETA_SPEED_HALF_LIFE = 120  # seconds; weight of older track segments halves after this
+ETA_MIN_SPEED_MPS = 1.5  # floor so a stopped courier does not push arrival to infinity
+ETA_CONFIDENCE_Z = 1.28  # band of about 80% of segment speeds
+ETA_MIN_SPREAD = 0.15  # band is at least +/-15% of the speed
+ETA_MIN_SEGMENTS = 2  # track segments since pickup before estimating
+ETA_SAMPLE_INTERVAL = 60  # seconds between predictions kept for the accuracy report
+ETA_ACCURACY_WINDOW = 50  # delivered orders in the accuracy report
+ETA_MISSING_CYCLES = 3  # polls an order must be gone before it is scored as delivered
+
+# Geofences around the courier (see geofence.py): rings around the delivery
+# point plus Home Assistant zone.* entities. The "nearby" ring's radius is the
+# driver-nearby distance option; it also triggers the driver-nearby automation.
+GEOFENCE_NEARBY = "nearby"
+GEOFENCE_RINGS = (  # (id, name, radius in feet; None for the option)
+    (GEOFENCE_NEARBY, "Nearby", None),
+    ("quarter_mile", "Quarter Mile", 1320),
+    ("half_mile", "Half Mile", 2640),
+)
+GEOFENCE_HYSTERESIS_FEET = 50  # exit only this far past the radius...
+GEOFENCE_HYSTERESIS_RATIO = 0.1  # ...or this fraction of it, for large zones
+GEOFENCE_REFINE_MARGIN_M = 10  # re-check with haversine when this close to a boundary
+EVENT_GEOFENCE = f"{DOMAIN}_geofence"
+
+# Bus event fired once per typed order event (see order_events.py)
+EVENT_ORDER = f"{DOMAIN}_order_event"
+
+# Announcement queue per media player (see tts_queue.py)
+DATA_TTS_QUEUE = f"{DOMAIN}_tts_queue"
+TTS_COALESCE_WINDOW = 2.0  # seconds; announcements arriving within this are spoken together
+TTS_MAX_MERGED = 3  # announcements per utterance
+TTS_IDLE_TIMEOUT = 180  # seconds to wait for a playing speaker before talking anyway
+TTS_SETTLE_DELAY = 1.0  # seconds after tts.speak before checking the player again
+TTS_MAX_CONCURRENT_PLAYERS = 3  # players being sent volume_set/tts.speak at once
+TTS_INTERVAL_MAX_AGE = 120  # seconds; a queued interval update older than this is dropped
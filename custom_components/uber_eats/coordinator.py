@@ -1,15 +1,35 @@
-import aiohttp
 import asyncio
-import json
+import functools
+import hashlib
 import logging
 import os
+import time
 from datetime import datetime, timedelta
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.util import dt as dt_util
 
+from .decode import json_dumps_canonical, json_loads
+from .eta import EtaTracker
+from .geo import FEET_PER_M
+from .geocode import async_get_geocode_cache
+from .geofence import GeofenceEngine, ha_zones, ring_zones
+from .history_store import async_get_history_store
+from .http_client import async_get_http_client
+from .metrics import CycleMetrics
+from .models import ParsedOrder, has_driver_name
+from .order_events import DRIVER_ASSIGNED, DRIVER_NEARBY, NEW_ORDER, STATUS_CHANGED, diff_orders
+from .past_orders import parse_page as parse_past_orders_page
+from .polling import clamp_poll_bounds, compute_poll_interval
+from .scheduler import PRIORITY_BACKGROUND, async_get_poll_scheduler
+from .statistics import OrderStatistics
+from .trajectory import TrajectoryStore
+from .tts_queue import async_get_tts_queue
 from .const import (
     ENDPOINT,
+    SIGNAL_METRICS_UPDATED,
     ENDPOINT_PAST_ORDERS,
     ENDPOINT_GET_USER,
     HEADERS_TEMPLATE,
@@ -32,17 +52,31 @@ from .const import (
     DEFAULT_DRIVER_NEARBY_DISTANCE_FEET,
     DEFAULT_TTS_VOLUME,
     DEFAULT_TTS_INTERVAL_MINUTES,
+    MAX_CONCURRENT_ORDER_PARSE,
+    PROFILE_REFRESH_INTERVAL,
+    PROFILE_RETRY_INTERVAL,
+    PAST_ORDERS_FULL_SYNC_INTERVAL,
+    PAST_ORDERS_KNOWN_UUIDS_LIMIT,
+    CONF_PAST_ORDERS_FRESHNESS,
+    CONF_POLL_INTERVAL_MIN,
+    CONF_POLL_INTERVAL_MAX,
+    DEFAULT_PAST_ORDERS_FRESHNESS,
+    DEFAULT_POLL_INTERVAL_MIN,
+    DEFAULT_POLL_INTERVAL_MAX,
+    EVENT_GEOFENCE,
+    EVENT_ORDER,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def _no_driver(driver_name):
-    return driver_name in ("No Driver Assigned", "Unknown", None, "")
+def _fingerprint(raw: bytes) -> bytes:
+    """Short content hash used to detect unchanged responses and orders."""
+    return hashlib.blake2b(raw, digest_size=16).digest()
 
 
-def _has_driver(driver_name):
-    return not _no_driver(driver_name)
+def _empty_profile():
+    return {"picture_url": None, "first_name": "", "last_name": "", "country_code": "US"}
 
 
 class UberEatsCoordinator(DataUpdateCoordinator):
@@ -55,51 +89,118 @@ class UberEatsCoordinator(DataUpdateCoordinator):
         self.full_cookie = full_cookie  # Full cookie for APIs that need it
         self.hass = hass
         self._order_history = []  # Per-account history
-        self._previous_data = None  # Set on first update
+        self._previous_orders = None  # order uuid -> parsed order of the last cycle (None before the first)
+        self._body_fingerprint = None  # Hash of the last processed getActiveOrdersV1 body
+        self._last_parsed_orders = None  # Parsed orders for that body
+        self._unparsed_order_ids = set()  # uuids in that body whose parse failed
+        self._order_fingerprints = {}  # order uuid -> (hash of raw order, parsed order)
         self._last_interval_tts_time = None  # For interval TTS when driver assigned
-        self._driver_nearby_triggered_orders = set()  # Track which order UUIDs have triggered nearby action
         self._cached_user_profile = None  # Cached user profile from getUserV1
-        self._cached_past_orders = None  # In-memory cache of past orders data
-        self._past_orders_cache_loaded = False  # Track if cache has been loaded from disk
+        self._profile_fetched_at = None  # Monotonic time of last successful profile fetch
+        self._profile_refresh_task = None  # In-flight background profile refresh
+        self._idle_cycles = 0  # Consecutive polls without an active order (adaptive polling)
+        self._cached_past_orders = None  # Summary of stored past orders (statistics, sync times)
+        self._past_orders_cache_loaded = False  # Track if the summary has been loaded from the store
+        self._past_orders_load_lock = asyncio.Lock()  # Single load of the summary and statistics
+        self._past_orders_refresh_task = None  # Single in-flight past-orders sync
+        self.statistics = OrderStatistics(dt_util.get_time_zone(time_zone))  # Running past-order aggregates
+        self._http = async_get_http_client(hass)  # Shared pooled session (see http_client.py)
+        self._http.async_acquire(entry_id)
+        self._geocoder = async_get_geocode_cache(hass)  # Shared reverse-geocode cache (see geocode.py)
+        self._scheduler = async_get_poll_scheduler(hass)  # Stagger + global request budget (see scheduler.py)
+        self._scheduler.async_register(entry_id)
+        self._history = async_get_history_store(hass)  # SQLite past-order history (see history_store.py)
+        self._tts_queue = async_get_tts_queue(hass)  # Per-player announcement queue (see tts_queue.py)
+        self.metrics = CycleMetrics()  # Per-stage cycle timing (see metrics.py)
+        self.trajectories = TrajectoryStore()  # Courier track per active order (see trajectory.py)
+        self.eta = EtaTracker()  # Kinematic arrival estimates and their accuracy (see eta.py)
+        self.geofence = GeofenceEngine()  # Courier zone membership (see geofence.py)
         super().__init__(
             hass,
             _LOGGER,
             name=f"Uber Eats Orders - {account_name}",
             update_interval=timedelta(seconds=15),
+            # Skip listener fan-out when a poll returns identical data
+            always_update=False,
         )
 
     async def _async_update_data(self):
-        # Systematically poll user profile on every update to detect changes
+        with self.metrics.time("cycle"):
+            data = await self._async_fetch_active_orders()
+        self._scheduler.async_set_active(self.entry_id, bool((data or {}).get("orders")))
+        # Pick the next poll interval from the order lifecycle (see polling.py),
+        # then stagger/jitter it against the other accounts (see scheduler.py)
+        self.update_interval = self._scheduler.next_interval(self.entry_id, self._next_poll_interval(data))
+        self._async_publish_metrics()
+        return data
+
+    async def async_shutdown(self):
+        """Stop polling and release integration-wide resources held by this account."""
+        await super().async_shutdown()
+        if self.past_orders_refreshing:
+            self._past_orders_refresh_task.cancel()
+        self._scheduler.async_unregister(self.entry_id)
+        self._tts_queue.async_cancel(self.entry_id)
+        await self._http.async_release(self.entry_id)
+
+    @callback
+    def _async_publish_metrics(self):
+        """Let the diagnostic metrics sensors re-read the histograms."""
+        async_dispatcher_send(self.hass, SIGNAL_METRICS_UPDATED, self.entry_id)
+
+    @callback
+    def async_update_listeners(self):
+        """Notify entities and subscribers, timing the fan-out."""
+        with self.metrics.time("fanout"):
+            super().async_update_listeners()
+
+    def _next_poll_interval(self, data):
+        """Return the adaptive poll interval for the state just fetched."""
+        options = self._options()
+        min_s, max_s = clamp_poll_bounds(
+            options.get(CONF_POLL_INTERVAL_MIN, DEFAULT_POLL_INTERVAL_MIN),
+            options.get(CONF_POLL_INTERVAL_MAX, DEFAULT_POLL_INTERVAL_MAX),
+        )
+        orders = (data or {}).get("orders") or []
+        if orders:
+            self._idle_cycles = 0
+        else:
+            self._idle_cycles += 1
+
+        # Closest courier to its delivery point, from the geofence pass
+        nearest_m = ((data or {}).get("geofence") or {}).get("nearest_m")
+        nearest = nearest_m * FEET_PER_M if nearest_m is not None else None
+
+        return compute_poll_interval(
+            [order.order_stage for order in orders],
+            nearest,
+            max(0, self._idle_cycles - 1),
+            min_s,
+            max_s,
+        )
+
+    async def _async_fetch_active_orders(self):
+        # Profile changes are rare; refresh it on its own TTL in the background
+        # so the active-orders poll never waits on getUserV1
+        self.async_schedule_profile_refresh()
+
+        session = self._http.session
+        locale_code = self._get_locale_code(self.time_zone)
+        url = f"{ENDPOINT}?localeCode={locale_code}"
+        headers = HEADERS_TEMPLATE.copy()
+        headers["Cookie"] = f"sid={self.sid}; uev2.id.session={self.session_id}"
+        payload = {"orderUuid": None, "timezone": self.time_zone, "showAppUpsellIllustration": True}
         try:
-            profile = await self.fetch_user_profile()
-            old_profile = self._cached_user_profile or {}
-            self._cached_user_profile = profile
-            
-            # Check if name has changed and update account_name
-            new_first = profile.get("first_name", "")
-            new_last = profile.get("last_name", "")
-            if new_first or new_last:
-                new_name = f"{new_first} {new_last}".strip()
-                if new_name and new_name != self.account_name:
-                    _LOGGER.info("User profile name changed from '%s' to '%s'", self.account_name, new_name)
-                    self.account_name = new_name
-        except Exception as e:
-            _LOGGER.debug("Failed to fetch user profile: %s", e)
-            if self._cached_user_profile is None:
-                self._cached_user_profile = {"picture_url": None, "first_name": "", "last_name": ""}
-
-        async with aiohttp.ClientSession() as session:
-            locale_code = self._get_locale_code(self.time_zone)
-            url = f"{ENDPOINT}?localeCode={locale_code}"
-            headers = HEADERS_TEMPLATE.copy()
-            headers["Cookie"] = f"sid={self.sid}; uev2.id.session={self.session_id}"
-            payload = {"orderUuid": None, "timezone": self.time_zone, "showAppUpsellIllustration": True}
-            try:
+            with self.metrics.time("queue"):
+                await self._scheduler.async_acquire(self._scheduler.priority_for(self.entry_id))
+            with self.metrics.time("request"):
                 async with session.post(url, json=payload, headers=headers) as resp:
                     _LOGGER.debug("API response status: %s", resp.status)
                     
                     # Detect authentication failure (401/403)
                     if resp.status in (401, 403):
+                        self._profile_fetched_at = None  # Re-read profile once auth is restored
+                        self.metrics.record_error("auth")
                         raise ConfigEntryAuthFailed(
                             "Session expired. Please reconfigure with new cookies."
                         )
@@ -109,95 +210,139 @@ class UberEatsCoordinator(DataUpdateCoordinator):
                             "API returned status %s - may indicate auth issue",
                             resp.status
                         )
+                        self.metrics.record_error(f"http_{resp.status}")
                         return self._default_data()
 
-                    data = await resp.json()
-                    
-                    # Check for auth errors in response body
-                    if "error" in data:
-                        error_code = data.get("error", {}).get("code", "")
-                        if error_code in ("UNAUTHORIZED", "SESSION_EXPIRED", "INVALID_TOKEN"):
-                            raise ConfigEntryAuthFailed(
-                                f"Authentication error: {error_code}"
-                            )
-                    
-                    raw_orders = data.get("data", {}).get("orders", [])
-                    current_data = self._default_data()
-
-                    # Parse ALL orders into an array for multi-order support
-                    parsed_orders = []
-                    for order in raw_orders:
-                        parsed_order = await self._parse_single_order(order, session)
-                        if parsed_order:
-                            parsed_orders.append(parsed_order)
-
-                    # Store orders array and count
-                    current_data["orders"] = parsed_orders
-                    current_data["orders_count"] = len(parsed_orders)
-
-                    if parsed_orders:
-                        # Use first order for flat fields (backward compatibility)
-                        first = parsed_orders[0]
-                        current_data.update({
-                            "active": True,
-                            "order_stage": first.get("order_stage", "No Active Order"),
-                            "order_status": first.get("order_status", "No Active Order"),
-                            "driver_name": first.get("driver_name", "No Driver Assigned"),
-
-                            "driver_eta_str": first.get("driver_eta_str", "No ETA Available"),
-                            "driver_eta": first.get("driver_eta"),
-
-                            "driver_location_lat": first.get("driver_location_lat", "No Active Order"),
-                            "driver_location_lon": first.get("driver_location_lon", "No Active Order"),
-
-                            "driver_location_street": first.get("driver_location_street", "No Driver Assigned"),
-                            "driver_location_suburb": first.get("driver_location_suburb", "No Driver Assigned"),
-                            "driver_location_quarter": first.get("driver_location_quarter", "No Driver Assigned"),
-                            "driver_location_county": first.get("driver_location_county", "No Driver Assigned"),
-                            "driver_location_address": first.get("driver_location_address", "No Driver Assigned"),
-
-                            "map_url": first.get("map_url", "No Map Available"),
-                            "minutes_remaining": first.get("minutes_remaining"),
-
-                            "restaurant_name": first.get("restaurant_name", "Unknown"),
-                            "order_id": first.get("order_id", "Unknown"),
-                            "order_status_description": first.get("order_status_description", "No Active Order"),
-                            "latest_arrival": first.get("latest_arrival", "No Latest Arrival"),
-
-                            "user_picture_url": first.get("user_picture_url") or (self._cached_user_profile or {}).get("picture_url"),
-                            "driver_picture_url": first.get("driver_picture_url"),
-                            "driver_phone_formatted": first.get("driver_phone_formatted", ""),
-                            "home_location": first.get("home_location", {"lat": self.hass.config.latitude or 0, "lon": self.hass.config.longitude or 0}),
-                            "store_location": first.get("store_location"),
-                            "driver_location_coords": first.get("driver_location_coords"),
-                            # User profile info for sensor names and display
-                            "user_first_name": (self._cached_user_profile or {}).get("first_name", ""),
-                            "user_last_name": (self._cached_user_profile or {}).get("last_name", ""),
-                        })
-
-                        # optional history (kept as you had)
-                        self._order_history.append({
-                            "timestamp": dt_util.now().isoformat(),
-                            "restaurant_name": current_data["restaurant_name"],
-                            "order_status": current_data["order_status"],
-                            "driver_name": current_data["driver_name"],
-                            "driver_eta": current_data["driver_eta_str"],
-                            "order_stage": current_data["order_stage"],
-                        })
-                        if len(self._order_history) > 10:
-                            self._order_history = self._order_history[-10:]
-
-                    # TTS event detection and announcements (before updating previous)
-                    self._process_tts_events(current_data)
-                    self._previous_data = dict(current_data) if current_data else self._default_data()
-
-                    return current_data
-
-            except ConfigEntryAuthFailed:
-                raise  # Re-raise auth failures for HA to handle
-            except Exception as err:
-                _LOGGER.error("Error fetching data: %s", err, exc_info=True)
-                return self._default_data()
+                    body = await resp.read()
+            self.metrics.payload_bytes.add(len(body))
+
+            body_fingerprint = _fingerprint(body)
+            if body_fingerprint == self._body_fingerprint and self._last_parsed_orders is not None:
+                # Byte-identical to the last poll: skip decoding, parsing and geocoding;
+                # only the time-derived fields (ETA, minutes remaining) can have moved
+                _LOGGER.debug("Active orders unchanged for %s, reusing parsed result", self.account_name)
+                self.metrics.unchanged_bodies += 1
+                parsed_orders = [self._refresh_time_fields(o) for o in self._last_parsed_orders]
+            else:
+                with self.metrics.time("decode"):
+                    data = json_loads(body)
+                
+                # Check for auth errors in response body
+                if "error" in data:
+                    error_code = data.get("error", {}).get("code", "")
+                    if error_code in ("UNAUTHORIZED", "SESSION_EXPIRED", "INVALID_TOKEN"):
+                        self.metrics.record_error("auth")
+                        raise ConfigEntryAuthFailed(
+                            f"Authentication error: {error_code}"
+                        )
+                
+                raw_orders = data.get("data", {}).get("orders", [])
+
+                # Parse ALL orders into an array for multi-order support
+                with self.metrics.time("parse"):
+                    parsed_orders = await self._parse_orders(raw_orders)
+                self._body_fingerprint = body_fingerprint
+                self._last_parsed_orders = parsed_orders
+                self._unparsed_order_ids = {
+                    order.get("uuid") for order in raw_orders if order and order.get("uuid")
+                } - {order.order_id for order in parsed_orders}
+
+            now = time.time()
+            self.trajectories.update(parsed_orders, now)
+            estimates = self.eta.update(
+                parsed_orders, self.trajectories, self._home_coords(), now, self._unparsed_order_ids
+            )
+            geofence_events, geofence = self.geofence.update(parsed_orders, self._geofence_zones())
+            if self._previous_orders is None:
+                # First cycle after a (re)start: seed zone membership without announcing it
+                geofence_events = []
+            current_data = self._build_current_data(parsed_orders, estimates, geofence)
+
+            if parsed_orders:
+                # optional history: record only when something changed, so quiet
+                # polls leave the history (and the history sensor) untouched
+                entry = {
+                    "restaurant_name": current_data["restaurant_name"],
+                    "order_status": current_data["order_status"],
+                    "driver_name": current_data["driver_name"],
+                    "driver_eta": current_data["driver_eta_str"],
+                    "order_stage": current_data["order_stage"],
+                }
+                last = self._order_history[-1] if self._order_history else None
+                if last is None or any(last.get(k) != v for k, v in entry.items()):
+                    self._order_history.append({"timestamp": dt_util.now().isoformat(), **entry})
+                if len(self._order_history) > 10:
+                    self._order_history = self._order_history[-10:]
+
+            # One keyed diff per cycle; its events feed TTS, automations and the bus
+            order_events = diff_orders(self._previous_orders, parsed_orders, geofence_events)
+            self._previous_orders = {order.order_id: order for order in parsed_orders if order.order_id}
+            with self.metrics.time("tts"):
+                self._dispatch_order_events(order_events, current_data)
+            self._process_geofence_events(geofence_events)
+
+            return current_data
+
+        except ConfigEntryAuthFailed:
+            raise  # Re-raise auth failures for HA to handle
+        except Exception as err:
+            _LOGGER.error("Error fetching data: %s", err, exc_info=True)
+            self.metrics.record_error(type(err).__name__)
+            return self._default_data()
+
+    def _build_current_data(self, parsed_orders, estimates=None, geofence=None):
+        """Build coordinator data from parsed orders (first order fills the flat fields)."""
+        current_data = self._default_data()
+
+        # Store orders array and count
+        current_data["orders"] = parsed_orders
+        current_data["orders_count"] = len(parsed_orders)
+        # Kinematic arrival estimates by order id (see eta.py)
+        current_data["eta_estimates"] = estimates or {}
+        # Per-zone courier status and nearest distance to home (see geofence.py)
+        current_data["geofence"] = geofence or {}
+
+        if parsed_orders:
+            # Use first order for flat fields (backward compatibility)
+            current_data.update(parsed_orders[0].as_dict())
+            current_data.update({
+                "active": True,
+                "user_picture_url": current_data["user_picture_url"] or (self._cached_user_profile or {}).get("picture_url"),
+                "home_location": current_data["home_location"] or {"lat": self.hass.config.latitude or 0, "lon": self.hass.config.longitude or 0},
+                # User profile info for sensor names and display
+                "user_first_name": (self._cached_user_profile or {}).get("first_name", ""),
+                "user_last_name": (self._cached_user_profile or {}).get("last_name", ""),
+            })
+            first = current_data["eta_estimates"].get(parsed_orders[0].order_id)
+            if first is not None:
+                current_data["estimated_eta_str"] = self._format_eta(first.arrival)
+                current_data["estimated_minutes_remaining"] = first.minutes_remaining(time.time())
+        return current_data
+
+    def _options(self):
+        entry = self.hass.config_entries.async_get_entry(self.entry_id)
+        return (entry.options if entry else None) or {}
+
+    def _geofence_zones(self):
+        """Rings around the delivery point plus the HA zones."""
+        options = self._options()
+        nearby_feet = max(50, min(2000, int(options.get(CONF_DRIVER_NEARBY_DISTANCE_FEET, DEFAULT_DRIVER_NEARBY_DISTANCE_FEET))))
+        return ring_zones(nearby_feet) + ha_zones(self.hass)
+
+    def _home_coords(self):
+        return (self.hass.config.latitude or 0.0, self.hass.config.longitude or 0.0)
+
+    @staticmethod
+    def _format_eta(ts):
+        """Unix time as local "h:mm AM", like Uber's ETA title."""
+        return dt_util.as_local(dt_util.utc_from_timestamp(ts)).strftime("%I:%M %p").lstrip("0")
+
+    def _refresh_time_fields(self, parsed):
+        """Copy of a parsed order with ETA-derived fields recomputed for now."""
+        return parsed.with_eta(
+            self._parse_eta_timestamp(parsed.driver_eta_str),
+            self._calculate_minutes(parsed.driver_eta_str),
+        )
 
     def _get_map_entities(self, background_feed_cards):
         """Extract EATER (home), STORE (restaurant), COURIER (driver) from mapEntity."""
@@ -212,8 +357,51 @@ class UberEatsCoordinator(DataUpdateCoordinator):
                 out[t] = {"lat": float(lat), "lon": float(lon)}
         return out
 
-    async def _parse_single_order(self, order, session):
-        """Parse a single order object into a normalized dict."""
+    async def _parse_orders(self, raw_orders):
+        """Parse raw orders concurrently (bounded), keeping API order.
+
+        Each order may wait on a reverse geocode round-trip, so orders are parsed
+        side by side instead of paying those latencies one after another. An
+        order whose raw document is unchanged since the last poll is reused
+        (with fresh ETA fields) instead of being parsed again. A failure in one
+        order is logged and dropped without losing the others.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ORDER_PARSE)
+        fingerprints = [
+            _fingerprint(json_dumps_canonical(order))
+            for order in raw_orders
+        ]
+
+        async def _parse(order, fingerprint):
+            cached = self._order_fingerprints.get((order or {}).get("uuid"))
+            if cached is not None and cached[0] == fingerprint:
+                return self._refresh_time_fields(cached[1])
+            async with semaphore:
+                return await self._parse_single_order(order)
+
+        results = await asyncio.gather(
+            *(_parse(order, fingerprint) for order, fingerprint in zip(raw_orders, fingerprints)),
+            return_exceptions=True,
+        )
+        parsed_orders = []
+        order_fingerprints = {}
+        for order, fingerprint, result in zip(raw_orders, fingerprints, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                _LOGGER.warning("Failed to parse order %s: %s", (order or {}).get("uuid", "unknown"), result)
+                self.metrics.record_error("parse")
+                continue
+            if result:
+                parsed_orders.append(result)
+                if result.order_id:
+                    order_fingerprints[result.order_id] = (fingerprint, result)
+        # Only orders still active are kept
+        self._order_fingerprints = order_fingerprints
+        return parsed_orders
+
+    async def _parse_single_order(self, order):
+        """Parse a single getActiveOrdersV1 order object into a ParsedOrder (see models.py)."""
         feed_cards = order.get("feedCards", [])
         contacts = order.get("contacts", [])
         active_overview = order.get("activeOrderOverview", {})
@@ -237,22 +425,23 @@ class UberEatsCoordinator(DataUpdateCoordinator):
 
         # Reverse geocode remaining components (or use defaults)
         if lat and lon:
-            loc = await self._reverse_geocode(lat, lon, session)
+            # Without a courier the point is the fixed store/home location
+            loc = await self._reverse_geocode(lat, lon, permanent=not courier)
         else:
             loc = {}
 
-        map_url = self._get_map_url(lat, lon) if lat and lon else "No Map Available"
-        driver_eta_title = feed_cards[0].get("status", {}).get("title", "Unknown") if feed_cards else "Unknown"
+        map_url = self._get_map_url(lat, lon) if lat and lon else None
+        status_obj = feed_cards[0].get("status", {}) if feed_cards else {}
+        driver_eta_title = status_obj.get("title") or None
 
         # Full timeline text
-        status_obj = feed_cards[0].get("status", {}) if feed_cards else {}
         timeline_summary = status_obj.get("timelineSummary", "") or ""
         if isinstance(timeline_summary, dict):
             timeline_summary = timeline_summary.get("text", "") or ""
         if not timeline_summary or timeline_summary.strip() == "":
             title_summary = status_obj.get("titleSummary", {}).get("summary", {})
             timeline_summary = title_summary.get("text", "") or ""
-        order_status_text = (timeline_summary or "Unknown").strip() or "Unknown"
+        order_status_text = (timeline_summary or "").strip() or None
 
         # Driver picture and phone
         driver_picture_url = None
@@ -261,7 +450,7 @@ class UberEatsCoordinator(DataUpdateCoordinator):
                 driver_picture_url = fc["courier"][0].get("iconUrl") or None
                 break
         courier_contact = next((c for c in contacts if c.get("type") == "COURIER"), contacts[0] if contacts else {})
-        driver_phone_formatted = courier_contact.get("formattedPhoneNumber") or courier_contact.get("phoneNumber") or ""
+        driver_phone = courier_contact.get("formattedPhoneNumber") or courier_contact.get("phoneNumber") or None
 
         # User (customer) picture
         user_picture_url = None
@@ -269,32 +458,31 @@ class UberEatsCoordinator(DataUpdateCoordinator):
         if customer_infos:
             user_picture_url = customer_infos[0].get("pictureUrl") or None
 
-        return {
-            "order_id": order.get("uuid", "Unknown"),
-            "order_stage": self._parse_stage(feed_cards),
-            "order_status": order_status_text,
-            "order_status_description": order_status_text,
-            "restaurant_name": active_overview.get("title", "Unknown"),
-            "driver_name": contacts[0].get("title", "Unknown") if contacts else "Unknown",
-            "driver_eta_str": driver_eta_title,
-            "driver_eta": self._parse_eta_timestamp(driver_eta_title),
-            "minutes_remaining": self._calculate_minutes(driver_eta_title),
-            "driver_location_lat": lat if lat else "No Active Order",
-            "driver_location_lon": lon if lon else "No Active Order",
-            "driver_location_street": loc.get("road", "No Driver Assigned"),
-            "driver_location_suburb": loc.get("suburb", "No Driver Assigned"),
-            "driver_location_quarter": loc.get("quarter", "No Driver Assigned"),
-            "driver_location_county": loc.get("county", "No Driver Assigned"),
-            "driver_location_address": loc.get("address", "No Driver Assigned"),
-            "map_url": map_url,
-            "latest_arrival": feed_cards[0].get("status", {}).get("statusSummary", {}).get("text", "Unknown") if feed_cards else "Unknown",
-            "user_picture_url": user_picture_url or (self._cached_user_profile or {}).get("picture_url"),
-            "driver_picture_url": driver_picture_url,
-            "driver_phone_formatted": driver_phone_formatted,
-            "home_location": eater if eater else {"lat": self.hass.config.latitude or 0, "lon": self.hass.config.longitude or 0},
-            "store_location": store if store else None,
-            "driver_location_coords": courier if courier else None,
-        }
+        return ParsedOrder(
+            order_id=order.get("uuid") or None,
+            order_stage=self._parse_stage(feed_cards),
+            order_status=order_status_text,
+            restaurant_name=active_overview.get("title") or None,
+            driver_name=(contacts[0].get("title") or None) if contacts else None,
+            driver_eta_str=driver_eta_title,
+            driver_eta=self._parse_eta_timestamp(driver_eta_title),
+            minutes_remaining=self._calculate_minutes(driver_eta_title),
+            latitude=lat if lat else None,
+            longitude=lon if lon else None,
+            street=loc.get("road"),
+            suburb=loc.get("suburb"),
+            quarter=loc.get("quarter"),
+            county=loc.get("county"),
+            address=loc.get("address"),
+            map_url=map_url,
+            latest_arrival=status_obj.get("statusSummary", {}).get("text") or None,
+            user_picture_url=user_picture_url or (self._cached_user_profile or {}).get("picture_url"),
+            driver_picture_url=driver_picture_url,
+            driver_phone=driver_phone,
+            home_location=eater if eater else {"lat": self.hass.config.latitude or 0, "lon": self.hass.config.longitude or 0},
+            store_location=store if store else None,
+            driver_location=courier if courier else None,
+        )
 
     def _default_data(self):
         home_lat = self.hass.config.latitude or 0.0
@@ -321,6 +509,10 @@ class UberEatsCoordinator(DataUpdateCoordinator):
 
             "map_url": "No Map Available",
             "minutes_remaining": None,
+            "eta_estimates": {},
+            "geofence": {},
+            "estimated_eta_str": None,
+            "estimated_minutes_remaining": None,
             "restaurant_name": "No Restaurant",
             "order_id": "No Active Order",
             "order_status_description": "No Active Order",
@@ -344,84 +536,240 @@ class UberEatsCoordinator(DataUpdateCoordinator):
             return "au"
         return "us"
 
-    def _get_cache_file_path(self):
-        """Get the path to the cache file for this account's past orders."""
+    def _get_legacy_cache_file_path(self):
+        """Path of the pre-SQLite JSON cache (imported into the history store once)."""
         cache_dir = self.hass.config.path("custom_components", "uber_eats", ".cache")
-        # Use entry_id for unique file per account
         return os.path.join(cache_dir, f"past_orders_{self.entry_id}.json")
 
     async def _load_past_orders_cache(self):
-        """Load past orders cache from disk."""
+        """Load sync metadata and current-year statistics from the history store.
+
+        Single-flight: concurrent callers (panel, scheduled sync) wait for the
+        one load, so the legacy import and the statistics rebuild run once and
+        self.statistics is not swapped under a sync applying deltas to it.
+        """
         if self._past_orders_cache_loaded:
             return self._cached_past_orders
-        
-        cache_file = self._get_cache_file_path()
-        try:
-            if os.path.exists(cache_file):
-                def read_file():
-                    with open(cache_file, "r", encoding="utf-8") as f:
-                        return json.load(f)
-                data = await self.hass.async_add_executor_job(read_file)
-                self._cached_past_orders = data
-                self._past_orders_cache_loaded = True
-                _LOGGER.debug("Loaded past orders cache for %s", self.account_name)
-                return data
-        except Exception as e:
-            _LOGGER.warning("Failed to load past orders cache: %s", e)
-        
-        self._past_orders_cache_loaded = True
-        return None
 
-    async def _save_past_orders_cache(self, data):
-        """Save past orders data to disk cache."""
-        cache_file = self._get_cache_file_path()
-        try:
-            cache_dir = os.path.dirname(cache_file)
-            def write_file():
-                os.makedirs(cache_dir, exist_ok=True)
-                with open(cache_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f)
-            await self.hass.async_add_executor_job(write_file)
-            self._cached_past_orders = data
-            _LOGGER.debug("Saved past orders cache for %s", self.account_name)
-        except Exception as e:
-            _LOGGER.warning("Failed to save past orders cache: %s", e)
+        async with self._past_orders_load_lock:
+            if self._past_orders_cache_loaded:
+                return self._cached_past_orders
+            try:
+                imported = await self._history.async_run(
+                    self._history.import_legacy_cache, self.entry_id, self._get_legacy_cache_file_path()
+                )
+                if imported:
+                    _LOGGER.info("Imported %s past orders for %s into the history store", imported, self.account_name)
+                count = await self._history.async_run(self._history.count, self.entry_id)
+                if count:
+                    # One pass over the stored history; syncs then update the aggregates by delta
+                    self.statistics = await self._history.async_run(self._build_statistics)
+                    await self._update_past_orders_summary()
+                    _LOGGER.debug("Loaded past orders summary for %s (%s orders)", self.account_name, count)
+            except Exception as e:
+                _LOGGER.warning("Failed to load past orders history: %s", e)
+
+            self._past_orders_cache_loaded = True
+        return self._cached_past_orders
+
+    def _build_statistics(self):
+        """Build the aggregates from every stored order, read in batches (blocking, executor)."""
+        return OrderStatistics.from_orders(
+            self._history.orders_between(self.entry_id), dt_util.get_time_zone(self.time_zone)
+        )
+
+    async def _update_past_orders_summary(self):
+        """Refresh the in-memory summary (statistics + sync times)."""
+        meta = await self._history.async_run(self._history.get_meta, self.entry_id)
+        self._cached_past_orders = {
+            "statistics": self.statistics.summary(datetime.now().year),
+            "last_full_sync": meta["last_full_sync"],
+            "last_sync": meta["last_sync"],
+        }
+        # Statistics sensors read from the aggregates
+        self.async_update_listeners()
+        return self._cached_past_orders
+
+    async def get_past_orders_cached(self, **query):
+        """Get one page of past orders - served from the history store, refreshed in background.
+
+        query is passed to PastOrderStore.query_orders (start, end, store_uuid,
+        cancelled, sort, cursor, limit).
 
-    async def get_past_orders_cached(self):
-        """Get past orders with caching - returns cached data immediately, refreshes in background.
-        
         Returns dict with:
-          - orders: list of order dicts
-          - statistics: computed stats
-          - from_cache: True if this is cached data (fresh fetch happening in background)
+          - orders: the requested page of order dicts
+          - total: number of orders matching the filters
+          - next_cursor: cursor for the next page, or None on the last page
+          - statistics: computed stats for the current year
+          - from_cache: True if this is cached data (not fetched for this call)
+          - as_of: ISO time of the last completed sync, or None
+          - refreshing: True while a background sync is running
         """
-        # Load from disk cache if not yet loaded
+        # Load summary from the history store if not yet loaded
         cached = await self._load_past_orders_cache()
         
-        if cached and cached.get("orders"):
-            # Return cached data immediately, schedule background refresh
-            asyncio.create_task(self._refresh_past_orders_background())
-            return {**cached, "from_cache": True}
-        
-        # No cache - fetch fresh
-        fresh_data = await self.fetch_past_orders()
-        await self._save_past_orders_cache(fresh_data)
-        return {**fresh_data, "from_cache": False}
+        if cached and cached.get("last_sync"):
+            # Return stored data immediately; sync in background only when stale
+            self.async_schedule_past_orders_refresh()
+            from_cache = True
+        else:
+            # Never synced - wait for the (shared) first sync
+            await self.async_schedule_past_orders_refresh(force=True)
+            from_cache = False
+        page = await self._history.async_run(
+            functools.partial(self._history.query_orders, self.entry_id, **query)
+        )
+        statistics = self.statistics.summary(datetime.now().year)
+        last_sync = (self._cached_past_orders or {}).get("last_sync")
+        return {
+            **page,
+            "statistics": statistics,
+            "from_cache": from_cache,
+            "as_of": dt_util.utc_from_timestamp(last_sync).isoformat() if last_sync else None,
+            "refreshing": self.past_orders_refreshing,
+        }
+
+    @property
+    def past_orders_refreshing(self):
+        """True while a past-orders sync is in flight."""
+        return self._past_orders_refresh_task is not None and not self._past_orders_refresh_task.done()
+
+    def diagnostics_snapshot(self):
+        """Cycle timing, per-account state and shared-resource counters for diagnostics."""
+        data = self.data or {}
+        past_orders = self._cached_past_orders or {}
+        return {
+            "coordinator": {
+                "last_update_success": self.last_update_success,
+                "update_interval_s": self.update_interval.total_seconds() if self.update_interval else None,
+                "active_orders": data.get("orders_count", 0),
+                "order_stages": [order.order_stage for order in data.get("orders") or []],
+                "past_orders_last_sync": past_orders.get("last_sync"),
+                "past_orders_last_full_sync": past_orders.get("last_full_sync"),
+                "past_orders_refreshing": self.past_orders_refreshing,
+            },
+            "metrics": self.metrics.as_dict(),
+            "trajectories": self.trajectories.stats,
+            "eta_accuracy": self.eta.accuracy(),
+            "geofence": {**self.geofence.stats, "zones": (data.get("geofence") or {}).get("zones", {})},
+            # Integration-wide: shared by every account
+            "http": self._http.stats,
+            "scheduler": self._scheduler.stats,
+            "tts_queue": self._tts_queue.stats,
+            "geocode_cache": self._geocoder.stats,
+        }
+
+    def _past_orders_freshness(self):
+        """Configured freshness window for past orders, in seconds."""
+        options = self._options()
+        try:
+            minutes = int(options.get(CONF_PAST_ORDERS_FRESHNESS, DEFAULT_PAST_ORDERS_FRESHNESS))
+        except (TypeError, ValueError):
+            minutes = DEFAULT_PAST_ORDERS_FRESHNESS
+        return max(1, minutes) * 60
+
+    @callback
+    def async_schedule_past_orders_refresh(self, force=False):
+        """Start a background past-orders sync unless one is running or the data is fresh.
+
+        Every caller shares the one in-flight task; returns it, or None when skipped.
+        """
+        if self.past_orders_refreshing:
+            return self._past_orders_refresh_task
+        last_sync = (self._cached_past_orders or {}).get("last_sync") or 0
+        if not force and time.time() - last_sync < self._past_orders_freshness():
+            return None
+        self._past_orders_refresh_task = self.hass.async_create_background_task(
+            self._refresh_past_orders_background(),
+            name=f"uber_eats_past_orders_refresh_{self.entry_id}",
+        )
+        return self._past_orders_refresh_task
+
+    async def get_past_order_restaurants(self, start: str | None = None, end: str | None = None):
+        """Return the restaurants in the account's history (for the panel's filter)."""
+        return await self._history.async_run(self._history.restaurants, self.entry_id, start, end)
 
     async def _refresh_past_orders_background(self):
-        """Fetch fresh past orders in background and update cache."""
+        """Fetch fresh past orders in background and update the history store."""
         try:
-            fresh_data = await self.fetch_past_orders()
-            await self._save_past_orders_cache(fresh_data)
+            with self.metrics.time("past_orders"):
+                await self._sync_past_orders()
         except Exception as e:
             _LOGGER.debug("Background past orders refresh failed: %s", e)
+            self.metrics.record_error("past_orders")
+        finally:
+            self._async_publish_metrics()
 
-    async def fetch_past_orders(self):
-        """Fetch all past orders from the Uber Eats API (paginated), filtered to current year.
-        
-        Returns dict with:
-          - orders: list of order dicts (current year only)
-          - statistics: computed stats for current year
+    async def _sync_past_orders(self):
+        """Bring the account's history store up to date.
+
+        Normally incremental: paging stops at the first already-stored order and
+        only the new orders are written. Every PAST_ORDERS_FULL_SYNC_INTERVAL
+        the whole history is re-read to pick up cancellations and edits.
+        """
+        # The statistics the pages are applied to must be loaded (once) first
+        await self._load_past_orders_cache()
+        meta = await self._history.async_run(self._history.get_meta, self.entry_id)
+        now = time.time()
+        last_full_sync = meta["last_full_sync"]
+        full = not last_full_sync or now - last_full_sync >= PAST_ORDERS_FULL_SYNC_INTERVAL.total_seconds()
+
+        known = None
+        if not full:
+            known = await self._history.async_run(
+                self._history.recent_uuids, self.entry_id, PAST_ORDERS_KNOWN_UUIDS_LIMIT
+            )
+        seen = set()
+
+        async def _store_page(orders):
+            seen.update(o["uuid"] for o in orders if o.get("uuid"))
+            self._set_past_orders_statistics(
+                await self._history.async_run(self._store_past_orders_page, orders)
+            )
+
+        complete = await self.fetch_past_orders(_store_page, known_uuids=known)
+        if full and complete:
+            # Complete crawl: drop orders Uber no longer returns
+            self._set_past_orders_statistics(
+                await self._history.async_run(self._prune_past_orders, seen)
+            )
+            last_full_sync = now
+        if complete:
+            # An interrupted sync is not fresh: leave last_sync so the next request retries
+            await self._history.async_run(self._history.set_meta, self.entry_id, last_full_sync, now)
+        return await self._update_past_orders_summary()
+
+    def _store_past_orders_page(self, orders):
+        """Write one fetched page and apply its statistics delta (blocking, executor).
+
+        Fetched orders win over stored ones: the stored versions are un-counted
+        and the fetched ones counted. Returns the current-year summary.
+        """
+        uuids = [o["uuid"] for o in orders if o.get("uuid")]
+        previous = self._history.orders_by_uuid(self.entry_id, uuids)
+        self._history.upsert_orders(self.entry_id, orders)
+        self.statistics.replace_orders(previous, orders)
+        return self.statistics.summary(datetime.now().year)
+
+    def _prune_past_orders(self, keep_uuids):
+        """Delete and un-count stored orders not in keep_uuids (blocking, executor)."""
+        self.statistics.remove_orders(self._history.prune_orders(self.entry_id, keep_uuids))
+        return self.statistics.summary(datetime.now().year)
+
+    def _set_past_orders_statistics(self, summary):
+        """Keep the cached summary in step with a sync that is still running."""
+        if self._cached_past_orders is not None:
+            self._cached_past_orders = {**self._cached_past_orders, "statistics": summary}
+
+    async def fetch_past_orders(self, on_page, known_uuids=None):
+        """Fetch past orders from the Uber Eats API (paginated), all years, newest first.
+
+        Each page of normalized order dicts is awaited with on_page(orders) as
+        it arrives, so a full crawl never holds the whole history in memory.
+        If known_uuids is given, paging stops after the first page that contains
+        an already-known order (incremental sync).
+
+        Returns False if paging was cut short by an error.
         """
         locale = self._get_locale_code(self.time_zone)
         url = f"{ENDPOINT_PAST_ORDERS}?localeCode={locale}"
@@ -432,112 +780,104 @@ class UberEatsCoordinator(DataUpdateCoordinator):
         else:
             headers["Cookie"] = f"sid={self.sid}"
 
-        all_orders = []
-        current_year = datetime.now().year
         last_workflow_uuid = ""
+        session = self._http.session
+        try:
+            while True:
+                await self._scheduler.async_acquire(PRIORITY_BACKGROUND)
+                async with session.post(url, headers=headers, json={"lastWorkflowUUID": last_workflow_uuid}) as resp:
+                    if resp.status != 200:
+                        _LOGGER.error("Past orders API returned %s", resp.status)
+                        return False
+                    body = await resp.read()
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                while True:
-                    async with session.post(url, headers=headers, json={"lastWorkflowUUID": last_workflow_uuid}) as resp:
-                        if resp.status != 200:
-                            _LOGGER.error("Past orders API returned %s", resp.status)
-                            break
-                        data = await resp.json()
-                        orders_map = data.get("data", {}).get("ordersMap", {})
-                        meta = data.get("data", {}).get("meta", {})
-                        has_more = meta.get("hasMore", False)
-
-                        batch_orders = []
-                        for order_uuid, order_data in orders_map.items():
-                            base = order_data.get("baseEaterOrder", {})
-                            store_info = order_data.get("storeInfo", {})
-                            fare_info = order_data.get("fareInfo", {})
-
-                            # Extract from checkoutInfo
-                            checkout = fare_info.get("checkoutInfo", [])
-                            subtotal = 0
-                            delivery_fee = 0
-                            tax = 0
-                            promotions = 0  # Sum of all discounts/credits (negative value)
-                            total_raw = fare_info.get("totalPrice", 0) / 100.0
-
-                            for item in checkout:
-                                key = item.get("key", "")
-                                item_type = item.get("type", "")
-                                raw_val = item.get("rawValue", 0)
-                                
-                                if key == "eats_fare.subtotal":
-                                    subtotal = raw_val
-                                elif "booking_fee" in key:
-                                    delivery_fee = raw_val
-                                elif key == "eats.tax.base":
-                                    tax = raw_val
-                                elif item_type == "debit" and raw_val < 0:
-                                    # Sum all debits (promotions/discounts) - they have negative values
-                                    promotions += raw_val
-                                elif key == "eats_fare.total":
-                                    total_raw = raw_val
-
-                            # Parse completed date and filter by current year
-                            completed_at = base.get("completedAt", "") or base.get("lastStateChangeAt", "")
-                            order_year = None
-                            date_formatted = ""
-                            if completed_at:
-                                try:
-                                    dt_obj = datetime.fromisoformat(completed_at.replace("Z", "+00:00"))
-                                    order_year = dt_obj.year
-                                    date_formatted = dt_obj.strftime("%b %d, %Y")
-                                except Exception:
-                                    date_formatted = completed_at[:10] if len(completed_at) >= 10 else completed_at
-
-                            # Only include orders from current year
-                            if order_year != current_year:
-                                continue
-
-                            location = store_info.get("location", {})
-                            address_info = location.get("address", {})
-                            store_address = address_info.get("eaterFormattedAddress", "")
-
-                            batch_orders.append({
-                                "uuid": order_uuid,
-                                "store_uuid": store_info.get("uuid", ""),
-                                "restaurant_name": store_info.get("title", "Unknown"),
-                                "hero_image_url": store_info.get("heroImageUrl", ""),
-                                "date": date_formatted,
-                                "completed_at": completed_at,
-                                "subtotal": subtotal,
-                                "delivery_fee": delivery_fee,
-                                "tax": tax,
-                                "promotions": promotions,  # Negative value for discounts/credits
-                                "total": total_raw,
-                                "store_address": store_address,
-                                "store_rating": store_info.get("rating"),
-                                "is_cancelled": base.get("isCancelled", False),
-                            })
-
-                        all_orders.extend(batch_orders)
-
-                        # Pagination: get last order UUID for next request
-                        if has_more and orders_map:
-                            # Get the last order UUID from the batch
-                            last_order = list(orders_map.values())[-1]
-                            last_workflow_uuid = last_order.get("baseEaterOrder", {}).get("uuid", "")
-                            if not last_workflow_uuid:
-                                break
-                        else:
-                            break
+                # Decode and normalize the page in the executor; only I/O stays on the loop
+                page = await self.hass.async_add_executor_job(parse_past_orders_page, body)
+                await on_page(page.orders)
 
-            except Exception as e:
-                _LOGGER.error("Error fetching past orders: %s", e, exc_info=True)
+                # Incremental sync: everything past this page is already cached
+                if known_uuids and any(uuid in known_uuids for uuid in page.uuids):
+                    return True
+
+                # Pagination: continue after the last order of this page
+                if page.has_more and page.last_workflow_uuid:
+                    last_workflow_uuid = page.last_workflow_uuid
+                else:
+                    return True
+
+        except Exception as e:
+            _LOGGER.error("Error fetching past orders: %s", e, exc_info=True)
+            return False
+
+    def _profile_is_stale(self):
+        if self._profile_fetched_at is None:
+            return True
+        return time.monotonic() - self._profile_fetched_at >= PROFILE_REFRESH_INTERVAL.total_seconds()
 
-        # Sort by completed date descending
-        all_orders.sort(key=lambda o: o.get("completed_at", ""), reverse=True)
+    @callback
+    def async_schedule_profile_refresh(self, force=False):
+        """Start a background profile refresh when the cached profile is stale (or forced).
+
+        Only one refresh runs at a time; callers never wait on it.
+        """
+        if self._profile_refresh_task is not None and not self._profile_refresh_task.done():
+            return self._profile_refresh_task
+        if not force and not self._profile_is_stale():
+            return None
+        self._profile_refresh_task = self.hass.async_create_background_task(
+            self._async_refresh_user_profile(),
+            name=f"uber_eats_profile_refresh_{self.entry_id}",
+        )
+        return self._profile_refresh_task
+
+    async def _async_refresh_user_profile(self):
+        """Fetch getUserV1 and apply name/picture changes to the coordinator."""
+        with self.metrics.time("profile"):
+            profile = await self._request_user_profile()
+        self._async_publish_metrics()
+        if profile is None:
+            self.metrics.record_error("profile")
+            # Keep the last good profile; retry sooner than the normal TTL
+            self._profile_fetched_at = (
+                time.monotonic() - PROFILE_REFRESH_INTERVAL.total_seconds() + PROFILE_RETRY_INTERVAL.total_seconds()
+            )
+            if self._cached_user_profile is None:
+                self._cached_user_profile = _empty_profile()
+            return self._cached_user_profile
+
+        old_profile = self._cached_user_profile or {}
+        self._cached_user_profile = profile
+        self._profile_fetched_at = time.monotonic()
+
+        # Check if name has changed and update account_name
+        new_first = profile.get("first_name", "")
+        new_last = profile.get("last_name", "")
+        if new_first or new_last:
+            new_name = f"{new_first} {new_last}".strip()
+            if new_name and new_name != self.account_name:
+                _LOGGER.info("User profile name changed from '%s' to '%s'", self.account_name, new_name)
+                self.account_name = new_name
+
+        # Push picture/name changes into the current data without an extra poll
+        if self.data and any(old_profile.get(k) != profile.get(k) for k in ("picture_url", "first_name", "last_name")):
+            orders = self.data.get("orders") or []
+            self.data["user_picture_url"] = (
+                (orders[0].user_picture_url if orders else None) or profile.get("picture_url")
+            )
+            self.data["user_first_name"] = profile.get("first_name", "")
+            self.data["user_last_name"] = profile.get("last_name", "")
+            self.async_update_listeners()
+        return profile
 
-        # Compute statistics from current year orders
-        statistics = self._compute_order_statistics(all_orders, current_year)
+    async def async_get_user_profile(self, force_refresh=False):
+        """Return the cached profile immediately and revalidate it in the background.
 
-        return {"orders": all_orders, "statistics": statistics}
+        Only the very first call (nothing cached yet) waits for getUserV1.
+        """
+        task = self.async_schedule_profile_refresh(force=force_refresh)
+        if self._cached_user_profile is None and task is not None:
+            await task
+        return self._cached_user_profile or _empty_profile()
 
     async def fetch_user_profile(self):
         """Fetch user profile from the Uber Eats API.
@@ -547,6 +887,10 @@ class UberEatsCoordinator(DataUpdateCoordinator):
           - first_name: user's first name
           - last_name: user's last name
         """
+        return await self._request_user_profile() or _empty_profile()
+
+    async def _request_user_profile(self):
+        """Call getUserV1; return the profile dict, or None on failure."""
         locale = self._get_locale_code(self.time_zone)
         url = f"{ENDPOINT_GET_USER}?localeCode={locale}"
         headers = dict(HEADERS_TEMPLATE)
@@ -556,78 +900,24 @@ class UberEatsCoordinator(DataUpdateCoordinator):
         else:
             headers["Cookie"] = f"sid={self.sid}"
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(url, headers=headers, json={}) as resp:
-                    if resp.status != 200:
-                        _LOGGER.error("getUserV1 API returned %s", resp.status)
-                        return {"picture_url": None, "first_name": "", "last_name": "", "country_code": "US"}
-                    data = await resp.json()
-                    user_data = data.get("data", {})
-                    return {
-                        "picture_url": user_data.get("pictureUrl"),
-                        "first_name": user_data.get("firstName", ""),
-                        "last_name": user_data.get("lastName", ""),
-                        "country_code": user_data.get("geoIpCountryCode", "US"),
-                    }
-            except Exception as e:
-                _LOGGER.error("Error fetching user profile: %s", e, exc_info=True)
-                return {"picture_url": None, "first_name": "", "last_name": "", "country_code": "US"}
-
-    def _compute_order_statistics(self, orders, year):
-        """Compute statistics from orders list."""
-        if not orders:
-            return {
-                "year": year,
-                "total_orders": 0,
-                "total_spent": 0,
-                "total_delivery_fees": 0,
-                "top_restaurants": [],
-            }
-
-        # Aggregate by restaurant
-        restaurant_stats = {}
-        total_spent = 0
-        total_delivery_fees = 0
-        total_orders = 0
-
-        for order in orders:
-            if order.get("is_cancelled"):
-                continue
-
-            total_orders += 1
-            total_spent += order.get("total", 0)
-            total_delivery_fees += order.get("delivery_fee", 0)
-
-            store_uuid = order.get("store_uuid", "")
-            store_name = order.get("restaurant_name", "Unknown")
-            order_total = order.get("total", 0)
-
-            if store_uuid:
-                if store_uuid not in restaurant_stats:
-                    restaurant_stats[store_uuid] = {
-                        "name": store_name,
-                        "order_count": 0,
-                        "total_spent": 0,
-                    }
-                restaurant_stats[store_uuid]["order_count"] += 1
-                restaurant_stats[store_uuid]["total_spent"] += order_total
-
-        # Get top 3 restaurants by order count
-        sorted_restaurants = sorted(
-            restaurant_stats.values(),
-            key=lambda r: r["order_count"],
-            reverse=True
-        )
-        top_restaurants = sorted_restaurants[:3]
-
-        return {
-            "year": year,
-            "total_orders": total_orders,
-            "total_spent": round(total_spent, 2),
-            "total_delivery_fees": round(total_delivery_fees, 2),
-            "top_restaurants": top_restaurants,
-        }
+        session = self._http.session
+        try:
+            await self._scheduler.async_acquire(PRIORITY_BACKGROUND)
+            async with session.post(url, headers=headers, json={}) as resp:
+                if resp.status != 200:
+                    _LOGGER.error("getUserV1 API returned %s", resp.status)
+                    return None
+                data = json_loads(await resp.read())
+                user_data = data.get("data", {})
+                return {
+                    "picture_url": user_data.get("pictureUrl"),
+                    "first_name": user_data.get("firstName", ""),
+                    "last_name": user_data.get("lastName", ""),
+                    "country_code": user_data.get("geoIpCountryCode", "US"),
+                }
+        except Exception as e:
+            _LOGGER.error("Error fetching user profile: %s", e, exc_info=True)
+            return None
 
     def _parse_stage(self, feed_cards):
         if not feed_cards:
@@ -660,32 +950,17 @@ class UberEatsCoordinator(DataUpdateCoordinator):
             return 0
         return int(delta_secs // 60)
 
-    async def _reverse_geocode(self, lat, lon, session):
+    async def _reverse_geocode(self, lat, lon, permanent=False):
         """
         Return dict with location components we keep:
         road, suburb, quarter, county, address
+
+        Served from the shared geocode cache (see geocode.py); set permanent for
+        fixed store/home points.
         """
-        url = (
-            "https://nominatim.openstreetmap.org/reverse"
-            f"?format=json&lat={lat}&lon={lon}&zoom=17&addressdetails=1&accept-language=en"
-        )
-        headers = {"User-Agent": "UberEatsHAIntegration/1.0"}
-        try:
-            async with session.get(url, headers=headers) as resp:
-                if resp.status != 200:
-                    return {}
-                data = await resp.json()
-                addr = data.get("address", {}) or {}
-                return {
-                    "road":     addr.get("road") or addr.get("pedestrian") or addr.get("footway") or "No Driver Assigned",
-                    "suburb":   addr.get("suburb") or "No Driver Assigned",
-                    "quarter":  addr.get("quarter") or "No Driver Assigned",
-                    "county":   addr.get("county") or "No Driver Assigned",
-                    "address":  data.get("display_name") or "No Driver Assigned",
-                }
-        except Exception as e:
-            _LOGGER.debug("Reverse geocode failed: %s", e)
-            return {}
+        result, cached = await self._geocoder.async_lookup_cached(lat, lon, permanent=permanent)
+        self.metrics.record_geocode(cached)
+        return result
 
     def _get_map_url(self, lat, lon):
         if not lat or not lon:
@@ -697,32 +972,23 @@ class UberEatsCoordinator(DataUpdateCoordinator):
             f"?bbox={min_lon}%2C{min_lat}%2C{max_lon}%2C{max_lat}&layer=mapnik&marker={lat}%2C{lon}"
         )
 
-    @staticmethod
-    def _distance_feet(lat1, lon1, lat2, lon2):
-        """Haversine distance in feet between two lat/lon points."""
-        if lat1 is None or lon1 is None or lat2 is None or lon2 is None:
-            return None
-        import math
-        R = 6371000  # meters
-        to_rad = lambda x: x * math.pi / 180
-        d_lat = to_rad(lat2 - lat1)
-        d_lon = to_rad(lon2 - lon1)
-        a = math.sin(d_lat / 2) ** 2 + math.cos(to_rad(lat1)) * math.cos(to_rad(lat2)) * math.sin(d_lon / 2) ** 2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        return (R * c) * 3.28084  # meters to feet
-
-    def _process_tts_events(self, current_data):
-        """Detect order events and send TTS if enabled. Fire-and-forget."""
+    def _dispatch_order_events(self, events, current_data):
+        """Hand this cycle's order events (see order_events.py) to every consumer."""
+        for event in events:
+            self.hass.bus.async_fire(EVENT_ORDER, {
+                "entry_id": self.entry_id,
+                "account_name": self.account_name,
+                **event.as_event_data(),
+            })
+            if event.event_type == DRIVER_NEARBY:
+                self._trigger_driver_nearby_automation(event)
+        self._process_tts_events(events, current_data)
+
+    def _process_tts_events(self, events, current_data):
+        """Queue announcements for order events and interval updates if TTS is enabled."""
         from . import tts_notifications
 
-        prev = self._previous_data
-        if prev is None:
-            return  # First run, no prior state to compare
-
-        entry = self.hass.config_entries.async_get_entry(self.entry_id)
-        if not entry:
-            return
-        options = entry.options or {}
+        options = self._options()
         if not options.get(CONF_TTS_ENABLED, False):
             return
         tts_entity = options.get(CONF_TTS_ENTITY_ID, "").strip()
@@ -741,48 +1007,30 @@ class UberEatsCoordinator(DataUpdateCoordinator):
             return
 
         curr_with_status = dict(current_data)
-        curr_active = current_data.get("active")
         messages_to_send = []
         
         # Use first name only for TTS messages (sensor names still use full account_name)
         tts_name = (self._cached_user_profile or {}).get("first_name", "").strip() or self.account_name
 
-        # 1. New order: same logic as active order sensor — was off, now on (with restaurant for message)
-        if not prev.get("active") and current_data.get("active"):
-            rest = (current_data.get("restaurant_name") or "").strip()
-            if rest and rest not in ("No Restaurant", "Unknown"):
-                msg = tts_notifications.build_message(
-                    prefix, tts_name, curr_with_status, "new_order"
-                )
-                if msg:
-                    messages_to_send.append(("new_order", msg))
-
-        # 2. Driver assigned
-        prev_driver = prev.get("driver_name", "No Driver Assigned")
-        curr_driver = current_data.get("driver_name", "No Driver Assigned")
-        had_driver = _has_driver(prev_driver)
-        has_driver = _has_driver(curr_driver)
-        if not had_driver and has_driver:
-            msg = tts_notifications.build_message(
-                prefix, tts_name, curr_with_status, "driver_assigned"
-            )
-            if msg:
-                messages_to_send.append(("driver_assigned", msg))
-            if interval_enabled:
+        # 1-3. New order, driver assigned, card timeline / order status change, for every order
+        message_types = {NEW_ORDER: "new_order", DRIVER_ASSIGNED: "driver_assigned", STATUS_CHANGED: "status_change"}
+        for event in events:
+            message_type = message_types.get(event.event_type)
+            if message_type is None:
+                continue
+            if event.event_type == NEW_ORDER and not (event.order.restaurant_name or "").strip():
+                continue  # nothing to announce without the restaurant name
+            if event.event_type == DRIVER_ASSIGNED and interval_enabled:
                 self._last_interval_tts_time = dt_util.utcnow()
-        if had_driver and not has_driver:
-            self._last_interval_tts_time = None
-            self._driver_nearby_triggered_orders.clear()
-
-        # 3. Card timeline / order status change (order_status from API)
-        prev_order_status = prev.get("order_status", "")
-        curr_order_status = current_data.get("order_status", "")
-        if curr_active and curr_order_status and curr_order_status != prev_order_status:
             msg = tts_notifications.build_message(
-                prefix, tts_name, curr_with_status, "status_change"
+                prefix, tts_name, event.order.as_dict(), message_type
             )
             if msg:
-                messages_to_send.append(("status_change", msg))
+                messages_to_send.append((message_type, msg))
+
+        has_driver = has_driver_name(current_data.get("driver_name"))
+        if not has_driver:
+            self._last_interval_tts_time = None
 
         # 4. Interval update (when driver assigned, every N minutes)
         if interval_enabled and has_driver and self._last_interval_tts_time:
@@ -796,79 +1044,46 @@ class UberEatsCoordinator(DataUpdateCoordinator):
                     messages_to_send.append(("interval_update", msg))
                 self._last_interval_tts_time = now
 
-        for _event_type, message in messages_to_send:
-            self.hass.async_create_task(
-                tts_notifications.send_tts_if_idle(
-                    self.hass, tts_entity, media_players, message,
-                    cache=tts_cache, volume_level=volume,
-                    per_player_volumes=per_player_volumes,
-                    language=tts_language,
-                    options=tts_options,
-                    per_player_settings=per_player_settings,
-                )
+        for message_type, message in messages_to_send:
+            tts_notifications.async_announce(
+                self.hass, tts_entity, media_players, message,
+                kind=message_type, key=self.entry_id, prefix=prefix,
+                cache=tts_cache, volume_level=volume,
+                per_player_volumes=per_player_volumes,
+                language=tts_language,
+                options=tts_options,
+                per_player_settings=per_player_settings,
             )
 
-        # 5. Driver nearby action: trigger user-selected automation when any driver is within distance
-        #    Supports multiple orders - triggers once per order when each driver approaches
-        driver_nearby_enabled = options.get(CONF_DRIVER_NEARBY_AUTOMATION_ENABLED, False)
+    def _process_geofence_events(self, events):
+        """Fire geofence enter/exit events on the bus."""
+        for event in events:
+            self.hass.bus.async_fire(EVENT_GEOFENCE, {
+                "entry_id": self.entry_id,
+                "account_name": self.account_name,
+                "order_id": event.order_id,
+                "zone": event.zone_id,
+                "zone_name": event.zone_name,
+                "event": event.event,
+                "distance_m": round(event.distance_m),
+            })
+
+    def _trigger_driver_nearby_automation(self, event):
+        """Run the user's driver-nearby automation (once per approach; the ring's hysteresis re-arms it)."""
+        options = self._options()
         automation_entity = (options.get(CONF_DRIVER_NEARBY_AUTOMATION_ENTITY) or "").strip()
-        distance_feet = max(50, min(2000, int(options.get(CONF_DRIVER_NEARBY_DISTANCE_FEET, DEFAULT_DRIVER_NEARBY_DISTANCE_FEET))))
-        reset_feet = distance_feet + 50  # allow re-trigger after driver leaves and comes back
-        
-        if driver_nearby_enabled and automation_entity and automation_entity.startswith("automation."):
-            home_lat = self.hass.config.latitude or 0.0
-            home_lon = self.hass.config.longitude or 0.0
-            all_orders = current_data.get("orders", [])
-            current_order_ids = set()
-            
-            for order in all_orders:
-                order_uuid = order.get("order_uuid") or order.get("order_id", "")
-                if not order_uuid:
-                    continue
-                current_order_ids.add(order_uuid)
-                
-                # Skip if order has no driver
-                driver_name = order.get("driver_name", "")
-                if _no_driver(driver_name):
-                    continue
-                
-                # Get driver coordinates from order
-                coords = order.get("driver_location_coords", {})
-                lat = coords.get("lat") if coords else None
-                lon = coords.get("lon") if coords else None
-                
-                # Fall back to flat fields if coords not in order
-                if lat is None:
-                    lat = order.get("driver_location_lat")
-                if lon is None:
-                    lon = order.get("driver_location_lon")
-                
-                if lat is not None and lon is not None and isinstance(lat, (int, float)) and isinstance(lon, (int, float)):
-                    dist_ft = self._distance_feet(float(lat), float(lon), home_lat, home_lon)
-                    if dist_ft is not None:
-                        if dist_ft > reset_feet:
-                            # Driver left the area, allow re-trigger
-                            self._driver_nearby_triggered_orders.discard(order_uuid)
-                        elif dist_ft <= distance_feet and order_uuid not in self._driver_nearby_triggered_orders:
-                            # Driver is nearby and hasn't triggered yet for this order
-                            self._driver_nearby_triggered_orders.add(order_uuid)
-                            _LOGGER.info("Driver nearby trigger for order %s (%.0f ft)", order_uuid[:8], dist_ft)
-                            self.hass.async_create_task(
-                                self.hass.services.async_call(
-                                    "automation",
-                                    "trigger",
-                                    {"skip_condition": False},
-                                    target={"entity_id": automation_entity},
-                                    blocking=False,
-                                )
-                            )
-            
-            # Clean up triggered orders that are no longer active
-            self._driver_nearby_triggered_orders = self._driver_nearby_triggered_orders & current_order_ids
-        else:
-            # Reset if feature disabled or no orders
-            if not has_driver:
-                self._driver_nearby_triggered_orders.clear()
+        if not options.get(CONF_DRIVER_NEARBY_AUTOMATION_ENABLED, False) or not automation_entity.startswith("automation."):
+            return
+        _LOGGER.info("Driver nearby trigger for order %s (%.0f ft)", event.order_id[:8], event.distance_m * FEET_PER_M)
+        self.hass.async_create_task(
+            self.hass.services.async_call(
+                "automation",
+                "trigger",
+                {"skip_condition": False},
+                target={"entity_id": automation_entity},
+                blocking=False,
+            )
+        )
 
 
 __all__ = ["UberEatsCoordinator"]
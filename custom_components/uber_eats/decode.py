@@ -0,0 +1,32 @@
+"""JSON decoding for Uber Eats and Nominatim responses.
+
+Bodies are read once as bytes and decoded with orjson when it is installed
+(Home Assistant ships it), falling back to the standard library.
+getPastOrdersV1 pages are decoded in the executor together with their
+normalization (see past_orders.py).
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a Home Assistant core requirement
+    orjson = None
+
+DECODER = "orjson" if orjson is not None else "json"
+
+
+def json_loads(raw: bytes | str) -> Any:
+    """Decode a JSON document with the fastest available decoder."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def json_dumps_canonical(obj: Any) -> bytes:
+    """Encode with sorted keys and no whitespace (stable bytes for hashing)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
@@ -7,12 +7,13 @@ from typing import Any
 from homeassistant.components.device_tracker import SourceType
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, CONF_ACCOUNT_NAME
 from .coordinator import UberEatsCoordinator
+from .models import NO_ACTIVE_ORDER, ParsedOrder
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,26 +43,65 @@ class UberEatsDriverTracker(CoordinatorEntity, TrackerEntity):
         self._entry_id = entry_id
         self._attr_unique_id = f"uber_eats_{self._account_name}_driver_tracker"
         self._attr_name = f"{self._account_name} Uber Eats Order Tracker"
+        self._snapshot: dict[str, Any] = self._compute_snapshot()
+        self._last_available: bool | None = None
+
+    def _first_order(self) -> ParsedOrder | None:
+        orders = (self.coordinator.data or {}).get("orders") or []
+        return orders[0] if orders else None
 
     def _is_driver_tracking_active(self) -> bool:
         """Check if driver tracking should be active (order active AND driver assigned)."""
-        data = self.coordinator.data
-        if not data.get("active", False):
-            return False
-        
-        driver_name = data.get("driver_name", "No Driver Assigned")
-        if driver_name in ("No Driver Assigned", "Unknown", None, ""):
-            return False
-        
-        # Check if we have valid coordinates
-        lat = data.get("driver_location_lat")
-        lon = data.get("driver_location_lon")
-        if lat in (None, "No Active Order") or lon in (None, "No Active Order"):
-            return False
-        if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
-            return False
-        
-        return True
+        order = self._first_order()
+        return order is not None and order.tracking_active
+
+    def _compute_snapshot(self) -> dict[str, Any]:
+        """Compute location, state and attributes once per coordinator update."""
+        data = self.coordinator.data or {}
+        order = self._first_order()
+        tracking = order is not None and order.tracking_active
+        if tracking:
+            latitude, longitude = (float(v) for v in order.coords)
+            location_name = order.street
+            # Order stage as state when tracking
+            stage = order.order_stage or "unknown"
+            state = stage if stage != NO_ACTIVE_ORDER else "home"
+        else:
+            latitude = self.coordinator.hass.config.latitude
+            longitude = self.coordinator.hass.config.longitude
+            location_name = "home"
+            state = "home"
+        return {
+            "latitude": latitude,
+            "longitude": longitude,
+            "location_name": location_name,
+            "state": state,
+            "attributes": {
+                "tracking_active": tracking,
+                "order_active": data.get("active", False),
+                "driver_name": data.get("driver_name", "No Driver Assigned"),
+                "restaurant_name": data.get("restaurant_name", "No Restaurant"),
+                "order_stage": data.get("order_stage", "No Active Order"),
+                "order_id": data.get("order_id", "No Active Order"),
+                "eta": data.get("driver_eta_str", "No ETA"),
+                "minutes_remaining": data.get("minutes_remaining"),
+                "street": data.get("driver_location_street", "Unknown"),
+                "suburb": data.get("driver_location_suburb", "Unknown"),
+                "full_address": data.get("driver_location_address", "Unknown"),
+                "account_name": self._account_name,
+                "entry_id": self._entry_id,
+            },
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when location, state or attributes changed."""
+        snapshot = self._compute_snapshot()
+        available = self.available
+        if snapshot != self._snapshot or available != self._last_available:
+            self._snapshot = snapshot
+            self._last_available = available
+            self.async_write_ha_state()
 
     @property
     def source_type(self) -> SourceType:
@@ -71,61 +111,24 @@ class UberEatsDriverTracker(CoordinatorEntity, TrackerEntity):
     @property
     def latitude(self) -> float | None:
         """Return latitude value of the driver, or home location if not tracking."""
-        if not self._is_driver_tracking_active():
-            return self.coordinator.hass.config.latitude
-        
-        return float(self.coordinator.data.get("driver_location_lat"))
+        return self._snapshot["latitude"]
 
     @property
     def longitude(self) -> float | None:
         """Return longitude value of the driver, or home location if not tracking."""
-        if not self._is_driver_tracking_active():
-            return self.coordinator.hass.config.longitude
-        
-        return float(self.coordinator.data.get("driver_location_lon"))
+        return self._snapshot["longitude"]
 
     @property
     def location_name(self) -> str | None:
         """Return a location name for the driver."""
-        if not self._is_driver_tracking_active():
-            return "home"
-        
-        street = self.coordinator.data.get("driver_location_street", "")
-        if street and street != "No Driver Assigned":
-            return street
-        return None
+        return self._snapshot["location_name"]
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra attributes."""
-        data = self.coordinator.data
-        return {
-            "tracking_active": self._is_driver_tracking_active(),
-            "order_active": data.get("active", False),
-            "driver_name": data.get("driver_name", "No Driver Assigned"),
-            "restaurant_name": data.get("restaurant_name", "No Restaurant"),
-            "order_stage": data.get("order_stage", "No Active Order"),
-            "order_id": data.get("order_id", "No Active Order"),
-            "eta": data.get("driver_eta_str", "No ETA"),
-            "minutes_remaining": data.get("minutes_remaining"),
-            "street": data.get("driver_location_street", "Unknown"),
-            "suburb": data.get("driver_location_suburb", "Unknown"),
-            "full_address": data.get("driver_location_address", "Unknown"),
-            "account_name": self._account_name,
-            "entry_id": self._entry_id,
-        }
+        return self._snapshot["attributes"]
 
     @property
     def state(self) -> str | None:
         """Return the state of the tracker."""
-        if not self._is_driver_tracking_active():
-            return "home"
-        
-        # Return order stage as state when tracking
-        stage = self.coordinator.data.get("order_stage", "unknown")
-        return stage if stage != "No Active Order" else "home"
-
-    @property
-    def available(self) -> bool:
-        """Return True if entity is available."""
-        return self.coordinator.last_update_success
+        return self._snapshot["state"]
@@ -0,0 +1,28 @@
+"""Diagnostics download for Uber Eats config entries."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_COOKIE, CONF_FULL_COOKIE, CONF_SESSION_ID, CONF_SID, DOMAIN
+
+TO_REDACT = {CONF_COOKIE, CONF_FULL_COOKIE, CONF_SESSION_ID, CONF_SID}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return cycle timing and shared-resource counters for an entry (cookies redacted)."""
+    result: dict[str, Any] = {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+    }
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator is None:
+        return result
+
+    result.update(coordinator.diagnostics_snapshot())
+    return result
@@ -0,0 +1,228 @@
+"""Kinematic arrival estimate from the courier's trajectory.
+
+Uber's ETA is a "h:mm AM" string: minute resolution, and it only moves when
+Uber rewrites it. Once the food is picked up, this estimates arrival from the
+courier's own movement instead: the remaining straight-line distance to home
+(scaled by ETA_ROUTE_FACTOR for the road network) over a smoothed ground
+speed. The speed is a time-weighted mean of the track segments since pickup,
+with weights halving every ETA_SPEED_HALF_LIFE seconds, and the spread of
+segment speeds (at least ETA_MIN_SPREAD of the speed) gives the confidence band.
+
+The tracker also keeps the estimates (and Uber's ETA) it made for each order
+and, when the order is delivered, scores both against the actual arrival. An
+order counts as delivered when its stage says so, or once it has been missing
+from the response for ETA_MISSING_CYCLES polls (a single missing poll is
+more likely a transient error than a delivery).
+"""
+from __future__ import annotations
+
+import math
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Iterable, NamedTuple
+
+from .const import (
+    ETA_ACCURACY_WINDOW,
+    ETA_CONFIDENCE_Z,
+    ETA_MIN_SEGMENTS,
+    ETA_MIN_SPREAD,
+    ETA_MIN_SPEED_MPS,
+    ETA_MISSING_CYCLES,
+    ETA_ROUTE_FACTOR,
+    ETA_SAMPLE_INTERVAL,
+    ETA_SPEED_HALF_LIFE,
+)
+from .geo import equirectangular_m
+from .models import ParsedOrder
+from .trajectory import TrajectoryStore
+
+# The courier is carrying the food: movement is toward home
+HEADING_HOME_STAGES = ("picked up", "en route", "arriving")
+DELIVERED_STAGES = ("delivered", "complete")
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+class EtaEstimate(NamedTuple):
+    """Arrival estimate for one order (times are unix seconds)."""
+
+    remaining_m: float  # road distance left (straight line * ETA_ROUTE_FACTOR)
+    speed_mps: float  # smoothed ground speed
+    arrival: float
+    earliest: float  # confidence band
+    latest: float
+    as_of: float  # time of the courier position it is based on
+
+    def minutes_remaining(self, now: float) -> int:
+        return max(0, int((self.arrival - now) // 60))
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "remaining_m": round(self.remaining_m),
+            "speed_mps": round(self.speed_mps, 1),
+            "arrival": _iso(self.arrival),
+            "earliest": _iso(self.earliest),
+            "latest": _iso(self.latest),
+            "as_of": _iso(self.as_of),
+        }
+
+
+def estimate(points: list[list[float]], home: tuple[float, float]) -> EtaEstimate | None:
+    """Estimate arrival at home from [lat, lon, ts] points, oldest first."""
+    if len(points) < ETA_MIN_SEGMENTS + 1:
+        return None
+    last_lat, last_lon, last_ts = points[-1]
+    weight_sum = speed_sum = square_sum = 0.0
+    for (lat1, lon1, ts1), (lat2, lon2, ts2) in zip(points, points[1:]):
+        elapsed = ts2 - ts1
+        if elapsed <= 0:
+            continue
+        speed = equirectangular_m(lat1, lon1, lat2, lon2) / elapsed
+        # Longer segments count for more; older ones fade out
+        weight = elapsed * 0.5 ** ((last_ts - ts2) / ETA_SPEED_HALF_LIFE)
+        weight_sum += weight
+        speed_sum += weight * speed
+        square_sum += weight * speed * speed
+    if not weight_sum:
+        return None
+
+    mean = speed_sum / weight_sum
+    spread = max(
+        ETA_CONFIDENCE_Z * math.sqrt(max(0.0, square_sum / weight_sum - mean * mean)),
+        ETA_MIN_SPREAD * mean,  # a steady track still has route and traffic ahead of it
+    )
+    speed = max(mean, ETA_MIN_SPEED_MPS)
+    remaining = equirectangular_m(last_lat, last_lon, home[0], home[1]) * ETA_ROUTE_FACTOR
+    return EtaEstimate(
+        remaining_m=remaining,
+        speed_mps=speed,
+        arrival=last_ts + remaining / speed,
+        earliest=last_ts + remaining / max(mean + spread, speed),
+        latest=last_ts + remaining / max(mean - spread, ETA_MIN_SPEED_MPS),
+        as_of=last_ts,
+    )
+
+
+class _OrderEta:
+    """Pickup time and the predictions recorded for one order."""
+
+    __slots__ = ("picked_up", "samples", "last_sample", "missing", "missing_since")
+
+    def __init__(self) -> None:
+        self.picked_up: float | None = None
+        # (time, estimated arrival, earliest, latest, Uber's arrival or None)
+        self.samples: list[tuple[float, float, float, float, float | None]] = []
+        self.last_sample = 0.0
+        self.missing = 0  # consecutive polls without the order
+        self.missing_since: float | None = None
+
+
+class EtaTracker:
+    """Estimates for one account's active orders, and their accuracy once delivered."""
+
+    def __init__(self, window: int = ETA_ACCURACY_WINDOW) -> None:
+        self._orders: dict[str, _OrderEta] = {}
+        self._deliveries: deque[dict[str, Any]] = deque(maxlen=window)
+
+    def update(
+        self,
+        orders: Iterable[ParsedOrder],
+        trajectories: TrajectoryStore,
+        home: tuple[float, float],
+        now: float,
+        unparsed: Iterable[str] = (),
+    ) -> dict[str, EtaEstimate]:
+        """Estimate each active order; score orders that were delivered or are gone.
+
+        unparsed holds the ids of orders in the response that failed to parse:
+        they are not estimated, but not treated as gone either.
+        """
+        estimates: dict[str, EtaEstimate] = {}
+        seen = set(unparsed)
+        for order in orders:
+            order_id = order.order_id
+            if not order_id:
+                continue
+            seen.add(order_id)
+            if order.order_stage in DELIVERED_STAGES:
+                self._finish(order_id, now)
+                continue
+            state = self._orders.setdefault(order_id, _OrderEta())
+            if order.order_stage in HEADING_HOME_STAGES and state.picked_up is None:
+                state.picked_up = now
+            track = trajectories.get(order_id)
+            if state.picked_up is None or track is None:
+                continue
+            destination = order.home_location or {}
+            if destination.get("lat") is not None and destination.get("lon") is not None:
+                target = (float(destination["lat"]), float(destination["lon"]))
+            else:
+                target = home
+            # Before pickup the courier was heading to the store, not home
+            points = [point for point in track.points() if point[2] >= state.picked_up]
+            result = estimate(points, target)
+            if result is None:
+                continue
+            estimates[order_id] = result
+            if now - state.last_sample >= ETA_SAMPLE_INTERVAL:
+                uber = order.driver_eta.timestamp() if order.driver_eta else None
+                state.samples.append((now, result.arrival, result.earliest, result.latest, uber))
+                state.last_sample = now
+
+        # An order that leaves the active list after pickup, and stays gone, has been delivered
+        for order_id, state in list(self._orders.items()):
+            if order_id in seen:
+                state.missing = 0
+                state.missing_since = None
+                continue
+            if state.missing_since is None:
+                state.missing_since = now
+            state.missing += 1
+            if state.missing >= ETA_MISSING_CYCLES:
+                self._finish(order_id, state.missing_since)
+        return estimates
+
+    def _finish(self, order_id: str, delivered_at: float) -> None:
+        state = self._orders.pop(order_id, None)
+        if state is None or not state.samples:
+            return
+        kinematic = [arrival - delivered_at for _, arrival, _, _, _ in state.samples]
+        uber = [eta - delivered_at for *_, eta in state.samples if eta is not None]
+        covered = sum(1 for _, _, earliest, latest, _ in state.samples if earliest <= delivered_at <= latest)
+        self._deliveries.append({
+            "order_id": order_id,
+            "delivered_at": _iso(delivered_at),
+            "samples": len(state.samples),
+            "estimate_errors_s": [round(error) for error in kinematic],
+            "uber_errors_s": [round(error) for error in uber],
+            "within_band": covered,
+        })
+
+    def accuracy(self) -> dict[str, Any]:
+        """Errors against actual delivery times over the last ETA_ACCURACY_WINDOW deliveries.
+
+        Errors are predicted minus actual arrival (positive: predicted late),
+        over every recorded prediction, in minutes.
+        """
+        kinematic = [error for d in self._deliveries for error in d["estimate_errors_s"]]
+        uber = [error for d in self._deliveries for error in d["uber_errors_s"]]
+        samples = sum(d["samples"] for d in self._deliveries)
+        return {
+            "deliveries": len(self._deliveries),
+            "samples": samples,
+            "estimate": _error_summary(kinematic),
+            "uber": _error_summary(uber),
+            "band_coverage": round(sum(d["within_band"] for d in self._deliveries) / samples, 3) if samples else None,
+            "last_delivery": self._deliveries[-1] if self._deliveries else None,
+        }
+
+
+def _error_summary(errors: list[float]) -> dict[str, float | None]:
+    if not errors:
+        return {"mae_min": None, "bias_min": None}
+    return {
+        "mae_min": round(sum(abs(error) for error in errors) / len(errors) / 60, 2),
+        "bias_min": round(sum(errors) / len(errors) / 60, 2),
+    }
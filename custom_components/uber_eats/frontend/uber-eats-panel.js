@@ -71,7 +71,8 @@ class UberEatsPanel extends HTMLElement {
     this._accounts = [];
     this._selectedAccount = null;
     this._currentView = "main"; // main, instructions, account-details
-    this._refreshInterval = null;
+    this._unsubAccounts = null;  // uber_eats/subscribe unsubscribe function
+    this._accountMap = {};  // entry_id -> latest pushed account data
     this._ttsEntities = { tts_entities: [], media_player_entities: [] };
     this._ttsSettings = null;
     this._automations = [];
@@ -79,6 +80,13 @@ class UberEatsPanel extends HTMLElement {
     this._integrationVersion = null;
     this._pastOrders = [];
     this._pastOrdersLoading = false;
+    this._pastOrdersQuery = this._defaultPastOrdersQuery();  // Filters/sort sent to get_past_orders
+    this._pastOrdersCursor = null;  // next_cursor of the last loaded page
+    this._pastOrdersTotal = 0;
+    this._pastOrdersRestaurants = [];
+    this._pastOrdersAsOf = null;  // Time of the server's last past-orders sync
+    this._pastOrdersRefreshing = false;  // Server is syncing past orders in background
+    this._pastOrdersRefreshTimer = null;
     this._accountStats = null;
     this._langEnabled = false;  // Temp flag for language toggle
     this._optEnabled = false;   // Temp flag for options toggle
@@ -86,14 +94,15 @@ class UberEatsPanel extends HTMLElement {
     this._playerOptsEnabled = {};  // Per-player options toggle
     this._expandedPlayers = {};  // Track which media player cards are expanded
     this._userProfile = null;  // User profile from getUserV1 API
+    this._trajectories = {};  // entry_id -> { order_id: [[lat, lon, ts], ...] } from get_trajectory
+    this._trajectoryFetches = {};  // entry_id -> in-flight get_trajectory promise
   }
 
   set hass(hass) {
     this._hass = hass;
     if (!this._initialized) {
       this._initialized = true;
-      this._loadAccounts();
-      this._startAutoRefresh();
+      this._subscribe();
     }
   }
 
@@ -104,32 +113,138 @@ class UberEatsPanel extends HTMLElement {
   connectedCallback() {
     this._render();
     this._attachCardClickDelegation();
+    if (this._initialized && !this._unsubAccounts) this._subscribe();
   }
 
   disconnectedCallback() {
-    this._stopAutoRefresh();
+    this._unsubscribe();
   }
 
-  _startAutoRefresh() {
-    this._refreshInterval = setInterval(async () => {
+  async _subscribe() {
+    if (!this._hass || this._unsubAccounts) return;
+    this._accountMap = {};
+    try {
+      // Server pushes a snapshot, then only the fields that changed per account
+      this._unsubAccounts = await this._hass.connection.subscribeMessage(
+        (event) => this._handleAccountsEvent(event),
+        { type: "uber_eats/subscribe" }
+      );
+    } catch (e) {
+      console.error("Failed to subscribe to Uber Eats updates:", e);
+      this._unsubAccounts = null;
       await this._loadAccounts();
-      if (this._currentView === "account-details" && this._selectedAccount?.entry_id) {
-        const details = await this._loadAccountDetails(this._selectedAccount.entry_id);
-        if (details) {
-          this._selectedAccount = details;
-          this._render();
-        }
+    }
+  }
+
+  _unsubscribe() {
+    if (this._unsubAccounts) {
+      this._unsubAccounts();
+      this._unsubAccounts = null;
+    }
+  }
+
+  _handleAccountsEvent(event) {
+    if (event.snapshot) {
+      this._accountMap = {};
+      for (const account of event.snapshot) this._accountMap[account.entry_id] = account;
+      if (event.version != null) this._integrationVersion = event.version;
+    }
+    for (const [entryId, fields] of Object.entries(event.changed || {})) {
+      this._accountMap[entryId] = { ...(this._accountMap[entryId] || {}), ...fields };
+    }
+    for (const entryId of event.removed || []) {
+      delete this._accountMap[entryId];
+      delete this._trajectories[entryId];
+    }
+    this._accounts = Object.values(this._accountMap);
+    this._refreshTrajectories(event.snapshot ? Object.keys(this._accountMap) : Object.keys(event.changed || {}));
+    const selectedId = this._selectedAccount?.entry_id;
+    if (this._currentView === "account-details" && selectedId && this._accountMap[selectedId]) {
+      const touched = event.snapshot || (event.changed && selectedId in event.changed);
+      if (!touched) return;
+      this._selectedAccount = { ...this._selectedAccount, ...this._accountMap[selectedId] };
+    }
+    this._render();
+  }
+
+  /** Re-fetch courier tracks for accounts whose orders have a driver; drop the rest. */
+  _refreshTrajectories(entryIds) {
+    for (const entryId of entryIds) {
+      const orders = this._accountMap[entryId]?.orders || [];
+      if (orders.some((o) => o.driver_location_coords)) {
+        this._fetchTrajectory(entryId);
+      } else if (this._trajectories[entryId]) {
+        delete this._trajectories[entryId];
+        this._updateRouteSketches(entryId);
       }
-    }, 15000);
+    }
+  }
+
+  async _fetchTrajectory(entryId) {
+    if (!this._hass || this._trajectoryFetches[entryId]) return;
+    this._trajectoryFetches[entryId] = this._hass.callWS({ type: "uber_eats/get_trajectory", entry_id: entryId });
+    try {
+      const result = await this._trajectoryFetches[entryId];
+      const tracks = {};
+      for (const [orderId, track] of Object.entries(result.orders || {})) tracks[orderId] = track.points || [];
+      this._trajectories[entryId] = tracks;
+      this._updateRouteSketches(entryId);
+    } catch (e) {
+      console.error("Failed to load courier trajectory:", e);
+    } finally {
+      delete this._trajectoryFetches[entryId];
+    }
   }
 
-  _stopAutoRefresh() {
-    if (this._refreshInterval) {
-      clearInterval(this._refreshInterval);
-      this._refreshInterval = null;
+  /** Redraw an account's route sketches in place, so the map iframes are not reloaded. */
+  _updateRouteSketches(entryId) {
+    const account = this._accountMap[entryId];
+    for (const el of this.shadowRoot.querySelectorAll(`.route-sketch[data-entry-id="${entryId}"]`)) {
+      const order = (account?.orders || []).find((o) => o.order_id === el.dataset.orderId);
+      const svg = order ? this._renderRouteSvg(this._trajectories[entryId]?.[order.order_id], order) : "";
+      el.innerHTML = svg;
+      el.style.display = svg ? "" : "none";
     }
   }
 
+  /**
+   * Courier track as a small SVG sketch, scaled to fit with the store and home.
+   * The card map is an OpenStreetMap embed, which cannot draw overlays itself.
+   */
+  _renderRouteSvg(points, order) {
+    if (!points || points.length < 2) return "";
+    const W = 96, H = 72, PAD = 6;
+    const marks = [order.store_location, order.home_location].filter((p) => p && p.lat != null && p.lon != null);
+    const lats = points.map((p) => p[0]).concat(marks.map((p) => p.lat));
+    const lons = points.map((p) => p[1]).concat(marks.map((p) => p.lon));
+    const minLat = Math.min(...lats), maxLat = Math.max(...lats);
+    const minLon = Math.min(...lons), maxLon = Math.max(...lons);
+    // Equirectangular: shrink longitude by cos(latitude) so the shape is not stretched
+    const kx = Math.cos(((minLat + maxLat) / 2) * Math.PI / 180);
+    const spanX = Math.max((maxLon - minLon) * kx, 1e-6);
+    const spanY = Math.max(maxLat - minLat, 1e-6);
+    const scale = Math.min((W - 2 * PAD) / spanX, (H - 2 * PAD) / spanY);
+    const offX = (W - spanX * scale) / 2, offY = (H - spanY * scale) / 2;
+    const xy = (lat, lon) => [
+      (offX + (lon - minLon) * kx * scale).toFixed(1),
+      (H - offY - (lat - minLat) * scale).toFixed(1),
+    ];
+    const line = points.map((p) => xy(p[0], p[1]).join(",")).join(" ");
+    const dot = (p, color, r) => {
+      const [x, y] = xy(p.lat, p.lon);
+      return `<circle cx="${x}" cy="${y}" r="${r}" fill="${color}" />`;
+    };
+    const last = points[points.length - 1];
+    return `
+      <svg viewBox="0 0 ${W} ${H}" width="${W}" height="${H}" aria-label="Courier route">
+        <polyline points="${line}" fill="none" stroke="#06C167" stroke-width="2" stroke-linejoin="round" stroke-linecap="round" />
+        ${order.store_location ? dot(order.store_location, "#ff9800", 3) : ""}
+        ${order.home_location ? dot(order.home_location, "#2196f3", 3) : ""}
+        ${dot({ lat: last[0], lon: last[1] }, "#fff", 3.5)}
+      </svg>
+    `;
+  }
+
   _attachCardClickDelegation() {
     if (this._cardClickHandler) {
       this.shadowRoot.removeEventListener("click", this._cardClickHandler);
@@ -337,6 +452,9 @@ class UberEatsPanel extends HTMLElement {
       if (settings.driver_nearby_automation_enabled != null) payload.driver_nearby_automation_enabled = settings.driver_nearby_automation_enabled;
       if (settings.driver_nearby_automation_entity != null) payload.driver_nearby_automation_entity = settings.driver_nearby_automation_entity || "";
       if (settings.driver_nearby_distance_feet != null) payload.driver_nearby_distance_feet = settings.driver_nearby_distance_feet;
+      if (settings.poll_interval_min != null) payload.poll_interval_min = settings.poll_interval_min;
+      if (settings.poll_interval_max != null) payload.poll_interval_max = settings.poll_interval_max;
+      if (settings.past_orders_freshness_minutes != null) payload.past_orders_freshness_minutes = settings.past_orders_freshness_minutes;
       await this._hass.callWS(payload);
       this._ttsSettings = settings;
     } catch (e) {
@@ -350,6 +468,14 @@ class UberEatsPanel extends HTMLElement {
     this._currentView = "main";
     this._pastOrders = [];
     this._pastOrdersLoading = false;
+    this._pastOrdersQuery = this._defaultPastOrdersQuery();
+    this._pastOrdersCursor = null;
+    this._pastOrdersTotal = 0;
+    this._pastOrdersRestaurants = [];
+    this._pastOrdersAsOf = null;
+    this._pastOrdersRefreshing = false;
+    clearTimeout(this._pastOrdersRefreshTimer);
+    this._pastOrdersRefreshTimer = null;
     this._accountStats = null;
     this._langEnabled = false;
     this._optEnabled = false;
@@ -912,6 +1038,17 @@ class UberEatsPanel extends HTMLElement {
           cursor: pointer;
         }
         
+        .route-sketch {
+          position: absolute;
+          bottom: 12px;
+          left: 12px;
+          z-index: 2;
+          background: rgba(0,0,0,0.85);
+          border-radius: 8px;
+          line-height: 0;
+          pointer-events: none;
+        }
+        
         .map-overlay {
           position: absolute;
           top: 12px;
@@ -2038,6 +2175,34 @@ class UberEatsPanel extends HTMLElement {
         @keyframes spin {
           to { transform: rotate(360deg); }
         }
+        .past-orders-filters {
+          display: flex;
+          flex-wrap: wrap;
+          gap: 8px;
+          margin-bottom: 16px;
+        }
+        .past-orders-filters select,
+        .past-orders-filters input[type="date"] {
+          flex: 1;
+          min-width: 140px;
+          padding: 8px 12px;
+          background: #111;
+          border: 2px solid #333;
+          border-radius: 8px;
+          color: #fff;
+          font-size: 13px;
+          color-scheme: dark;
+        }
+        .past-orders-as-of {
+          font-size: 12px;
+          color: #888;
+          margin: -8px 0 12px;
+        }
+        .past-orders-more {
+          display: flex;
+          justify-content: center;
+          margin-top: 16px;
+        }
         .past-orders-grid {
           display: grid;
           grid-template-columns: repeat(auto-fill, minmax(260px, 1fr));
@@ -2202,6 +2367,13 @@ class UberEatsPanel extends HTMLElement {
     `;
   }
 
+  /** ISO timestamp as local "h:mm AM". */
+  _formatClockTime(iso) {
+    const d = iso ? new Date(iso) : null;
+    if (!d || isNaN(d.getTime())) return "";
+    return d.toLocaleTimeString([], { hour: "numeric", minute: "2-digit" });
+  }
+
   /** Format phone for display: (XXX) XXX-XXXX */
   _formatDriverPhone(phone) {
     if (!phone || typeof phone !== "string") return "";
@@ -2227,6 +2399,7 @@ class UberEatsPanel extends HTMLElement {
     const lon = driverCoords.lon || order.driver_location_lon || (this._hass?.config?.longitude || 0);
     const mapUrl = this._getMapUrl(lat, lon, 0.001);
     const mapLabel = !noDriver ? "📍 Driver" : "🏠 Home";
+    const routeSvg = noDriver ? "" : this._renderRouteSvg(this._trajectories[account.entry_id]?.[order.order_id], order);
 
     const timelineSummary = (order.order_status || order.order_status_description || "").trim();
     const timelineDisplay = timelineSummary && timelineSummary !== "Unknown" && timelineSummary !== "No Active Order"
@@ -2237,6 +2410,10 @@ class UberEatsPanel extends HTMLElement {
       order.driver_eta_str && order.driver_eta_str !== "No ETA" && order.driver_eta_str !== "No ETA Available"
         ? order.driver_eta_str
         : "—";
+    // Arrival estimated from the courier's movement, shown next to Uber's ETA
+    const est = order.estimated_eta;
+    const estDisplay = est ? this._formatClockTime(est.arrival) : "";
+    const estRange = est ? `${this._formatClockTime(est.earliest)} – ${this._formatClockTime(est.latest)}` : "";
 
     const userPic = order.user_picture_url || account.user_picture_url;
     const driverPic = order.driver_picture_url;
@@ -2280,6 +2457,11 @@ class UberEatsPanel extends HTMLElement {
               <span class="card-oneline-sep">·</span>
               <span class="card-oneline-label">ETA:</span>
               <span class="card-oneline-value">${esc(etaDisplay)}</span>
+              ${estDisplay ? `
+              <span class="card-oneline-sep">·</span>
+              <span class="card-oneline-label">Est.:</span>
+              <span class="card-oneline-value" title="Estimated from the driver's movement (${esc(estRange)})">${esc(estDisplay)}</span>
+              ` : ""}
             </div>
             <div class="card-timeline">${esc(timelineDisplay)}</div>
             <div class="card-stage-progress" title="Preparing → Picked up → En route → Arriving">
@@ -2295,6 +2477,7 @@ class UberEatsPanel extends HTMLElement {
               <iframe src="${mapUrl}" title="Location Map"></iframe>
               <div class="card-map-click-overlay" aria-hidden="true"></div>
               <div class="map-overlay">${mapLabel}</div>
+              <div class="route-sketch" data-entry-id="${account.entry_id}" data-order-id="${esc(order.order_id)}" style="${routeSvg ? "" : "display:none"}">${routeSvg}</div>
             ` : `
               <div style="display:flex;align-items:center;justify-content:center;height:100%;color:#555;font-size:13px;">
                 Map unavailable
@@ -2513,6 +2696,9 @@ class UberEatsPanel extends HTMLElement {
       driver_nearby_automation_enabled: false,
       driver_nearby_automation_entity: "",
       driver_nearby_distance_feet: 200,
+      poll_interval_min: 5,
+      poll_interval_max: 300,
+      past_orders_freshness_minutes: 15,
     };
     const enabled = !!settings.tts_enabled;
     const ttsList = this._ttsEntities?.tts_entities || [];
@@ -2535,6 +2721,9 @@ class UberEatsPanel extends HTMLElement {
     const driverNearbyEnabled = !!settings.driver_nearby_automation_enabled;
     const driverAutomationEntity = settings.driver_nearby_automation_entity || "";
     const driverNearbyDistance = Math.max(50, Math.min(2000, parseInt(settings.driver_nearby_distance_feet, 10) || 200));
+    const pollMin = Math.max(5, Math.min(60, parseInt(settings.poll_interval_min, 10) || 5));
+    const pollMax = Math.max(60, Math.min(900, parseInt(settings.poll_interval_max, 10) || 300));
+    const pastOrdersFreshness = Math.max(1, Math.min(1440, parseInt(settings.past_orders_freshness_minutes, 10) || 15));
     const automations = this._automations || [];
     const collapsed = this._advancedSettingsCollapsed;
 
@@ -2686,6 +2875,21 @@ class UberEatsPanel extends HTMLElement {
                 </select>
               </div>
             </div>
+            <div class="driver-nearby-block">
+              <div class="driver-nearby-title">Polling</div>
+              <div class="tts-field">
+                <label>Fastest update interval (seconds, near delivery)</label>
+                <input type="number" id="poll-interval-min" min="5" max="60" value="${pollMin}" data-entry-id="${acc.entry_id}" />
+              </div>
+              <div class="tts-field">
+                <label>Slowest update interval (seconds, no active order)</label>
+                <input type="number" id="poll-interval-max" min="60" max="900" value="${pollMax}" data-entry-id="${acc.entry_id}" />
+              </div>
+              <div class="tts-field">
+                <label>Refresh past orders when older than (minutes)</label>
+                <input type="number" id="past-orders-freshness" min="1" max="1440" value="${pastOrdersFreshness}" data-entry-id="${acc.entry_id}" />
+              </div>
+            </div>
           </div>
         </div>
       </div>
@@ -2813,16 +3017,65 @@ class UberEatsPanel extends HTMLElement {
     `;
   }
 
+  _defaultPastOrdersQuery() {
+    const year = new Date().getFullYear();
+    return {
+      start_date: `${year}-01-01`,
+      end_date: `${year}-12-31`,
+      restaurant: "",
+      cancelled: "",
+      sort: "date_desc",
+    };
+  }
+
+  _renderPastOrdersFilters() {
+    const q = this._pastOrdersQuery;
+    const restaurantOptions = (this._pastOrdersRestaurants || []).map((r) => {
+      const selected = r.store_uuid === q.restaurant ? "selected" : "";
+      return `<option value="${this._escapeHtml(r.store_uuid)}" ${selected}>${this._escapeHtml(r.name)} (${r.order_count})</option>`;
+    }).join("");
+    const sortOptions = [
+      ["date_desc", "Newest first"],
+      ["date_asc", "Oldest first"],
+      ["total_desc", "Highest total"],
+      ["total_asc", "Lowest total"],
+    ].map(([value, label]) => `<option value="${value}" ${q.sort === value ? "selected" : ""}>${label}</option>`).join("");
+    return `
+      <div class="past-orders-filters">
+        <input type="date" id="past-orders-start" value="${this._escapeHtml(q.start_date || "")}" />
+        <input type="date" id="past-orders-end" value="${this._escapeHtml(q.end_date || "")}" />
+        <select id="past-orders-restaurant">
+          <option value="">All restaurants</option>
+          ${restaurantOptions}
+        </select>
+        <select id="past-orders-cancelled">
+          <option value="" ${q.cancelled === "" ? "selected" : ""}>All orders</option>
+          <option value="false" ${q.cancelled === "false" ? "selected" : ""}>Completed</option>
+          <option value="true" ${q.cancelled === "true" ? "selected" : ""}>Cancelled</option>
+        </select>
+        <select id="past-orders-sort">${sortOptions}</select>
+      </div>
+    `;
+  }
+
+  _renderPastOrdersAsOf() {
+    if (!this._pastOrdersAsOf && !this._pastOrdersRefreshing) return "";
+    const asOf = this._pastOrdersAsOf ? `As of ${this._escapeHtml(new Date(this._pastOrdersAsOf).toLocaleString())}` : "";
+    const refreshing = this._pastOrdersRefreshing ? `${asOf ? " · " : ""}Refreshing…` : "";
+    return `<div class="past-orders-as-of">${asOf}${refreshing}</div>`;
+  }
+
   _renderPastOrdersSection(acc) {
     const isLoading = this._pastOrdersLoading;
     const orders = this._pastOrders || [];
-    const stats = this._accountStats;
-    const year = stats?.year || new Date().getFullYear();
+    const total = this._pastOrdersTotal || 0;
+    const filtersHtml = this._renderPastOrdersFilters();
 
-    if (isLoading) {
+    if (isLoading && orders.length === 0) {
       return `
         <div class="past-orders-section">
-          <div class="section-title">Past Orders (${year})</div>
+          <div class="section-title">Past Orders</div>
+          ${filtersHtml}
           <div class="past-orders-loading">
             <div class="loading-spinner"></div>
             <span>Loading past orders...</span>
@@ -2834,9 +3087,10 @@ class UberEatsPanel extends HTMLElement {
     if (orders.length === 0) {
       return `
         <div class="past-orders-section">
-          <div class="section-title">Past Orders (${year})</div>
+          <div class="section-title">Past Orders</div>
+          ${filtersHtml}
           <div class="past-orders-empty">
-            <span>No past orders found for ${year}</span>
+            <span>No past orders match these filters</span>
           </div>
         </div>
       `;
@@ -2920,48 +3174,89 @@ class UberEatsPanel extends HTMLElement {
       `;
     }).join("");
 
+    const loadMoreHtml = this._pastOrdersCursor ? `
+        <div class="past-orders-more">
+          <button class="btn btn-secondary" id="past-orders-more-btn" ${isLoading ? "disabled" : ""}>
+            ${isLoading ? "Loading..." : "Load more"}
+          </button>
+        </div>
+      ` : "";
+
     return `
       <div class="past-orders-section">
-        <div class="section-title">Past Orders (${year})</div>
+        <div class="section-title">Past Orders (${orders.length} of ${total})</div>
+        ${this._renderPastOrdersAsOf()}
+        ${filtersHtml}
         <div class="past-orders-grid">
           ${orderCardsHtml}
         </div>
+        ${loadMoreHtml}
       </div>
     `;
   }
 
-  async _fetchPastOrders(entryId) {
+  async _fetchPastOrders(entryId, append = false) {
     if (!this._hass || !entryId) return;
+    if (append && !this._pastOrdersCursor) return;
     
-    // Backend handles caching - returns cached data instantly if available
-    // Show loading indicator only briefly (backend may return cached data immediately)
+    // Backend serves one page from its history store (refreshing in background)
     this._pastOrdersLoading = true;
     this._render();
     
+    const q = this._pastOrdersQuery;
+    const request = {
+      type: "uber_eats/get_past_orders",
+      entry_id: entryId,
+      sort: q.sort,
+    };
+    if (q.start_date) request.start_date = q.start_date;
+    if (q.end_date) request.end_date = q.end_date;
+    if (q.restaurant) request.restaurant = q.restaurant;
+    if (q.cancelled !== "") request.cancelled = q.cancelled === "true";
+    if (append) request.cursor = this._pastOrdersCursor;
+    
     try {
-      const result = await this._hass.callWS({
-        type: "uber_eats/get_past_orders",
-        entry_id: entryId,
-      });
+      const result = await this._hass.callWS(request);
       
-      this._pastOrders = result.orders || [];
+      this._pastOrders = append ? [...this._pastOrders, ...(result.orders || [])] : (result.orders || []);
+      this._pastOrdersCursor = result.next_cursor || null;
+      this._pastOrdersTotal = result.total || 0;
+      if (result.restaurants) this._pastOrdersRestaurants = result.restaurants;
       this._accountStats = result.statistics || null;
+      this._pastOrdersAsOf = result.as_of || null;
+      this._pastOrdersRefreshing = !!result.refreshing;
       
-      // If from_cache is true, backend is refreshing in background
-      // Data will be fresh on next fetch
-      if (result.from_cache) {
-        console.debug("Loaded past orders from server cache, background refresh in progress");
+      // Backend is syncing in background: reload the first page once it has had time to finish
+      clearTimeout(this._pastOrdersRefreshTimer);
+      this._pastOrdersRefreshTimer = null;
+      if (result.refreshing && !append) {
+        this._pastOrdersRefreshTimer = setTimeout(() => {
+          this._pastOrdersRefreshTimer = null;
+          if (this._selectedAccount?.entry_id === entryId) this._fetchPastOrders(entryId);
+        }, 10000);
       }
     } catch (err) {
       console.error("Failed to fetch past orders:", err);
-      this._pastOrders = [];
-      this._accountStats = null;
+      if (!append) {
+        this._pastOrders = [];
+        this._pastOrdersCursor = null;
+        this._pastOrdersTotal = 0;
+        this._accountStats = null;
+      }
     } finally {
       this._pastOrdersLoading = false;
       this._render();
     }
   }
 
+  _setPastOrdersFilter(key, value) {
+    if (this._pastOrdersQuery[key] === value) return;
+    this._pastOrdersQuery = { ...this._pastOrdersQuery, [key]: value };
+    this._pastOrdersCursor = null;
+    this._pastOrders = [];
+    this._fetchPastOrders(this._selectedAccount?.entry_id);
+  }
+
   async _fetchUserProfile(entryId) {
     if (!this._hass || !entryId) return;
     try {
@@ -3019,6 +3314,25 @@ class UberEatsPanel extends HTMLElement {
       backBtn.addEventListener("click", () => this._goBack());
     }
 
+    // Past orders filters and paging
+    const pastOrderFilters = {
+      "#past-orders-start": "start_date",
+      "#past-orders-end": "end_date",
+      "#past-orders-restaurant": "restaurant",
+      "#past-orders-cancelled": "cancelled",
+      "#past-orders-sort": "sort",
+    };
+    for (const [selector, key] of Object.entries(pastOrderFilters)) {
+      const input = this.shadowRoot.querySelector(selector);
+      if (input) {
+        input.addEventListener("change", (e) => this._setPastOrdersFilter(key, e.target.value));
+      }
+    }
+    const moreBtn = this.shadowRoot.querySelector("#past-orders-more-btn");
+    if (moreBtn) {
+      moreBtn.addEventListener("click", () => this._fetchPastOrders(this._selectedAccount?.entry_id, true));
+    }
+
     // Whole card click (main page) – open account details; direct attach so it works after go-back
     this.shadowRoot.querySelectorAll(".account-card").forEach((card) => {
       const entryId = card.getAttribute("data-entry-id") || card.dataset.entryId;
@@ -3487,6 +3801,23 @@ class UberEatsPanel extends HTMLElement {
       driverNearbyDistanceInput.addEventListener("change", saveDistance);
       driverNearbyDistanceInput.addEventListener("blur", saveDistance);
     }
+
+    // Adaptive polling bounds (seconds) and past-orders freshness window (minutes)
+    [["#poll-interval-min", "poll_interval_min", 5, 60], ["#poll-interval-max", "poll_interval_max", 60, 900], ["#past-orders-freshness", "past_orders_freshness_minutes", 1, 1440]].forEach(([selector, key, lo, hi]) => {
+      const input = this.shadowRoot.querySelector(selector);
+      if (!input) return;
+      const savePoll = () => {
+        const v = parseInt(input.value, 10);
+        if (Number.isNaN(v)) return;
+        const clamped = Math.max(lo, Math.min(hi, v));
+        if (this._ttsSettings && this._ttsSettings[key] === clamped) return;
+        const entryId = input.dataset.entryId;
+        const settings = { ...this._ttsSettings, [key]: clamped };
+        this._saveTtsSettings(entryId, settings).then(() => this._render());
+      };
+      input.addEventListener("change", savePoll);
+      input.addEventListener("blur", savePoll);
+    });
   }
 }
 
@@ -0,0 +1,24 @@
+"""Distance helpers for courier positions (degrees in, metres out)."""
+from __future__ import annotations
+
+import math
+
+EARTH_RADIUS_M = 6371000.0
+FEET_PER_M = 3.28084
+M_PER_DEG_LAT = EARTH_RADIUS_M * math.pi / 180
+
+
+def equirectangular_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Flat-earth approximation; within a fraction of a metre over a few kilometres."""
+    mean_lat = math.radians((lat1 + lat2) / 2)
+    x = math.radians(lon2 - lon1) * math.cos(mean_lat)
+    y = math.radians(lat2 - lat1)
+    return EARTH_RADIUS_M * math.hypot(x, y)
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance."""
+    d_lat = math.radians(lat2 - lat1)
+    d_lon = math.radians(lon2 - lon1)
+    a = math.sin(d_lat / 2) ** 2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(d_lon / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(min(1.0, a)))
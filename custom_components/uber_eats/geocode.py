@@ -0,0 +1,246 @@
+"""Reverse-geocode cache for driver, store and home locations.
+
+Nominatim lookups are keyed by geohash cell, so a driver who has not left the
+cell (or the fixed STORE/EATER fallback point) is answered from memory. Entries
+expire after a TTL and are evicted least-recently-used; store and home lookups
+never expire. Concurrent lookups for the same cell share one request, and the
+cache is persisted with Home Assistant's storage helper so it survives restarts.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DATA_GEOCODE_CACHE,
+    GEOCODE_CACHE_MAX_ENTRIES,
+    GEOCODE_CACHE_MAX_PERMANENT,
+    GEOCODE_CACHE_PRECISION,
+    GEOCODE_CACHE_SAVE_DELAY,
+    GEOCODE_CACHE_STORAGE_KEY,
+    GEOCODE_CACHE_STORAGE_VERSION,
+    GEOCODE_CACHE_TTL,
+    NOMINATIM_REVERSE_URL,
+)
+from .decode import json_loads
+from .http_client import async_get_http_client
+
+_LOGGER = logging.getLogger(__name__)
+
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_LEGACY_PLACEHOLDER = "No Driver Assigned"  # older caches stored this for missing components
+
+
+def _strip_placeholders(result: dict[str, str | None]) -> dict[str, str | None]:
+    """Map the legacy placeholder in a stored result to None."""
+    return {key: (None if value == _LEGACY_PLACEHOLDER else value) for key, value in result.items()}
+
+
+def geohash_encode(lat: float, lon: float, precision: int = GEOCODE_CACHE_PRECISION) -> str:
+    """Encode a coordinate as a geohash string of the given length."""
+    lat_lo, lat_hi = -90.0, 90.0
+    lon_lo, lon_hi = -180.0, 180.0
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        if even:
+            mid = (lon_lo + lon_hi) / 2
+            if lon >= mid:
+                bits = (bits << 1) | 1
+                lon_lo = mid
+            else:
+                bits <<= 1
+                lon_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                bits = (bits << 1) | 1
+                lat_lo = mid
+            else:
+                bits <<= 1
+                lat_hi = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+async def _async_fetch_reverse_geocode(session, lat: float, lon: float) -> dict[str, str]:
+    """
+    Return dict with location components we keep:
+    road, suburb, quarter, county, address
+    """
+    url = (
+        f"{NOMINATIM_REVERSE_URL}"
+        f"?format=json&lat={lat}&lon={lon}&zoom=17&addressdetails=1&accept-language=en"
+    )
+    headers = {"User-Agent": "UberEatsHAIntegration/1.0"}
+    try:
+        async with session.get(url, headers=headers) as resp:
+            if resp.status != 200:
+                return {}
+            data = json_loads(await resp.read())
+            addr = data.get("address", {}) or {}
+            # Missing components are None; ParsedOrder.as_dict() supplies placeholders
+            return {
+                "road":     addr.get("road") or addr.get("pedestrian") or addr.get("footway"),
+                "suburb":   addr.get("suburb"),
+                "quarter":  addr.get("quarter"),
+                "county":   addr.get("county"),
+                "address":  data.get("display_name"),
+            }
+    except Exception as e:
+        _LOGGER.debug("Reverse geocode failed: %s", e)
+        return {}
+
+
+class GeocodeCache:
+    """LRU + TTL reverse-geocode cache shared by all accounts."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._store: Store = Store(hass, GEOCODE_CACHE_STORAGE_VERSION, GEOCODE_CACHE_STORAGE_KEY)
+        # cell -> (result, expires_at); expiring entries in LRU order
+        self._entries: OrderedDict[str, tuple[dict[str, str], float]] = OrderedDict()
+        # cell -> result; store/home lookups, never expire
+        self._permanent: OrderedDict[str, dict[str, str]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and cache sizes."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self._entries),
+            "permanent_entries": len(self._permanent),
+        }
+
+    async def _async_ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                stored = await self._store.async_load() or {}
+            except Exception as e:
+                _LOGGER.warning("Failed to load geocode cache: %s", e)
+                stored = {}
+            now = time.time()
+            for key, result in (stored.get("permanent") or {}).items():
+                self._permanent[key] = _strip_placeholders(result)
+            for key, (result, expires_at) in (stored.get("entries") or {}).items():
+                if expires_at > now:
+                    self._entries[key] = (_strip_placeholders(result), expires_at)
+            self._loaded = True
+            _LOGGER.debug("Loaded geocode cache: %s", self.stats)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "permanent": dict(self._permanent),
+            "entries": {key: [result, expires_at] for key, (result, expires_at) in self._entries.items()},
+        }
+
+    def _get(self, key: str) -> dict[str, str] | None:
+        result = self._permanent.get(key)
+        if result is not None:
+            self._permanent.move_to_end(key)
+            return result
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        result, expires_at = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def _put(self, key: str, result: dict[str, str], permanent: bool) -> None:
+        if permanent:
+            self._entries.pop(key, None)
+            self._permanent[key] = result
+            self._permanent.move_to_end(key)
+            while len(self._permanent) > GEOCODE_CACHE_MAX_PERMANENT:
+                self._permanent.popitem(last=False)
+        else:
+            self._entries[key] = (result, time.time() + GEOCODE_CACHE_TTL)
+            self._entries.move_to_end(key)
+            while len(self._entries) > GEOCODE_CACHE_MAX_ENTRIES:
+                self._entries.popitem(last=False)
+        self._store.async_delay_save(self._data_to_save, GEOCODE_CACHE_SAVE_DELAY)
+
+    async def async_lookup(self, lat: float, lon: float, permanent: bool = False) -> dict[str, str]:
+        """Reverse geocode a coordinate, serving repeats from the cache.
+
+        Set permanent for fixed points (store, home) so they are never expired.
+        """
+        result, _cached = await self.async_lookup_cached(lat, lon, permanent)
+        return result
+
+    async def async_lookup_cached(
+        self, lat: float, lon: float, permanent: bool = False
+    ) -> tuple[dict[str, str], bool]:
+        """Like async_lookup, also returning whether no new request was needed."""
+        await self._async_ensure_loaded()
+        key = geohash_encode(lat, lon)
+        cached = self._get(key)
+        if cached is not None:
+            self.hits += 1
+            if permanent and key not in self._permanent:
+                self._put(key, cached, True)
+            return cached, True
+
+        task = self._inflight.get(key)
+        if task is not None:
+            # Same cell already being fetched by another order/account
+            self.coalesced += 1
+            self.hits += 1
+            return await asyncio.shield(task), True
+
+        self.misses += 1
+        task = self._hass.async_create_task(self._async_fetch(key, lat, lon, permanent))
+        self._inflight[key] = task
+        return await asyncio.shield(task), False
+
+    async def _async_fetch(self, key: str, lat: float, lon: float, permanent: bool) -> dict[str, str]:
+        try:
+            session = async_get_http_client(self._hass).session
+            result = await _async_fetch_reverse_geocode(session, lat, lon)
+            # Failed lookups are not cached so the next poll retries
+            if result:
+                self._put(key, result, permanent)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+
+@callback
+def async_get_geocode_cache(hass: HomeAssistant) -> GeocodeCache:
+    """Return the integration-wide geocode cache, creating it if needed."""
+    cache: GeocodeCache | None = hass.data.get(DATA_GEOCODE_CACHE)
+    if cache is None:
+        cache = GeocodeCache(hass)
+        hass.data[DATA_GEOCODE_CACHE] = cache
+    return cache
@@ -0,0 +1,169 @@
+"""Geofences for the courier of each active order.
+
+Two kinds of zone: named rings around the order's delivery point
+(GEOFENCE_RINGS) and Home Assistant zone.* entities. Every ring shares one
+centre, so each order costs one equirectangular distance for all rings; HA
+zones are first rejected on latitude alone. Only a distance within
+GEOFENCE_REFINE_MARGIN_M of a boundary is recomputed with haversine.
+
+Each order keeps the set of zones its courier is inside. A courier enters at
+the radius but only exits past radius + hysteresis, so one that hovers at
+the edge does not flap. The engine returns the enter/exit events and a
+per-zone status, which the coordinator publishes for the driver-nearby
+binary sensors.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable, NamedTuple
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    GEOFENCE_HYSTERESIS_FEET,
+    GEOFENCE_HYSTERESIS_RATIO,
+    GEOFENCE_REFINE_MARGIN_M,
+    GEOFENCE_RINGS,
+)
+from .geo import FEET_PER_M, M_PER_DEG_LAT, equirectangular_m, haversine_m
+from .models import ParsedOrder
+
+ENTER = "enter"
+EXIT = "exit"
+
+
+class Zone(NamedTuple):
+    """A circle; rings have no centre of their own (they follow the delivery point)."""
+
+    zone_id: str  # ring id or zone entity id
+    name: str
+    radius_m: float
+    hysteresis_m: float
+    latitude: float | None = None
+    longitude: float | None = None
+
+
+class GeofenceEvent(NamedTuple):
+    order_id: str
+    zone_id: str
+    zone_name: str
+    event: str  # ENTER or EXIT
+    distance_m: float
+
+
+def make_zone(zone_id: str, name: str, radius_m: float, latitude: float | None = None, longitude: float | None = None) -> Zone:
+    hysteresis = max(GEOFENCE_HYSTERESIS_FEET / FEET_PER_M, radius_m * GEOFENCE_HYSTERESIS_RATIO)
+    return Zone(zone_id, name, radius_m, hysteresis, latitude, longitude)
+
+
+def ring_zones(nearby_feet: float) -> list[Zone]:
+    """The named rings, with the nearby ring at the configured distance."""
+    return [
+        make_zone(ring_id, name, (feet if feet is not None else nearby_feet) / FEET_PER_M)
+        for ring_id, name, feet in GEOFENCE_RINGS
+    ]
+
+
+def ha_zones(hass: HomeAssistant) -> list[Zone]:
+    """Active zone.* entities."""
+    zones = []
+    for state in hass.states.async_all("zone"):
+        attrs = state.attributes
+        if attrs.get("passive") or attrs.get("latitude") is None or attrs.get("longitude") is None:
+            continue
+        zones.append(make_zone(
+            state.entity_id,
+            attrs.get("friendly_name") or state.entity_id,
+            float(attrs.get("radius") or 0),
+            float(attrs["latitude"]),
+            float(attrs["longitude"]),
+        ))
+    return zones
+
+
+class GeofenceEngine:
+    """Zone membership of one account's couriers."""
+
+    def __init__(self) -> None:
+        self._inside: dict[str, set[str]] = {}  # order id -> zone ids the courier is in
+        self.checks = 0
+        self.prefiltered = 0  # rejected on latitude alone
+        self.refined = 0  # re-checked with haversine
+
+    def update(self, orders: Iterable[ParsedOrder], zones: list[Zone]) -> tuple[list[GeofenceEvent], dict[str, Any]]:
+        """Check every courier against every zone; return (events, status)."""
+        events: list[GeofenceEvent] = []
+        status = {
+            zone.zone_id: {"name": zone.name, "radius_m": round(zone.radius_m), "orders": [], "distance_m": None}
+            for zone in zones
+        }
+        nearest = None
+        zone_ids = set(status)
+        tracked = set()
+        for order in orders:
+            coords = order.driver_coords
+            if not order.order_id or coords is None:
+                continue
+            tracked.add(order.order_id)
+            inside = self._inside.setdefault(order.order_id, set())
+            inside &= zone_ids  # forget zones that were removed
+            lat, lon = coords
+            home = order.home_location or {}
+            center = None
+            home_distance = None
+            if home.get("lat") is not None and home.get("lon") is not None:
+                center = (float(home["lat"]), float(home["lon"]))
+                home_distance = equirectangular_m(lat, lon, *center)
+                nearest = home_distance if nearest is None else min(nearest, home_distance)
+
+            for zone in zones:
+                was_inside = zone.zone_id in inside
+                boundary = zone.radius_m + zone.hysteresis_m if was_inside else zone.radius_m
+                self.checks += 1
+                if zone.latitude is None:
+                    if center is None:
+                        continue
+                    zone_center, distance = center, home_distance
+                else:
+                    zone_center = (zone.latitude, zone.longitude)
+                    if abs(lat - zone.latitude) * M_PER_DEG_LAT > boundary + GEOFENCE_REFINE_MARGIN_M:
+                        self.prefiltered += 1
+                        is_inside = False
+                        distance = None
+                    else:
+                        distance = equirectangular_m(lat, lon, *zone_center)
+                if distance is not None:
+                    if abs(distance - boundary) <= GEOFENCE_REFINE_MARGIN_M:
+                        self.refined += 1
+                        distance = haversine_m(lat, lon, *zone_center)
+                    is_inside = distance <= boundary
+                    zone_status = status[zone.zone_id]
+                    if zone_status["distance_m"] is None or distance < zone_status["distance_m"]:
+                        zone_status["distance_m"] = round(distance)
+                if is_inside:
+                    status[zone.zone_id]["orders"].append(order.order_id)
+                if is_inside != was_inside:
+                    if is_inside:
+                        inside.add(zone.zone_id)
+                    else:
+                        inside.discard(zone.zone_id)
+                    events.append(GeofenceEvent(
+                        order.order_id,
+                        zone.zone_id,
+                        zone.name,
+                        ENTER if is_inside else EXIT,
+                        distance if distance is not None else abs(lat - zone.latitude) * M_PER_DEG_LAT,
+                    ))
+
+        # Orders that are gone, or lost their courier, start over
+        for order_id in [order_id for order_id in self._inside if order_id not in tracked]:
+            del self._inside[order_id]
+        return events, {"zones": status, "nearest_m": round(nearest) if nearest is not None else None}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "tracked_orders": len(self._inside),
+            "checks": self.checks,
+            "prefiltered": self.prefiltered,
+            "refined": self.refined,
+        }
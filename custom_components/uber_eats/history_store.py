@@ -0,0 +1,399 @@
+"""SQLite-backed past-order history.
+
+Past orders live in one embedded database under Home Assistant's .storage
+directory (so HACS upgrades do not wipe them), with one table per account
+indexed on completed_at, store_uuid, is_cancelled and total. Range and page
+queries read only the rows they need, so years of history for several accounts
+never have to be held in memory. All SQLite work runs in the executor.
+"""
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import Any, Iterable, Iterator
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import DATA_HISTORY_STORE, HISTORY_DB_FILENAME
+
+_LOGGER = logging.getLogger(__name__)
+
+# Normalized order dict keys (see past_orders.normalize_order) -> SQLite column types
+_COLUMNS: dict[str, str] = {
+    "uuid": "TEXT PRIMARY KEY",
+    "store_uuid": "TEXT NOT NULL DEFAULT ''",
+    "restaurant_name": "TEXT",
+    "hero_image_url": "TEXT",
+    "date": "TEXT",
+    "completed_at": "TEXT NOT NULL DEFAULT ''",
+    "subtotal": "REAL NOT NULL DEFAULT 0",
+    "delivery_fee": "REAL NOT NULL DEFAULT 0",
+    "tax": "REAL NOT NULL DEFAULT 0",
+    "promotions": "REAL NOT NULL DEFAULT 0",
+    "total": "REAL NOT NULL DEFAULT 0",
+    "store_address": "TEXT",
+    "store_rating": "TEXT",
+    "is_cancelled": "INTEGER NOT NULL DEFAULT 0",
+}
+_COLUMN_NAMES = tuple(_COLUMNS)
+
+# Sort key -> (column, direction); every sort has an index and uses uuid as tie-breaker
+SORT_KEYS: dict[str, tuple[str, str]] = {
+    "date_desc": ("completed_at", "DESC"),
+    "date_asc": ("completed_at", "ASC"),
+    "total_desc": ("total", "DESC"),
+    "total_asc": ("total", "ASC"),
+}
+DEFAULT_SORT = "date_desc"
+
+
+def _table_name(entry_id: str) -> str:
+    return "orders_" + re.sub(r"\W", "_", entry_id)
+
+
+def _order_to_row(order: dict[str, Any]) -> tuple:
+    row = []
+    for key in _COLUMN_NAMES:
+        value = order.get(key)
+        if key == "is_cancelled":
+            value = 1 if value else 0
+        elif key == "store_rating" and value is not None:
+            value = json.dumps(value)  # rating shape varies (number or object)
+        elif value is None and _COLUMNS[key].startswith("REAL"):
+            value = 0
+        elif value is None and "NOT NULL" in _COLUMNS[key]:
+            value = ""
+        row.append(value)
+    return tuple(row)
+
+
+def _encode_cursor(sort_value: Any, uuid: str) -> str:
+    raw = json.dumps([sort_value, uuid], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[Any, str] | None:
+    try:
+        sort_value, uuid = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        return None
+    return sort_value, str(uuid)
+
+
+def _row_to_order(row: sqlite3.Row) -> dict[str, Any]:
+    order = {key: row[key] for key in row.keys() if key in _COLUMNS}
+    if "is_cancelled" in order:
+        order["is_cancelled"] = bool(order["is_cancelled"])
+    rating = order.get("store_rating")
+    if rating is not None:
+        try:
+            order["store_rating"] = json.loads(rating)
+        except ValueError:
+            pass
+    return order
+
+
+class PastOrderStore:
+    """Embedded SQLite store for past orders of all accounts.
+
+    Methods prefixed with async_ are safe to call from the event loop; the
+    others are blocking and run in the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._path = hass.config.path(STORAGE_DIR, HISTORY_DB_FILENAME)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._tables: set[str] = set()
+
+    # ---------- Blocking helpers (executor) ----------
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_meta ("
+                "entry_id TEXT PRIMARY KEY, last_full_sync REAL NOT NULL DEFAULT 0, "
+                "last_sync REAL NOT NULL DEFAULT 0)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _ensure_table(self, entry_id: str) -> str:
+        table = _table_name(entry_id)
+        if table in self._tables:
+            return table
+        conn = self._connection()
+        columns = ", ".join(f"{name} {decl}" for name, decl in _COLUMNS.items())
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns})")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_completed_at ON {table} (completed_at)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_store_uuid ON {table} (store_uuid)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_cancelled ON {table} (is_cancelled, completed_at)")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_total ON {table} (total)")
+        conn.commit()
+        self._tables.add(table)
+        return table
+
+    def upsert_orders(self, entry_id: str, orders: Iterable[dict[str, Any]]) -> int:
+        """Insert or update orders; return the number of rows written."""
+        rows = [_order_to_row(order) for order in orders if order.get("uuid")]
+        if not rows:
+            return 0
+        with self._lock:
+            table = self._ensure_table(entry_id)
+            conn = self._connection()
+            placeholders = ", ".join("?" for _ in _COLUMN_NAMES)
+            with conn:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {table} ({', '.join(_COLUMN_NAMES)}) VALUES ({placeholders})",
+                    rows,
+                )
+        return len(rows)
+
+    def prune_orders(self, entry_id: str, keep_uuids: set[str]) -> list[dict[str, Any]]:
+        """Delete every order not in keep_uuids (after a complete crawl); return the deleted orders."""
+        with self._lock:
+            table = self._ensure_table(entry_id)
+            cur = self._connection().execute(f"SELECT uuid FROM {table}")
+            stale = [row["uuid"] for row in cur if row["uuid"] not in keep_uuids]
+        removed = self.orders_by_uuid(entry_id, stale)
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                for i in range(0, len(stale), 500):
+                    chunk = stale[i:i + 500]
+                    conn.execute(f"DELETE FROM {table} WHERE uuid IN ({', '.join('?' for _ in chunk)})", chunk)
+        return removed
+
+    def recent_uuids(self, entry_id: str, limit: int) -> set[str]:
+        """Return the uuids of the most recently completed orders."""
+        with self._lock:
+            table = self._ensure_table(entry_id)
+            cur = self._connection().execute(
+                f"SELECT uuid FROM {table} ORDER BY completed_at DESC LIMIT ?", (limit,)
+            )
+            return {row["uuid"] for row in cur}
+
+    def count(self, entry_id: str) -> int:
+        """Return the number of stored orders for an account."""
+        with self._lock:
+            table = self._ensure_table(entry_id)
+            return self._connection().execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def orders_between(
+        self, entry_id: str, start: str | None = None, end: str | None = None, batch_size: int = 500
+    ) -> Iterator[dict[str, Any]]:
+        """Yield orders with start <= completed_at < end, newest first.
+
+        Rows are read batch_size at a time (keyset on completed_at, uuid), so
+        only one batch is in memory and the lock is not held between batches.
+        """
+        clauses, params = [], []
+        if start:
+            clauses.append("completed_at >= ?")
+            params.append(start)
+        if end:
+            clauses.append("completed_at < ?")
+            params.append(end)
+        after = None
+        while True:
+            page_clauses, page_params = list(clauses), list(params)
+            if after is not None:
+                page_clauses.append("(completed_at, uuid) < (?, ?)")
+                page_params.extend(after)
+            where = f"WHERE {' AND '.join(page_clauses)}" if page_clauses else ""
+            with self._lock:
+                table = self._ensure_table(entry_id)
+                rows = self._connection().execute(
+                    f"SELECT * FROM {table} {where} ORDER BY completed_at DESC, uuid DESC LIMIT ?",
+                    (*page_params, batch_size),
+                ).fetchall()
+            for row in rows:
+                yield _row_to_order(row)
+            if len(rows) < batch_size:
+                return
+            after = (rows[-1]["completed_at"], rows[-1]["uuid"])
+
+    def query_orders(
+        self,
+        entry_id: str,
+        *,
+        start: str | None = None,
+        end: str | None = None,
+        store_uuid: str | None = None,
+        cancelled: bool | None = None,
+        sort: str = DEFAULT_SORT,
+        cursor: str | None = None,
+        limit: int = 24,
+    ) -> dict[str, Any]:
+        """Return one page of orders matching the filters.
+
+        Paging is keyset-based: the cursor holds the (sort value, uuid) of the
+        last row sent, so each page is an index range scan no matter how deep
+        into the history it is. Returns {"orders", "total", "next_cursor"}.
+        """
+        column, direction = SORT_KEYS.get(sort, SORT_KEYS[DEFAULT_SORT])
+        clauses, params = [], []
+        if start:
+            clauses.append("completed_at >= ?")
+            params.append(start)
+        if end:
+            clauses.append("completed_at < ?")
+            params.append(end)
+        if store_uuid:
+            clauses.append("store_uuid = ?")
+            params.append(store_uuid)
+        if cancelled is not None:
+            clauses.append("is_cancelled = ?")
+            params.append(1 if cancelled else 0)
+        filter_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        page_clauses, page_params = list(clauses), list(params)
+        after = _decode_cursor(cursor) if cursor else None
+        if after is not None:
+            op = "<" if direction == "DESC" else ">"
+            page_clauses.append(f"({column}, uuid) {op} (?, ?)")
+            page_params.extend(after)
+        page_sql = f"WHERE {' AND '.join(page_clauses)}" if page_clauses else ""
+
+        with self._lock:
+            table = self._ensure_table(entry_id)
+            conn = self._connection()
+            total = conn.execute(f"SELECT COUNT(*) FROM {table} {filter_sql}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT * FROM {table} {page_sql} ORDER BY {column} {direction}, uuid {direction} LIMIT ?",
+                (*page_params, limit + 1),
+            ).fetchall()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = _encode_cursor(last[column], last["uuid"])
+        return {
+            "orders": [_row_to_order(row) for row in rows],
+            "total": total,
+            "next_cursor": next_cursor,
+        }
+
+    def restaurants(self, entry_id: str, start: str | None = None, end: str | None = None) -> list[dict[str, Any]]:
+        """Return the restaurants ordered from in [start, end), most ordered first."""
+        clauses, params = ["store_uuid != ''"], []
+        if start:
+            clauses.append("completed_at >= ?")
+            params.append(start)
+        if end:
+            clauses.append("completed_at < ?")
+            params.append(end)
+        with self._lock:
+            table = self._ensure_table(entry_id)
+            cur = self._connection().execute(
+                f"SELECT store_uuid, MAX(restaurant_name) AS name, COUNT(*) AS order_count FROM {table} "
+                f"WHERE {' AND '.join(clauses)} GROUP BY store_uuid ORDER BY order_count DESC, name",
+                params,
+            )
+            return [
+                {"store_uuid": row["store_uuid"], "name": row["name"] or "Unknown", "order_count": row["order_count"]}
+                for row in cur
+            ]
+
+    def orders_by_uuid(self, entry_id: str, uuids: Iterable[str]) -> list[dict[str, Any]]:
+        """Return the stored versions of the given orders (primary-key lookups)."""
+        uuids = list(uuids)
+        if not uuids:
+            return []
+        with self._lock:
+            table = self._ensure_table(entry_id)
+            conn = self._connection()
+            found = []
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(uuids), 500):
+                chunk = uuids[i:i + 500]
+                cur = conn.execute(
+                    f"SELECT * FROM {table} WHERE uuid IN ({', '.join('?' for _ in chunk)})", chunk
+                )
+                found.extend(_row_to_order(row) for row in cur)
+            return found
+
+    def get_meta(self, entry_id: str) -> dict[str, float]:
+        """Return sync timestamps for an account (0 when never synced)."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT last_full_sync, last_sync FROM sync_meta WHERE entry_id = ?", (entry_id,)
+            ).fetchone()
+        if row is None:
+            return {"last_full_sync": 0.0, "last_sync": 0.0}
+        return {"last_full_sync": row["last_full_sync"], "last_sync": row["last_sync"]}
+
+    def set_meta(self, entry_id: str, last_full_sync: float, last_sync: float) -> None:
+        """Store sync timestamps for an account."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sync_meta (entry_id, last_full_sync, last_sync) VALUES (?, ?, ?)",
+                    (entry_id, last_full_sync, last_sync),
+                )
+
+    def import_legacy_cache(self, entry_id: str, path: str) -> int:
+        """Move a pre-SQLite past_orders_<entry_id>.json cache into the store."""
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path, encoding="utf-8") as f:
+                legacy = json.load(f) or {}
+            count = self.upsert_orders(entry_id, legacy.get("orders") or [])
+            os.remove(path)
+            return count
+        except (OSError, ValueError) as e:
+            _LOGGER.warning("Failed to import legacy past orders cache %s: %s", path, e)
+            return 0
+
+    def delete_account(self, entry_id: str) -> None:
+        """Drop an account's table and sync metadata."""
+        table = _table_name(entry_id)
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute("DELETE FROM sync_meta WHERE entry_id = ?", (entry_id,))
+            self._tables.discard(table)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._tables.clear()
+
+    # ---------- Event loop wrappers ----------
+    async def async_run(self, func, *args):
+        """Run a blocking store method in the executor."""
+        return await self._hass.async_add_executor_job(func, *args)
+
+
+@callback
+def async_get_history_store(hass: HomeAssistant) -> PastOrderStore:
+    """Return the integration-wide past-order store, creating it if needed."""
+    store: PastOrderStore | None = hass.data.get(DATA_HISTORY_STORE)
+    if store is None:
+        store = PastOrderStore(hass)
+        hass.data[DATA_HISTORY_STORE] = store
+
+        async def _async_close(_event: Event) -> None:
+            await hass.async_add_executor_job(store.close)
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return store
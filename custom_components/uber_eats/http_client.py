@@ -0,0 +1,154 @@
+"""Shared HTTP client for Uber Eats and Nominatim traffic.
+
+One long-lived aiohttp session is owned by the integration and shared by every
+coordinator and the config flow, so polls reuse pooled keep-alive connections
+instead of paying a fresh TCP+TLS handshake each cycle.
+"""
+from __future__ import annotations
+
+import contextlib
+import itertools
+import logging
+from typing import Any, AsyncIterator
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import (
+    DATA_HTTP_CLIENT,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_CONNECTION_LIMIT_PER_HOST,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    HTTP_REQUEST_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class UberEatsHttpClient:
+    """Pooled aiohttp session shared by all Uber Eats config entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._session: aiohttp.ClientSession | None = None
+        self._users: set[str] = set()
+        self._borrows = itertools.count()
+        self._stats: dict[str, int] = {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "dns_cache_hits": 0,
+            "dns_cache_misses": 0,
+        }
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return connection pool counters."""
+        stats: dict[str, Any] = dict(self._stats)
+        created = stats["connections_created"]
+        reused = stats["connections_reused"]
+        # Every reused connection is a TCP+TLS handshake we did not pay for
+        stats["handshakes_saved"] = reused
+        stats["reuse_ratio"] = round(reused / (created + reused), 3) if created + reused else 0.0
+        stats["users"] = len(self._users)
+        stats["open"] = self._session is not None and not self._session.closed
+        return stats
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(self._on_request_start)
+        trace.on_connection_create_end.append(self._on_connection_create_end)
+        trace.on_connection_reuseconn.append(self._on_connection_reuseconn)
+        trace.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        trace.on_dns_cache_miss.append(self._on_dns_cache_miss)
+        connector = aiohttp.TCPConnector(
+            limit=HTTP_CONNECTION_LIMIT,
+            limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=HTTP_DNS_CACHE_TTL,
+            use_dns_cache=True,
+            keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT,
+            enable_cleanup_closed=True,
+        )
+        _LOGGER.debug("Creating shared Uber Eats HTTP session")
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT),
+            headers={"Accept-Encoding": "gzip, deflate"},
+            # Each request carries its own account cookie; never let Set-Cookie
+            # responses from one account leak into another account's requests.
+            cookie_jar=aiohttp.DummyCookieJar(),
+            auto_decompress=True,
+            trace_configs=[trace],
+        )
+
+    async def _on_request_start(self, session, ctx, params) -> None:
+        self._stats["requests"] += 1
+
+    async def _on_connection_create_end(self, session, ctx, params) -> None:
+        self._stats["connections_created"] += 1
+
+    async def _on_connection_reuseconn(self, session, ctx, params) -> None:
+        self._stats["connections_reused"] += 1
+
+    async def _on_dns_cache_hit(self, session, ctx, params) -> None:
+        self._stats["dns_cache_hits"] += 1
+
+    async def _on_dns_cache_miss(self, session, ctx, params) -> None:
+        self._stats["dns_cache_misses"] += 1
+
+    @callback
+    def async_acquire(self, entry_id: str) -> None:
+        """Register a config entry as a user of the shared session."""
+        self._users.add(entry_id)
+
+    async def async_release(self, entry_id: str) -> None:
+        """Release a config entry; close the session when nobody uses it."""
+        self._users.discard(entry_id)
+        if not self._users:
+            await self.async_close()
+
+    @contextlib.asynccontextmanager
+    async def async_borrow(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Hold the shared session for a short-lived user without a config entry.
+
+        The config flow validates cookies before any entry exists; as a user it
+        keeps the session from being closed by an entry unloading meanwhile.
+        """
+        user = f"borrow_{next(self._borrows)}"
+        self.async_acquire(user)
+        try:
+            yield self.session
+        finally:
+            await self.async_release(user)
+
+    async def async_close(self) -> None:
+        """Close the shared session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            _LOGGER.debug("Closing shared Uber Eats HTTP session: %s", self.stats)
+            await self._session.close()
+        self._session = None
+
+
+@callback
+def async_get_http_client(hass: HomeAssistant) -> UberEatsHttpClient:
+    """Return the integration-wide HTTP client, creating it if needed."""
+    client: UberEatsHttpClient | None = hass.data.get(DATA_HTTP_CLIENT)
+    if client is None:
+        client = UberEatsHttpClient(hass)
+        hass.data[DATA_HTTP_CLIENT] = client
+
+        async def _async_close(_event: Event) -> None:
+            await client.async_close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return client
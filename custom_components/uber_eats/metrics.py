@@ -0,0 +1,144 @@
+"""Per-stage timing for the coordinator's poll cycles.
+
+Each account keeps a rolling histogram per stage of a cycle (token wait,
+active-orders request, JSON decode, parse and geocode, TTS event processing,
+entity fan-out) plus the background profile fetch and past-order sync,
+along with response sizes, geocode cache hits and error counts. The
+diagnostic sensors and the diagnostics download read them, so a slow stage
+can be found without debug logging.
+"""
+from __future__ import annotations
+
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from .const import METRICS_WINDOW
+
+# Stages of one active-orders cycle, in order, then the background work
+CYCLE_STAGES = ("queue", "request", "decode", "parse", "tts", "fanout")
+STAGES = (*CYCLE_STAGES, "cycle", "profile", "past_orders")
+
+# Upper bounds of the histogram buckets, in milliseconds
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class RollingHistogram:
+    """Most recent samples of one measurement, with a lifetime count."""
+
+    __slots__ = ("_samples", "count")
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self._samples.append(value)
+        self.count += 1
+
+    @property
+    def last(self) -> float | None:
+        return self._samples[-1] if self._samples else None
+
+    def percentile(self, q: float) -> float | None:
+        """Nearest-rank percentile (q in 0..100) over the window."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+    def buckets(self, bounds: tuple[float, ...] = BUCKETS_MS) -> dict[str, int]:
+        """Window sample counts per bucket ("le_<bound>" and "gt_<last bound>")."""
+        counts = dict.fromkeys((f"le_{bound}" for bound in bounds), 0)
+        overflow = 0
+        for value in self._samples:
+            for bound in bounds:
+                if value <= bound:
+                    counts[f"le_{bound}"] += 1
+                    break
+            else:
+                overflow += 1
+        counts[f"gt_{bounds[-1]}"] = overflow
+        return counts
+
+    def as_dict(self, buckets: bool = True) -> dict[str, Any]:
+        samples = self._samples
+        result: dict[str, Any] = {
+            "count": self.count,
+            "window": len(samples),
+            "last": _round(self.last),
+            "mean": _round(sum(samples) / len(samples)) if samples else None,
+            "p50": _round(self.percentile(50)),
+            "p95": _round(self.percentile(95)),
+            "max": _round(max(samples)) if samples else None,
+        }
+        if buckets:
+            result["buckets"] = self.buckets()
+        return result
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 2) if value is not None else None
+
+
+class CycleMetrics:
+    """Rolling timing, size, cache and error figures for one account."""
+
+    def __init__(self, window: int = METRICS_WINDOW) -> None:
+        self.window = window
+        self.stages = {stage: RollingHistogram(window) for stage in STAGES}
+        self.payload_bytes = RollingHistogram(window)
+        self.errors: Counter[str] = Counter()
+        self.unchanged_bodies = 0
+        self.geocode_hits = 0
+        self.geocode_misses = 0
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        """Record the duration of the with-block (milliseconds) under stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[stage].add((time.perf_counter() - start) * 1000)
+
+    def record_error(self, kind: str) -> None:
+        self.errors[kind] += 1
+
+    def record_geocode(self, cached: bool) -> None:
+        if cached:
+            self.geocode_hits += 1
+        else:
+            self.geocode_misses += 1
+
+    @property
+    def geocode_hit_ratio(self) -> float | None:
+        lookups = self.geocode_hits + self.geocode_misses
+        return self.geocode_hits / lookups if lookups else None
+
+    def p95(self, stage: str) -> float | None:
+        return _round(self.stages[stage].percentile(95))
+
+    def slowest_stage(self) -> str | None:
+        """Cycle stage with the highest p95 over the window."""
+        timed = [(self.stages[stage].percentile(95), stage) for stage in CYCLE_STAGES]
+        timed = [(p95, stage) for p95, stage in timed if p95 is not None]
+        return max(timed)[1] if timed else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Full snapshot (diagnostics download)."""
+        ratio = self.geocode_hit_ratio
+        return {
+            "window": self.window,
+            "stages_ms": {stage: histogram.as_dict() for stage, histogram in self.stages.items()},
+            "slowest_stage": self.slowest_stage(),
+            "payload_bytes": self.payload_bytes.as_dict(buckets=False),
+            "unchanged_bodies": self.unchanged_bodies,
+            "geocode": {
+                "hits": self.geocode_hits,
+                "misses": self.geocode_misses,
+                "hit_ratio": round(ratio, 3) if ratio is not None else None,
+            },
+            "errors": dict(self.errors),
+        }
@@ -0,0 +1,184 @@
+"""Typed model for a parsed active order.
+
+Missing values are None on the model. The placeholder strings the sensors,
+panel and TTS messages have always shown ("No Driver Assigned", "Unknown",
+...) are applied in one place, as_dict(), which is the only serializer for
+websocket and attribute output.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+NO_ACTIVE_ORDER = "No Active Order"
+NO_DRIVER_ASSIGNED = "No Driver Assigned"
+NO_MAP_AVAILABLE = "No Map Available"
+UNKNOWN = "Unknown"
+
+# Legacy placeholders that mean "no driver" in serialized data
+_NO_DRIVER_NAMES = (None, "", UNKNOWN, NO_DRIVER_ASSIGNED)
+
+
+def has_driver_name(driver_name: Any) -> bool:
+    """True if a (possibly serialized) driver name is a real name."""
+    return driver_name not in _NO_DRIVER_NAMES
+
+
+class ParsedOrder:
+    """One active order as parsed from getActiveOrdersV1."""
+
+    __slots__ = (
+        "order_id",
+        "order_stage",
+        "order_status",
+        "restaurant_name",
+        "driver_name",
+        "driver_eta_str",
+        "driver_eta",
+        "minutes_remaining",
+        "latitude",
+        "longitude",
+        "street",
+        "suburb",
+        "quarter",
+        "county",
+        "address",
+        "map_url",
+        "latest_arrival",
+        "user_picture_url",
+        "driver_picture_url",
+        "driver_phone",
+        "home_location",
+        "store_location",
+        "driver_location",
+        "_dict",
+    )
+
+    def __init__(
+        self,
+        *,
+        order_id: str | None,
+        order_stage: str,
+        order_status: str | None = None,
+        restaurant_name: str | None = None,
+        driver_name: str | None = None,
+        driver_eta_str: str | None = None,
+        driver_eta: datetime | None = None,
+        minutes_remaining: int | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        street: str | None = None,
+        suburb: str | None = None,
+        quarter: str | None = None,
+        county: str | None = None,
+        address: str | None = None,
+        map_url: str | None = None,
+        latest_arrival: str | None = None,
+        user_picture_url: str | None = None,
+        driver_picture_url: str | None = None,
+        driver_phone: str | None = None,
+        home_location: dict[str, float] | None = None,
+        store_location: dict[str, float] | None = None,
+        driver_location: dict[str, float] | None = None,
+    ) -> None:
+        self.order_id = order_id
+        self.order_stage = order_stage
+        self.order_status = order_status
+        self.restaurant_name = restaurant_name
+        self.driver_name = driver_name
+        self.driver_eta_str = driver_eta_str
+        self.driver_eta = driver_eta
+        self.minutes_remaining = minutes_remaining
+        self.latitude = latitude  # courier, else store, else home point
+        self.longitude = longitude
+        self.street = street
+        self.suburb = suburb
+        self.quarter = quarter
+        self.county = county
+        self.address = address
+        self.map_url = map_url
+        self.latest_arrival = latest_arrival
+        self.user_picture_url = user_picture_url
+        self.driver_picture_url = driver_picture_url
+        self.driver_phone = driver_phone
+        self.home_location = home_location
+        self.store_location = store_location
+        self.driver_location = driver_location  # courier only
+        self._dict: dict[str, Any] | None = None
+
+    def _fields(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__[:-1])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ParsedOrder):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __repr__(self) -> str:
+        return f"ParsedOrder({self.order_id!r}, {self.order_stage!r})"
+
+    @property
+    def has_driver(self) -> bool:
+        """A courier has been assigned."""
+        return has_driver_name(self.driver_name)
+
+    @property
+    def coords(self) -> tuple[float, float] | None:
+        """Display point (courier, else store, else home) as (lat, lon)."""
+        if self.latitude is None or self.longitude is None:
+            return None
+        return self.latitude, self.longitude
+
+    @property
+    def driver_coords(self) -> tuple[float, float] | None:
+        """Courier position as (lat, lon), if the map shows one."""
+        if not self.driver_location or not self.has_driver:
+            return None
+        return self.driver_location["lat"], self.driver_location["lon"]
+
+    @property
+    def tracking_active(self) -> bool:
+        """A courier is assigned and the order has a position to show."""
+        return self.has_driver and self.coords is not None
+
+    def with_eta(self, driver_eta: datetime | None, minutes_remaining: int | None) -> ParsedOrder:
+        """Copy with the time-derived ETA fields replaced."""
+        clone = ParsedOrder.__new__(ParsedOrder)
+        for name in self.__slots__[:-1]:
+            setattr(clone, name, getattr(self, name))
+        clone.driver_eta = driver_eta
+        clone.minutes_remaining = minutes_remaining
+        clone._dict = None
+        return clone
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize with the legacy keys and placeholder strings (cached)."""
+        if self._dict is None:
+            status = self.order_status or UNKNOWN
+            self._dict = {
+                "order_id": self.order_id or UNKNOWN,
+                "order_stage": self.order_stage,
+                "order_status": status,
+                "order_status_description": status,
+                "restaurant_name": self.restaurant_name or UNKNOWN,
+                "driver_name": self.driver_name or UNKNOWN,
+                "driver_eta_str": self.driver_eta_str or UNKNOWN,
+                "driver_eta": self.driver_eta,
+                "minutes_remaining": self.minutes_remaining,
+                "driver_location_lat": self.latitude if self.latitude is not None else NO_ACTIVE_ORDER,
+                "driver_location_lon": self.longitude if self.longitude is not None else NO_ACTIVE_ORDER,
+                "driver_location_street": self.street or NO_DRIVER_ASSIGNED,
+                "driver_location_suburb": self.suburb or NO_DRIVER_ASSIGNED,
+                "driver_location_quarter": self.quarter or NO_DRIVER_ASSIGNED,
+                "driver_location_county": self.county or NO_DRIVER_ASSIGNED,
+                "driver_location_address": self.address or NO_DRIVER_ASSIGNED,
+                "map_url": self.map_url or NO_MAP_AVAILABLE,
+                "latest_arrival": self.latest_arrival or UNKNOWN,
+                "user_picture_url": self.user_picture_url,
+                "driver_picture_url": self.driver_picture_url,
+                "driver_phone_formatted": self.driver_phone or "",
+                "home_location": self.home_location,
+                "store_location": self.store_location,
+                "driver_location_coords": self.driver_location,
+            }
+        return self._dict
@@ -0,0 +1,92 @@
+"""Typed order events from one diff per poll cycle.
+
+The previous cycle's orders are kept keyed by order uuid and compared with
+the current ones, so every concurrent order gets its own events (not only
+the first, as the flattened fields did). The events are computed once and
+then handed to every consumer: TTS, the driver-nearby automation and the
+uber_eats_order_event bus event.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable, NamedTuple
+
+from .const import GEOFENCE_NEARBY
+from .eta import DELIVERED_STAGES, HEADING_HOME_STAGES
+from .geofence import ENTER, GeofenceEvent
+from .models import ParsedOrder
+
+NEW_ORDER = "new_order"
+DRIVER_ASSIGNED = "driver_assigned"
+STATUS_CHANGED = "status_changed"
+STAGE_CHANGED = "stage_changed"
+DELIVERED = "delivered"
+DRIVER_NEARBY = "driver_nearby"  # courier entered the nearby geofence ring
+
+
+class OrderEvent(NamedTuple):
+    event_type: str
+    order: ParsedOrder  # current state (last known state once the order is gone)
+    previous: ParsedOrder | None = None
+    distance_m: float | None = None  # driver_nearby only
+
+    @property
+    def order_id(self) -> str:
+        return self.order.order_id
+
+    def as_event_data(self) -> dict[str, Any]:
+        """Payload of the uber_eats_order_event bus event."""
+        order = self.order
+        data = {
+            "type": self.event_type,
+            "order_id": order.order_id,
+            "restaurant_name": order.restaurant_name,
+            "order_stage": order.order_stage,
+            "order_status": order.order_status,
+            "driver_name": order.driver_name if order.has_driver else None,
+        }
+        if self.previous is not None:
+            data["previous_stage"] = self.previous.order_stage
+            data["previous_status"] = self.previous.order_status
+        if self.distance_m is not None:
+            data["distance_m"] = round(self.distance_m)
+        return data
+
+
+def diff_orders(
+    previous: dict[str, ParsedOrder] | None,
+    current: Iterable[ParsedOrder],
+    geofence_events: Iterable[GeofenceEvent] = (),
+) -> list[OrderEvent]:
+    """Events between the previous cycle's orders (by uuid) and this cycle's.
+
+    previous is None on the first cycle, when there is nothing to compare
+    against; nothing is reported then, not even couriers already inside a zone.
+    """
+    events: list[OrderEvent] = []
+    if previous is None:
+        return events
+    current = [order for order in current if order.order_id]
+    by_id = {order.order_id: order for order in current}
+
+    for order in current:
+        prev = previous.get(order.order_id)
+        if prev is None:
+            events.append(OrderEvent(NEW_ORDER, order))
+        if order.has_driver and (prev is None or not prev.has_driver):
+            events.append(OrderEvent(DRIVER_ASSIGNED, order, prev))
+        if order.order_status and order.order_status != (prev.order_status if prev else None):
+            events.append(OrderEvent(STATUS_CHANGED, order, prev))
+        if prev is not None and order.order_stage != prev.order_stage:
+            events.append(OrderEvent(STAGE_CHANGED, order, prev))
+            if order.order_stage in DELIVERED_STAGES and prev.order_stage not in DELIVERED_STAGES:
+                events.append(OrderEvent(DELIVERED, order, prev))
+
+    # Gone from getActiveOrdersV1 after pickup: delivered (before pickup: cancelled)
+    for order_id, prev in previous.items():
+        if order_id not in by_id and prev.order_stage in HEADING_HOME_STAGES:
+            events.append(OrderEvent(DELIVERED, prev))
+
+    for event in geofence_events:
+        if event.zone_id == GEOFENCE_NEARBY and event.event == ENTER and event.order_id in by_id:
+            events.append(OrderEvent(DRIVER_NEARBY, by_id[event.order_id], distance_m=event.distance_m))
+    return events
@@ -0,0 +1,104 @@
+"""Normalization of getPastOrdersV1 pages.
+
+Pure, blocking functions: the coordinator runs them in the executor, one
+job per page (decode and normalize together), so a long history sync keeps
+only network I/O on the event loop. Each page is written to the history
+store as it arrives.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from .decode import json_loads
+
+
+class PastOrdersPage(NamedTuple):
+    """One decoded page of past orders."""
+
+    orders: list[dict[str, Any]]  # normalized, in API order
+    uuids: list[str]
+    has_more: bool
+    last_workflow_uuid: str  # cursor for the next page ("" when there is none)
+
+
+def normalize_order(order_uuid: str, order_data: dict[str, Any]) -> dict[str, Any]:
+    """Flatten one ordersMap entry into the stored order dict (see history_store._COLUMNS)."""
+    base = order_data.get("baseEaterOrder", {})
+    store_info = order_data.get("storeInfo", {})
+    fare_info = order_data.get("fareInfo", {})
+
+    # Extract from checkoutInfo
+    checkout = fare_info.get("checkoutInfo", [])
+    subtotal = 0
+    delivery_fee = 0
+    tax = 0
+    promotions = 0  # Sum of all discounts/credits (negative value)
+    total_raw = fare_info.get("totalPrice", 0) / 100.0
+
+    for item in checkout:
+        key = item.get("key", "")
+        item_type = item.get("type", "")
+        raw_val = item.get("rawValue", 0)
+
+        if key == "eats_fare.subtotal":
+            subtotal = raw_val
+        elif "booking_fee" in key:
+            delivery_fee = raw_val
+        elif key == "eats.tax.base":
+            tax = raw_val
+        elif item_type == "debit" and raw_val < 0:
+            # Sum all debits (promotions/discounts) - they have negative values
+            promotions += raw_val
+        elif key == "eats_fare.total":
+            total_raw = raw_val
+
+    # Parse completed date
+    completed_at = base.get("completedAt", "") or base.get("lastStateChangeAt", "")
+    date_formatted = ""
+    if completed_at:
+        try:
+            dt_obj = datetime.fromisoformat(completed_at.replace("Z", "+00:00"))
+            date_formatted = dt_obj.strftime("%b %d, %Y")
+        except Exception:
+            date_formatted = completed_at[:10] if len(completed_at) >= 10 else completed_at
+
+    location = store_info.get("location", {})
+    address_info = location.get("address", {})
+    store_address = address_info.get("eaterFormattedAddress", "")
+
+    return {
+        "uuid": order_uuid,
+        "store_uuid": store_info.get("uuid", ""),
+        "restaurant_name": store_info.get("title", "Unknown"),
+        "hero_image_url": store_info.get("heroImageUrl", ""),
+        "date": date_formatted,
+        "completed_at": completed_at,
+        "subtotal": subtotal,
+        "delivery_fee": delivery_fee,
+        "tax": tax,
+        "promotions": promotions,  # Negative value for discounts/credits
+        "total": total_raw,
+        "store_address": store_address,
+        "store_rating": store_info.get("rating"),
+        "is_cancelled": base.get("isCancelled", False),
+    }
+
+
+def parse_page(body: bytes) -> PastOrdersPage:
+    """Decode and normalize one getPastOrdersV1 response body (blocking)."""
+    data = json_loads(body)
+    orders_map = data.get("data", {}).get("ordersMap", {})
+    meta = data.get("data", {}).get("meta", {})
+    last_workflow_uuid = ""
+    if orders_map:
+        # The next page starts after the last order of this one
+        last_order = list(orders_map.values())[-1]
+        last_workflow_uuid = last_order.get("baseEaterOrder", {}).get("uuid", "")
+    return PastOrdersPage(
+        orders=[normalize_order(order_uuid, order_data) for order_uuid, order_data in orders_map.items()],
+        uuids=list(orders_map),
+        has_more=bool(meta.get("hasMore", False)),
+        last_workflow_uuid=last_workflow_uuid,
+    )
+
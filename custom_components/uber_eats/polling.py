@@ -0,0 +1,68 @@
+"""Adaptive poll interval for the active-orders coordinator.
+
+The interval follows the order lifecycle: slow exponential backoff while the
+account has no orders, moderate while the restaurant is preparing, and fast
+once a courier is en route or close to home.
+"""
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Iterable
+
+from .const import (
+    DEFAULT_POLL_INTERVAL_MAX,
+    DEFAULT_POLL_INTERVAL_MIN,
+    POLL_INTERVAL_EN_ROUTE,
+    POLL_INTERVAL_IDLE_BASE,
+    POLL_INTERVAL_PREPARING,
+    POLL_NEAR_DISTANCE_FEET,
+)
+
+# Stages from UberEatsCoordinator._parse_stage, mapped to their target interval
+_STAGE_INTERVALS = {
+    "preparing": POLL_INTERVAL_PREPARING,
+    "picked up": POLL_INTERVAL_EN_ROUTE,
+    "en route": POLL_INTERVAL_EN_ROUTE,
+    "arriving": 0,  # clamped up to the configured minimum
+    "delivered": POLL_INTERVAL_PREPARING,
+    "complete": POLL_INTERVAL_PREPARING,
+}
+
+
+def clamp_poll_bounds(min_seconds, max_seconds) -> tuple[int, int]:
+    """Sanitize user-configured bounds (seconds); min never exceeds max."""
+    try:
+        min_s = int(min_seconds)
+    except (TypeError, ValueError):
+        min_s = DEFAULT_POLL_INTERVAL_MIN
+    try:
+        max_s = int(max_seconds)
+    except (TypeError, ValueError):
+        max_s = DEFAULT_POLL_INTERVAL_MAX
+    min_s = max(5, min(60, min_s))
+    max_s = max(60, min(900, max_s))
+    return min_s, max(min_s, max_s)
+
+
+def compute_poll_interval(
+    stages: Iterable[str],
+    nearest_driver_feet: float | None,
+    idle_cycles: int,
+    min_seconds: int = DEFAULT_POLL_INTERVAL_MIN,
+    max_seconds: int = DEFAULT_POLL_INTERVAL_MAX,
+) -> timedelta:
+    """Return the next poll interval for an account.
+
+    stages: order stages of the active orders (empty when idle).
+    nearest_driver_feet: distance of the closest courier to home, if known.
+    idle_cycles: consecutive polls without an active order.
+    """
+    stages = list(stages)
+    if not stages:
+        # Exponential backoff: 30s, 60s, 120s, ... up to max
+        seconds = POLL_INTERVAL_IDLE_BASE * (2 ** min(idle_cycles, 8))
+    else:
+        seconds = min(_STAGE_INTERVALS.get(stage, POLL_INTERVAL_PREPARING) for stage in stages)
+        if nearest_driver_feet is not None and nearest_driver_feet <= POLL_NEAR_DISTANCE_FEET:
+            seconds = 0
+    return timedelta(seconds=max(min_seconds, min(max_seconds, seconds)))
@@ -0,0 +1,173 @@
+"""Integration-wide poll scheduler shared by all Uber Eats accounts.
+
+Each config entry runs its own coordinator, so without coordination a
+household with several accounts sends synchronized bursts to the same
+endpoints. The scheduler:
+
+- staggers accounts across their poll interval (each account owns a phase)
+- adds random jitter to every interval
+- enforces a global requests-per-minute budget with a token bucket
+- hands out tokens to accounts with active orders first
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DATA_POLL_SCHEDULER,
+    GLOBAL_REQUEST_BURST,
+    GLOBAL_REQUESTS_PER_MINUTE,
+    POLL_JITTER_RATIO,
+    POLL_STAGGER_MAX_SHIFT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Token priorities (lower is served first)
+PRIORITY_ACTIVE = 0  # active-orders poll of an account with a live order
+PRIORITY_IDLE = 1  # active-orders poll of an idle account
+PRIORITY_BACKGROUND = 2  # profile, past orders
+
+
+class UberEatsPollScheduler:
+    """Stagger, jitter and rate-limit Uber Eats requests across accounts."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        requests_per_minute: int = GLOBAL_REQUESTS_PER_MINUTE,
+        burst: int = GLOBAL_REQUEST_BURST,
+    ) -> None:
+        self._hass = hass
+        self._accounts: list[str] = []  # registration order defines each account's phase
+        self._active: set[str] = set()
+        self._rate = requests_per_minute / 60.0  # tokens per second
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+        self.granted = 0
+        self.delayed = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return budget counters."""
+        self._refill()
+        return {
+            "accounts": len(self._accounts),
+            "active_accounts": len(self._active),
+            "requests_per_minute": round(self._rate * 60),
+            "tokens_available": round(self._tokens, 2),
+            "waiting": sum(1 for *_, fut in self._waiters if not fut.done()),
+            "granted": self.granted,
+            "delayed": self.delayed,
+        }
+
+    @callback
+    def async_register(self, entry_id: str) -> None:
+        """Add an account to the rotation."""
+        if entry_id not in self._accounts:
+            self._accounts.append(entry_id)
+
+    @callback
+    def async_unregister(self, entry_id: str) -> None:
+        """Remove an account from the rotation."""
+        if entry_id in self._accounts:
+            self._accounts.remove(entry_id)
+        self._active.discard(entry_id)
+
+    @callback
+    def async_set_active(self, entry_id: str, active: bool) -> None:
+        """Record whether an account currently has active orders."""
+        if active:
+            self._active.add(entry_id)
+        else:
+            self._active.discard(entry_id)
+
+    def priority_for(self, entry_id: str) -> int:
+        """Return the poll priority of an account."""
+        return PRIORITY_ACTIVE if entry_id in self._active else PRIORITY_IDLE
+
+    def next_interval(self, entry_id: str, base: timedelta) -> timedelta:
+        """Shift and jitter an account's next interval onto its phase slot.
+
+        Account k of n aims to poll at offset k/n of the interval, so accounts
+        on the same interval spread out instead of firing together.
+        """
+        base_s = base.total_seconds()
+        if base_s <= 0:
+            return base
+        shift = 0.0
+        count = len(self._accounts)
+        if count > 1 and entry_id in self._accounts:
+            phase = self._accounts.index(entry_id) / count * base_s
+            target = time.time() + base_s
+            shift = (phase - target) % base_s
+            if shift > base_s / 2:
+                shift -= base_s
+            limit = base_s * POLL_STAGGER_MAX_SHIFT
+            shift = max(-limit, min(limit, shift))
+        jitter = random.uniform(-POLL_JITTER_RATIO, POLL_JITTER_RATIO) * base_s
+        return timedelta(seconds=max(1.0, base_s + shift + jitter))
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+    async def async_acquire(self, priority: int = PRIORITY_IDLE) -> None:
+        """Wait for a request token from the global budget."""
+        self._refill()
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            self.granted += 1
+            return
+        self.delayed += 1
+        future = self._hass.loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self._schedule_wakeup()
+        await future
+
+    @callback
+    def _schedule_wakeup(self) -> None:
+        if self._wakeup is not None or not self._waiters:
+            return
+        delay = max(0.0, (1 - self._tokens) / self._rate) if self._rate > 0 else 1.0
+        self._wakeup = self._hass.loop.call_later(max(delay, 0.01), self._grant)
+
+    @callback
+    def _grant(self) -> None:
+        self._wakeup = None
+        self._refill()
+        while self._waiters and self._tokens >= 1:
+            _priority, _seq, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue  # waiter was cancelled
+            self._tokens -= 1
+            self.granted += 1
+            future.set_result(None)
+        # Drop cancelled waiters left at the head so they do not hold a wakeup
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        self._schedule_wakeup()
+
+
+@callback
+def async_get_poll_scheduler(hass: HomeAssistant) -> UberEatsPollScheduler:
+    """Return the integration-wide poll scheduler, creating it if needed."""
+    scheduler: UberEatsPollScheduler | None = hass.data.get(DATA_POLL_SCHEDULER)
+    if scheduler is None:
+        scheduler = UberEatsPollScheduler(hass)
+        hass.data[DATA_POLL_SCHEDULER] = scheduler
+    return scheduler
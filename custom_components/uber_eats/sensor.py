@@ -1,374 +1,496 @@
-from __future__ import annotations
-
-import re
-from datetime import datetime, date
-from typing import Any
-
-from .const import DOMAIN, CONF_ACCOUNT_NAME
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
-from homeassistant.helpers.entity_registry import async_get as async_get_entity_reg
-from homeassistant.util import dt as dt_util
-
-# ---------- Helpers ----------
-def _format_short_time(value: Any) -> str | None:
-    if value in (None, "", "No ETT Available"):
-        return None
-    ts: datetime | None = None
-    if isinstance(value, datetime):
-        ts = value if value.tzinfo else value.replace(tzinfo=dt_util.UTC)
-    elif isinstance(value, date):
-        ts = datetime(value.year, value.month, value.day, tzinfo=dt_util.UTC)
-    elif isinstance(value, (int, float)):
-        try:
-            ts = datetime.fromtimestamp(float(value), tz=dt_util.UTC)
-        except Exception:
-            ts = None
-    elif isinstance(value, str):
-        v = value.strip()
-        if v.isdigit():
-            try:
-                ts = datetime.fromtimestamp(float(v), tz=dt_util.UTC)
-            except Exception:
-                ts = None
-        if ts is None:
-            try:
-                parsed = dt_util.parse_datetime(v)
-                if parsed is not None:
-                    ts = parsed if parsed.tzinfo else parsed.replace(tzinfo=dt_util.UTC)
-            except Exception:
-                ts = None
-    if ts is None:
-        return None
-    local_dt = dt_util.as_local(ts)
-    try:
-        s = local_dt.strftime("%-I:%M%p")
-    except ValueError:
-        s = local_dt.strftime("%#I:%M%p")
-    return s.lower()
-
-# ---------- Setup ----------
-async def async_setup_entry(hass, config_entry, async_add_entities):
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    account_name = config_entry.data[CONF_ACCOUNT_NAME]
-
-    entities = [
-        UberEatsOrderStage(coordinator, account_name),
-        UberEatsOrderStatus(coordinator, account_name),
-        UberEatsDriverName(coordinator, account_name),
-        UberEatsDriverETA(coordinator, account_name),
-        UberEatsOrderHistory(coordinator, account_name),
-        UberEatsRestaurantName(coordinator, account_name),
-        UberEatsOrderId(coordinator, account_name),
-        UberEatsLatestArrival(coordinator, account_name),
-        UberEatsDriverLatitude(coordinator, account_name),
-        UberEatsDriverLongitude(coordinator, account_name),
-
-        # Location component sensors (trimmed to match coordinator)
-        UberEatsDriverLocationStreet(coordinator, account_name),
-        UberEatsDriverLocationSuburb(coordinator, account_name),
-        UberEatsDriverLocationQuarter(coordinator, account_name),
-        UberEatsDriverLocationCounty(coordinator, account_name),
-        UberEatsDriverLocationAddress(coordinator, account_name),
-
-        UberEatsDriverETT(coordinator, account_name),
-
-        # Statistics sensors
-        UberEatsTotalDeliveries(coordinator, account_name),
-        UberEatsTotalSpent(coordinator, account_name),
-        UberEatsTotalDeliveryFees(coordinator, account_name),
-    ]
-
-    async_add_entities(entities)
-
-    entity_reg = async_get_entity_reg(hass)
-    label_id = "uber_eats"
-    for entity in entities:
-        if entity.entity_id:
-            entity_reg.async_update_entity(entity.entity_id, labels=[label_id])
-
-# ---------- Multi-order helpers ----------
-def _get_orders(coordinator) -> list[dict]:
-    """Get the orders array from coordinator data."""
-    return coordinator.data.get("orders", [])
-
-def _get_orders_count(coordinator) -> int:
-    """Get the number of active orders."""
-    return coordinator.data.get("orders_count", 0)
-
-def _multi_order_value(coordinator, key: str, default: str, joiner: str = ", ") -> str:
-    """Get comma-separated values from all orders for a given key."""
-    orders = _get_orders(coordinator)
-    if not orders:
-        return default
-    values = [o.get(key, default) for o in orders if o.get(key) and o.get(key) != default]
-    if not values:
-        return default
-    return joiner.join(str(v) for v in values)
-
-def _multi_order_attrs(coordinator, key: str, default: Any = None) -> dict[str, Any]:
-    """Build per-order attributes like order1_key, order2_key, etc."""
-    orders = _get_orders(coordinator)
-    attrs = {"orders_count": len(orders)}
-    for i, order in enumerate(orders, 1):
-        attrs[f"order{i}_{key}"] = order.get(key, default)
-    return attrs
-
-# ---------- Base ----------
-class UberEatsEntity(SensorEntity):
-    _attr_has_entity_name = True
-
-    def __init__(self, coordinator, account_name: str) -> None:
-        self.coordinator = coordinator
-        self._account_name = account_name.replace(" ", "_")
-        self._attr_unique_id = f"uber_eats_{self._account_name}_{self.translation_key}"
-
-    @property
-    def available(self) -> bool:
-        return self.coordinator.last_update_success
-
-    async def async_update(self) -> None:
-        await self.coordinator.async_request_refresh()
-
-    @property
-    def name(self) -> str:
-        return f"{self._account_name} Uber Eats {self.translation_key.replace('_', ' ').title()}"
-
-# ---------- Helper for native_value (count or "No active order") ----------
-def _order_count_state(coordinator) -> str:
-    """Return 'No active order' or the count of active orders as string."""
-    orders = _get_orders(coordinator)
-    count = len(orders)
-    if count == 0:
-        return "No active order"
-    return str(count)
-
-# ---------- Sensors ----------
-class UberEatsOrderStage(UberEatsEntity):
-    _attr_translation_key = "order_stage"
-    @property
-    def native_value(self) -> str:
-        return _order_count_state(self.coordinator)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return _multi_order_attrs(self.coordinator, "order_stage", "No Active Order")
-
-class UberEatsOrderStatus(UberEatsEntity):
-    _attr_translation_key = "order_status"
-    @property
-    def native_value(self) -> str:
-        return _order_count_state(self.coordinator)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return _multi_order_attrs(self.coordinator, "order_status", "No Active Order")
-
-class UberEatsDriverName(UberEatsEntity):
-    _attr_translation_key = "driver_name"
-    @property
-    def native_value(self) -> str:
-        return _order_count_state(self.coordinator)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return _multi_order_attrs(self.coordinator, "driver_name", "No Driver Assigned")
-
-class UberEatsDriverETA(UberEatsEntity):
-    _attr_translation_key = "driver_eta"
-    @property
-    def native_value(self) -> str:
-        return _order_count_state(self.coordinator)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        orders = _get_orders(self.coordinator)
-        attrs = {"orders_count": len(orders), "timezone": str(dt_util.DEFAULT_TIME_ZONE)}
-        for i, o in enumerate(orders, 1):
-            raw = o.get("driver_eta")
-            short = _format_short_time(raw)
-            attrs[f"order{i}_eta"] = short if short else "No ETT Available"
-            attrs[f"order{i}_minutes_remaining"] = o.get("minutes_remaining", "No ETT Available")
-        return attrs
-
-class UberEatsOrderHistory(UberEatsEntity):
-    _attr_translation_key = "order_history"
-    @property
-    def native_value(self) -> str:
-        return _order_count_state(self.coordinator)
-    @property
-    def extra_state_attributes(self) -> dict:
-        return {"history": getattr(self.coordinator, "_order_history", []), "orders_count": _get_orders_count(self.coordinator)}
-
-class UberEatsRestaurantName(UberEatsEntity):
-    _attr_translation_key = "restaurant_name"
-    @property
-    def native_value(self) -> str:
-        return _order_count_state(self.coordinator)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return _multi_order_attrs(self.coordinator, "restaurant_name", "No Restaurant")
-
-class UberEatsOrderId(UberEatsEntity):
-    _attr_translation_key = "order_id"
-    @property
-    def native_value(self) -> str:
-        return _order_count_state(self.coordinator)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return _multi_order_attrs(self.coordinator, "order_id", "No Active Order")
-
-class UberEatsLatestArrival(UberEatsEntity):
-    _attr_translation_key = "latest_arrival"
-    @property
-    def native_value(self) -> str:
-        return _order_count_state(self.coordinator)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return _multi_order_attrs(self.coordinator, "latest_arrival", "No Latest Arrival")
-
-class UberEatsDriverLatitude(UberEatsEntity):
-    _attr_translation_key = "driver_latitude"
-    _attr_native_unit_of_measurement = "°"
-    @property
-    def native_value(self) -> float:
-        """Return driver latitude or HA home latitude when no active order."""
-        orders = _get_orders(self.coordinator)
-        if orders:
-            lat = orders[0].get("driver_location_lat")
-            if isinstance(lat, (int, float)):
-                return float(lat)
-        # Fall back to HA home latitude
-        return float(self.coordinator.hass.config.latitude or 0.0)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return _multi_order_attrs(self.coordinator, "driver_location_lat", "No Active Order")
-
-class UberEatsDriverLongitude(UberEatsEntity):
-    _attr_translation_key = "driver_longitude"
-    _attr_native_unit_of_measurement = "°"
-    @property
-    def native_value(self) -> float:
-        """Return driver longitude or HA home longitude when no active order."""
-        orders = _get_orders(self.coordinator)
-        if orders:
-            lon = orders[0].get("driver_location_lon")
-            if isinstance(lon, (int, float)):
-                return float(lon)
-        # Fall back to HA home longitude
-        return float(self.coordinator.hass.config.longitude or 0.0)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return _multi_order_attrs(self.coordinator, "driver_location_lon", "No Active Order")
-
-# ---- Location sensors (trimmed to match coordinator) ----
-class UberEatsDriverLocationStreet(UberEatsEntity):
-    _attr_translation_key = "driver_location_street"
-    @property
-    def native_value(self) -> str:
-        return _order_count_state(self.coordinator)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return _multi_order_attrs(self.coordinator, "driver_location_street", "No Active Order")
-
-class UberEatsDriverLocationSuburb(UberEatsEntity):
-    _attr_translation_key = "driver_location_suburb"
-    @property
-    def native_value(self) -> str:
-        return _order_count_state(self.coordinator)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return _multi_order_attrs(self.coordinator, "driver_location_suburb", "Unknown")
-
-class UberEatsDriverLocationQuarter(UberEatsEntity):
-    _attr_translation_key = "driver_location_quarter"
-    @property
-    def native_value(self) -> str:
-        return _order_count_state(self.coordinator)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return _multi_order_attrs(self.coordinator, "driver_location_quarter", "Unknown")
-
-class UberEatsDriverLocationCounty(UberEatsEntity):
-    _attr_translation_key = "driver_location_county"
-    @property
-    def native_value(self) -> str:
-        return _order_count_state(self.coordinator)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return _multi_order_attrs(self.coordinator, "driver_location_county", "Unknown")
-
-class UberEatsDriverLocationAddress(UberEatsEntity):
-    _attr_translation_key = "driver_location_address"
-    @property
-    def native_value(self) -> str:
-        return _order_count_state(self.coordinator)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        return _multi_order_attrs(self.coordinator, "driver_location_address", "Unknown")
-
-class UberEatsDriverETT(UberEatsEntity):
-    _attr_translation_key = "driver_ett"
-    @property
-    def native_value(self) -> str:
-        return _order_count_state(self.coordinator)
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        orders = _get_orders(self.coordinator)
-        attrs = {"orders_count": len(orders)}
-        for i, o in enumerate(orders, 1):
-            minutes = o.get("minutes_remaining", None)
-            attrs[f"order{i}_minutes_remaining"] = minutes if minutes is not None else "No ETT Available"
-        return attrs
-
-
-# ---------- Statistics Sensors ----------
-def _get_statistics(coordinator) -> dict[str, Any]:
-    """Get statistics from coordinator's cached past orders."""
-    cached = getattr(coordinator, "_cached_past_orders", None)
-    if cached and isinstance(cached, dict):
-        return cached.get("statistics", {})
-    return {}
-
-
-class UberEatsTotalDeliveries(UberEatsEntity):
-    _attr_translation_key = "total_deliveries"
-    _attr_state_class = SensorStateClass.TOTAL
-    _attr_native_unit_of_measurement = "orders"
-
-    @property
-    def native_value(self) -> int:
-        stats = _get_statistics(self.coordinator)
-        return stats.get("total_orders", 0)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        stats = _get_statistics(self.coordinator)
-        return {"year": stats.get("year", datetime.now().year)}
-
-
-class UberEatsTotalSpent(UberEatsEntity):
-    _attr_translation_key = "total_spent"
-    _attr_state_class = SensorStateClass.TOTAL
-    _attr_native_unit_of_measurement = "USD"
-
-    @property
-    def native_value(self) -> float:
-        stats = _get_statistics(self.coordinator)
-        return stats.get("total_spent", 0.0)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        stats = _get_statistics(self.coordinator)
-        return {"year": stats.get("year", datetime.now().year)}
-
-
-class UberEatsTotalDeliveryFees(UberEatsEntity):
-    _attr_translation_key = "total_delivery_fees"
-    _attr_state_class = SensorStateClass.TOTAL
-    _attr_native_unit_of_measurement = "USD"
-
-    @property
-    def native_value(self) -> float:
-        stats = _get_statistics(self.coordinator)
-        return stats.get("total_delivery_fees", 0.0)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        stats = _get_statistics(self.coordinator)
-        return {"year": stats.get("year", datetime.now().year)}
+from __future__ import annotations
+
+import re
+import time
+from datetime import datetime, date
+from typing import Any
+
+from .const import DOMAIN, CONF_ACCOUNT_NAME, SIGNAL_METRICS_UPDATED
+from .metrics import CYCLE_STAGES
+from .models import ParsedOrder
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_registry import async_get as async_get_entity_reg
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+# ---------- Helpers ----------
+def _format_short_time(value: Any) -> str | None:
+    if value in (None, "", "No ETT Available"):
+        return None
+    ts: datetime | None = None
+    if isinstance(value, datetime):
+        ts = value if value.tzinfo else value.replace(tzinfo=dt_util.UTC)
+    elif isinstance(value, date):
+        ts = datetime(value.year, value.month, value.day, tzinfo=dt_util.UTC)
+    elif isinstance(value, (int, float)):
+        try:
+            ts = datetime.fromtimestamp(float(value), tz=dt_util.UTC)
+        except Exception:
+            ts = None
+    elif isinstance(value, str):
+        v = value.strip()
+        if v.isdigit():
+            try:
+                ts = datetime.fromtimestamp(float(v), tz=dt_util.UTC)
+            except Exception:
+                ts = None
+        if ts is None:
+            try:
+                parsed = dt_util.parse_datetime(v)
+                if parsed is not None:
+                    ts = parsed if parsed.tzinfo else parsed.replace(tzinfo=dt_util.UTC)
+            except Exception:
+                ts = None
+    if ts is None:
+        return None
+    local_dt = dt_util.as_local(ts)
+    try:
+        s = local_dt.strftime("%-I:%M%p")
+    except ValueError:
+        s = local_dt.strftime("%#I:%M%p")
+    return s.lower()
+
+# ---------- Setup ----------
+async def async_setup_entry(hass, config_entry, async_add_entities):
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    account_name = config_entry.data[CONF_ACCOUNT_NAME]
+
+    entities = [
+        UberEatsOrderStage(coordinator, account_name),
+        UberEatsOrderStatus(coordinator, account_name),
+        UberEatsDriverName(coordinator, account_name),
+        UberEatsDriverETA(coordinator, account_name),
+        UberEatsOrderHistory(coordinator, account_name),
+        UberEatsRestaurantName(coordinator, account_name),
+        UberEatsOrderId(coordinator, account_name),
+        UberEatsLatestArrival(coordinator, account_name),
+        UberEatsDriverLatitude(coordinator, account_name),
+        UberEatsDriverLongitude(coordinator, account_name),
+
+        # Location component sensors (trimmed to match coordinator)
+        UberEatsDriverLocationStreet(coordinator, account_name),
+        UberEatsDriverLocationSuburb(coordinator, account_name),
+        UberEatsDriverLocationQuarter(coordinator, account_name),
+        UberEatsDriverLocationCounty(coordinator, account_name),
+        UberEatsDriverLocationAddress(coordinator, account_name),
+
+        UberEatsDriverETT(coordinator, account_name),
+        UberEatsEstimatedArrival(coordinator, account_name),
+
+        # Statistics sensors
+        UberEatsTotalDeliveries(coordinator, account_name),
+        UberEatsTotalSpent(coordinator, account_name),
+        UberEatsTotalDeliveryFees(coordinator, account_name),
+
+        # Diagnostic sensors (poll-cycle instrumentation)
+        UberEatsCycleTime(coordinator, account_name),
+        UberEatsSlowestStage(coordinator, account_name),
+        UberEatsResponseSize(coordinator, account_name),
+        UberEatsPollErrors(coordinator, account_name),
+        UberEatsGeocodeHitRatio(coordinator, account_name),
+        UberEatsEtaAccuracy(coordinator, account_name),
+    ]
+
+    async_add_entities(entities)
+
+    entity_reg = async_get_entity_reg(hass)
+    label_id = "uber_eats"
+    for entity in entities:
+        if entity.entity_id:
+            entity_reg.async_update_entity(entity.entity_id, labels=[label_id])
+
+# ---------- Multi-order helpers ----------
+def _get_orders(coordinator) -> list[ParsedOrder]:
+    """Get the parsed orders from coordinator data."""
+    return coordinator.data.get("orders", [])
+
+def _get_orders_count(coordinator) -> int:
+    """Get the number of active orders."""
+    return coordinator.data.get("orders_count", 0)
+
+def _multi_order_value(coordinator, key: str, default: str, joiner: str = ", ") -> str:
+    """Get comma-separated values from all orders for a given key."""
+    orders = _get_orders(coordinator)
+    if not orders:
+        return default
+    values = [o.as_dict().get(key) for o in orders]
+    values = [v for v in values if v and v != default]
+    if not values:
+        return default
+    return joiner.join(str(v) for v in values)
+
+def _multi_order_attrs(coordinator, key: str, default: Any = None) -> dict[str, Any]:
+    """Build per-order attributes like order1_key, order2_key, etc."""
+    orders = _get_orders(coordinator)
+    attrs = {"orders_count": len(orders)}
+    for i, order in enumerate(orders, 1):
+        attrs[f"order{i}_{key}"] = order.as_dict().get(key, default)
+    return attrs
+
+# ---------- Base ----------
+class UberEatsEntity(CoordinatorEntity, SensorEntity):
+    """Base sensor driven by coordinator listeners.
+
+    State and attributes are computed once per coordinator update in
+    _compute_state(); the state is only written when something changed.
+    """
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator, account_name: str) -> None:
+        super().__init__(coordinator)
+        self._account_name = account_name.replace(" ", "_")
+        self._attr_unique_id = f"uber_eats_{self._account_name}_{self.translation_key}"
+        self._attr_native_value = None
+        self._attr_extra_state_attributes = {}
+        self._last_available: bool | None = None
+        self._refresh_state()
+
+    @property
+    def name(self) -> str:
+        return f"{self._account_name} Uber Eats {self.translation_key.replace('_', ' ').title()}"
+
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        """Return (native_value, extra_state_attributes) for the current data."""
+        raise NotImplementedError
+
+    def _refresh_state(self) -> bool:
+        """Recompute state and attributes; return True if either changed."""
+        if self.coordinator.data is None:
+            return False
+        value, attrs = self._compute_state()
+        if value == self._attr_native_value and attrs == self._attr_extra_state_attributes:
+            return False
+        self._attr_native_value = value
+        self._attr_extra_state_attributes = attrs
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        changed = self._refresh_state()
+        available = self.available
+        if changed or available != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
+
+
+class UberEatsOrderSensor(UberEatsEntity):
+    """Order count as state, one orderN_<key> attribute per active order."""
+
+    _order_key: str = ""
+    _order_default: Any = None
+
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        return (
+            _order_count_state(self.coordinator),
+            _multi_order_attrs(self.coordinator, self._order_key, self._order_default),
+        )
+
+# ---------- Helper for native_value (count or "No active order") ----------
+def _order_count_state(coordinator) -> str:
+    """Return 'No active order' or the count of active orders as string."""
+    orders = _get_orders(coordinator)
+    count = len(orders)
+    if count == 0:
+        return "No active order"
+    return str(count)
+
+# ---------- Sensors ----------
+class UberEatsOrderStage(UberEatsOrderSensor):
+    _attr_translation_key = "order_stage"
+    _order_key = "order_stage"
+    _order_default = "No Active Order"
+
+class UberEatsOrderStatus(UberEatsOrderSensor):
+    _attr_translation_key = "order_status"
+    _order_key = "order_status"
+    _order_default = "No Active Order"
+
+class UberEatsDriverName(UberEatsOrderSensor):
+    _attr_translation_key = "driver_name"
+    _order_key = "driver_name"
+    _order_default = "No Driver Assigned"
+
+class UberEatsDriverETA(UberEatsEntity):
+    _attr_translation_key = "driver_eta"
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        orders = _get_orders(self.coordinator)
+        attrs = {"orders_count": len(orders), "timezone": str(dt_util.DEFAULT_TIME_ZONE)}
+        for i, o in enumerate(orders, 1):
+            short = _format_short_time(o.driver_eta)
+            attrs[f"order{i}_eta"] = short if short else "No ETT Available"
+            attrs[f"order{i}_minutes_remaining"] = o.minutes_remaining
+            # Kinematic estimate next to Uber's (see eta.py)
+            estimate = _get_estimate(self.coordinator, o)
+            if estimate is not None:
+                attrs[f"order{i}_estimated_eta"] = _format_short_time(estimate.arrival)
+                attrs[f"order{i}_estimated_eta_range"] = (
+                    f"{_format_short_time(estimate.earliest)}-{_format_short_time(estimate.latest)}"
+                )
+                attrs[f"order{i}_estimated_minutes_remaining"] = estimate.minutes_remaining(time.time())
+        return _order_count_state(self.coordinator), attrs
+
+class UberEatsOrderHistory(UberEatsEntity):
+    _attr_translation_key = "order_history"
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        history = getattr(self.coordinator, "_order_history", [])
+        # Copy so the change check compares against a snapshot, not the live list
+        return _order_count_state(self.coordinator), {"history": list(history), "orders_count": _get_orders_count(self.coordinator)}
+
+class UberEatsRestaurantName(UberEatsOrderSensor):
+    _attr_translation_key = "restaurant_name"
+    _order_key = "restaurant_name"
+    _order_default = "No Restaurant"
+
+class UberEatsOrderId(UberEatsOrderSensor):
+    _attr_translation_key = "order_id"
+    _order_key = "order_id"
+    _order_default = "No Active Order"
+
+class UberEatsLatestArrival(UberEatsOrderSensor):
+    _attr_translation_key = "latest_arrival"
+    _order_key = "latest_arrival"
+    _order_default = "No Latest Arrival"
+
+class UberEatsDriverLatitude(UberEatsEntity):
+    _attr_translation_key = "driver_latitude"
+    _attr_native_unit_of_measurement = "°"
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        """Driver latitude or HA home latitude when no active order."""
+        value = float(self.coordinator.hass.config.latitude or 0.0)
+        orders = _get_orders(self.coordinator)
+        if orders and orders[0].latitude is not None:
+            value = float(orders[0].latitude)
+        return value, _multi_order_attrs(self.coordinator, "driver_location_lat", "No Active Order")
+
+class UberEatsDriverLongitude(UberEatsEntity):
+    _attr_translation_key = "driver_longitude"
+    _attr_native_unit_of_measurement = "°"
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        """Driver longitude or HA home longitude when no active order."""
+        value = float(self.coordinator.hass.config.longitude or 0.0)
+        orders = _get_orders(self.coordinator)
+        if orders and orders[0].longitude is not None:
+            value = float(orders[0].longitude)
+        return value, _multi_order_attrs(self.coordinator, "driver_location_lon", "No Active Order")
+
+# ---- Location sensors (trimmed to match coordinator) ----
+class UberEatsDriverLocationStreet(UberEatsOrderSensor):
+    _attr_translation_key = "driver_location_street"
+    _order_key = "driver_location_street"
+    _order_default = "No Active Order"
+
+class UberEatsDriverLocationSuburb(UberEatsOrderSensor):
+    _attr_translation_key = "driver_location_suburb"
+    _order_key = "driver_location_suburb"
+    _order_default = "Unknown"
+
+class UberEatsDriverLocationQuarter(UberEatsOrderSensor):
+    _attr_translation_key = "driver_location_quarter"
+    _order_key = "driver_location_quarter"
+    _order_default = "Unknown"
+
+class UberEatsDriverLocationCounty(UberEatsOrderSensor):
+    _attr_translation_key = "driver_location_county"
+    _order_key = "driver_location_county"
+    _order_default = "Unknown"
+
+class UberEatsDriverLocationAddress(UberEatsOrderSensor):
+    _attr_translation_key = "driver_location_address"
+    _order_key = "driver_location_address"
+    _order_default = "Unknown"
+
+class UberEatsDriverETT(UberEatsEntity):
+    _attr_translation_key = "driver_ett"
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        orders = _get_orders(self.coordinator)
+        attrs = {"orders_count": len(orders)}
+        for i, o in enumerate(orders, 1):
+            minutes = o.minutes_remaining
+            attrs[f"order{i}_minutes_remaining"] = minutes if minutes is not None else "No ETT Available"
+        return _order_count_state(self.coordinator), attrs
+
+
+def _get_estimate(coordinator, order: ParsedOrder):
+    """Kinematic arrival estimate for an order, if the courier is heading home."""
+    return (coordinator.data.get("eta_estimates") or {}).get(order.order_id)
+
+class UberEatsEstimatedArrival(UberEatsEntity):
+    """First order's arrival estimated from the courier's movement."""
+
+    _attr_translation_key = "estimated_arrival"
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        orders = _get_orders(self.coordinator)
+        attrs: dict[str, Any] = {"orders_count": len(orders)}
+        value = None
+        for i, o in enumerate(orders, 1):
+            estimate = _get_estimate(self.coordinator, o)
+            if estimate is None:
+                continue
+            if value is None:
+                value = dt_util.utc_from_timestamp(estimate.arrival)
+            attrs[f"order{i}_uber_eta"] = _format_short_time(o.driver_eta)
+            attrs[f"order{i}_earliest"] = _format_short_time(estimate.earliest)
+            attrs[f"order{i}_latest"] = _format_short_time(estimate.latest)
+            attrs[f"order{i}_remaining_distance_m"] = round(estimate.remaining_m)
+            attrs[f"order{i}_speed_kmh"] = round(estimate.speed_mps * 3.6, 1)
+        return value, attrs
+
+
+# ---------- Statistics Sensors ----------
+def _get_statistics(coordinator) -> dict[str, Any]:
+    """Get current-year statistics from the coordinator's running aggregates."""
+    statistics = getattr(coordinator, "statistics", None)
+    if statistics is None:
+        return {}
+    return statistics.summary(datetime.now().year)
+
+
+class UberEatsStatisticsSensor(UberEatsEntity):
+    """Current-year statistic read from the past-order aggregates."""
+
+    _attr_state_class = SensorStateClass.TOTAL
+    _stat_key: str = ""
+    _stat_default: Any = 0
+
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        stats = _get_statistics(self.coordinator)
+        return stats.get(self._stat_key, self._stat_default), {"year": stats.get("year", datetime.now().year)}
+
+
+class UberEatsTotalDeliveries(UberEatsStatisticsSensor):
+    _attr_translation_key = "total_deliveries"
+    _attr_native_unit_of_measurement = "orders"
+    _stat_key = "total_orders"
+    _stat_default = 0
+
+
+class UberEatsTotalSpent(UberEatsStatisticsSensor):
+    _attr_translation_key = "total_spent"
+    _attr_native_unit_of_measurement = "USD"
+    _stat_key = "total_spent"
+    _stat_default = 0.0
+
+
+class UberEatsTotalDeliveryFees(UberEatsStatisticsSensor):
+    _attr_translation_key = "total_delivery_fees"
+    _attr_native_unit_of_measurement = "USD"
+    _stat_key = "total_delivery_fees"
+    _stat_default = 0.0
+
+
+# ---------- Diagnostic Sensors ----------
+def _round_ms(value: float | None) -> float | None:
+    return round(value, 1) if value is not None else None
+
+
+class UberEatsMetricsSensor(UberEatsEntity):
+    """Poll-cycle figure read from the coordinator's rolling histograms (see metrics.py).
+
+    Cycles that return unchanged data do not notify coordinator listeners but
+    still move the histograms, so these sensors also follow the metrics signal
+    sent at the end of every cycle (written only when the figures change).
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_METRICS_UPDATED, self._handle_metrics_update)
+        )
+
+    @callback
+    def _handle_metrics_update(self, entry_id: str) -> None:
+        if entry_id == self.coordinator.entry_id:
+            self._handle_coordinator_update()
+
+
+class UberEatsCycleTime(UberEatsMetricsSensor):
+    _attr_translation_key = "cycle_time"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset(
+        f"{stage}_{stat}_ms" for stage in (*CYCLE_STAGES, "profile", "past_orders") for stat in ("p50", "p95")
+    )
+
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        metrics = self.coordinator.metrics
+        attrs = {"cycles": metrics.stages["cycle"].count}
+        for stage in (*CYCLE_STAGES, "profile", "past_orders"):
+            histogram = metrics.stages[stage]
+            attrs[f"{stage}_p50_ms"] = _round_ms(histogram.percentile(50))
+            attrs[f"{stage}_p95_ms"] = _round_ms(histogram.percentile(95))
+        return metrics.p95("cycle"), attrs
+
+
+class UberEatsSlowestStage(UberEatsMetricsSensor):
+    _attr_translation_key = "slowest_stage"
+
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        metrics = self.coordinator.metrics
+        return metrics.slowest_stage(), {}
+
+
+class UberEatsResponseSize(UberEatsMetricsSensor):
+    _attr_translation_key = "response_size"
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        sizes = self.coordinator.metrics.payload_bytes
+        return sizes.last, {
+            "p50_bytes": sizes.percentile(50),
+            "p95_bytes": sizes.percentile(95),
+            "unchanged_bodies": self.coordinator.metrics.unchanged_bodies,
+        }
+
+
+class UberEatsPollErrors(UberEatsMetricsSensor):
+    _attr_translation_key = "poll_errors"
+    _attr_native_unit_of_measurement = "errors"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        errors = self.coordinator.metrics.errors
+        return sum(errors.values()), dict(sorted(errors.items()))
+
+
+class UberEatsGeocodeHitRatio(UberEatsMetricsSensor):
+    _attr_translation_key = "geocode_hit_ratio"
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        metrics = self.coordinator.metrics
+        ratio = metrics.geocode_hit_ratio
+        return (
+            round(ratio * 100, 1) if ratio is not None else None,
+            {"hits": metrics.geocode_hits, "misses": metrics.geocode_misses},
+        )
+
+
+class UberEatsEtaAccuracy(UberEatsEntity):
+    """Mean absolute error of the kinematic ETA against actual deliveries (see eta.py)."""
+
+    _attr_translation_key = "eta_accuracy"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+
+    def _compute_state(self) -> tuple[Any, dict[str, Any]]:
+        report = self.coordinator.eta.accuracy()
+        return report["estimate"]["mae_min"], {
+            "deliveries": report["deliveries"],
+            "samples": report["samples"],
+            "estimate_bias_min": report["estimate"]["bias_min"],
+            "uber_mae_min": report["uber"]["mae_min"],
+            "uber_bias_min": report["uber"]["bias_min"],
+            "band_coverage": report["band_coverage"],
+        }
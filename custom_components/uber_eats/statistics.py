@@ -0,0 +1,218 @@
+"""Running past-order statistics.
+
+Aggregates (order count, spend, fees, tax, promotions) are kept per year,
+month, weekday and restaurant, and updated order by order as syncs write to
+the history store, so sensors and the panel read totals without rescanning
+the history. Cancelled orders are not counted. Syncs apply their deltas from
+the executor, so updates and reads are serialized by a lock.
+"""
+from __future__ import annotations
+
+import heapq
+import threading
+from datetime import datetime, tzinfo
+from typing import Any, Iterable
+
+DEFAULT_TOP_RESTAURANTS = 3
+_TOP_TRACKED = 10  # restaurants kept ranked per year; bounded regardless of history size
+_WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+
+class Totals:
+    """Summed amounts for one bucket."""
+
+    __slots__ = ("orders", "spent", "delivery_fees", "tax", "promotions")
+
+    def __init__(self) -> None:
+        self.orders = 0
+        self.spent = 0.0
+        self.delivery_fees = 0.0
+        self.tax = 0.0
+        self.promotions = 0.0
+
+    def add(self, amounts: tuple[float, float, float, float], sign: int) -> None:
+        spent, delivery_fee, tax, promotions = amounts
+        self.orders += sign
+        self.spent += sign * spent
+        self.delivery_fees += sign * delivery_fee
+        self.tax += sign * tax
+        self.promotions += sign * promotions
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "total_orders": self.orders,
+            "total_spent": round(self.spent, 2),
+            "total_delivery_fees": round(self.delivery_fees, 2),
+            "total_tax": round(self.tax, 2),
+            "total_promotions": round(self.promotions, 2),
+        }
+
+
+class _TopRestaurants:
+    """Bounded ranking of a year's restaurants by order count.
+
+    Counts are held for every restaurant, but only the leading _TOP_TRACKED
+    are kept ranked. An increment touches at most that short list; a decrement
+    inside it (cancellation, correction) marks it for a rebuild on next read.
+    """
+
+    __slots__ = ("counts", "names", "spent", "_top", "_dirty")
+
+    def __init__(self) -> None:
+        self.counts: dict[str, int] = {}
+        self.names: dict[str, str] = {}
+        self.spent: dict[str, float] = {}
+        self._top: list[str] = []
+        self._dirty = False
+
+    def add(self, store_uuid: str, name: str, total: float, sign: int) -> None:
+        count = self.counts.get(store_uuid, 0) + sign
+        if count <= 0:
+            self.counts.pop(store_uuid, None)
+            self.names.pop(store_uuid, None)
+            self.spent.pop(store_uuid, None)
+        else:
+            self.counts[store_uuid] = count
+            self.spent[store_uuid] = self.spent.get(store_uuid, 0.0) + sign * total
+            if name:
+                self.names[store_uuid] = name
+        if self._dirty:
+            return
+        if sign < 0:
+            if store_uuid in self._top:
+                self._dirty = True
+            return
+        if store_uuid not in self._top:
+            if len(self._top) >= _TOP_TRACKED:
+                if count <= self.counts[self._top[-1]]:
+                    return
+                self._top.pop()
+            self._top.append(store_uuid)
+        self._top.sort(key=lambda uuid: self.counts[uuid], reverse=True)
+
+    def top(self, limit: int) -> list[dict[str, Any]]:
+        if self._dirty:
+            self._top = heapq.nlargest(_TOP_TRACKED, self.counts, key=self.counts.__getitem__)
+            self._dirty = False
+        return [
+            {
+                "name": self.names.get(uuid) or "Unknown",
+                "order_count": self.counts[uuid],
+                "total_spent": round(self.spent[uuid], 2),
+            }
+            for uuid in self._top[:limit]
+        ]
+
+
+class OrderStatistics:
+    """Incrementally maintained aggregates over an account's past orders."""
+
+    def __init__(self, time_zone: tzinfo | None = None) -> None:
+        self._time_zone = time_zone
+        self._years: dict[int, Totals] = {}
+        self._months: dict[tuple[int, int], Totals] = {}
+        self._weekdays: dict[tuple[int, int], Totals] = {}
+        self._restaurants: dict[int, _TopRestaurants] = {}
+        self._version = 0
+        self._summaries: dict[tuple[int, int], tuple[int, dict[str, Any]]] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_orders(cls, orders: Iterable[dict[str, Any]], time_zone: tzinfo | None = None) -> OrderStatistics:
+        """Build aggregates from a full order list."""
+        stats = cls(time_zone)
+        stats.add_orders(orders)
+        return stats
+
+    def _bucket(self, order: dict[str, Any]) -> datetime | None:
+        completed_at = order.get("completed_at") or ""
+        if not completed_at:
+            return None
+        try:
+            when = datetime.fromisoformat(completed_at.replace("Z", "+00:00"))
+        except ValueError:
+            if not completed_at[:4].isdigit():
+                return None
+            return datetime(int(completed_at[:4]), 1, 1)
+        if self._time_zone is not None and when.tzinfo is not None:
+            when = when.astimezone(self._time_zone)
+        return when
+
+    def _apply(self, order: dict[str, Any], sign: int) -> None:
+        if order.get("is_cancelled"):
+            return
+        when = self._bucket(order)
+        if when is None:
+            return
+        total = order.get("total") or 0
+        amounts = (total, order.get("delivery_fee") or 0, order.get("tax") or 0, order.get("promotions") or 0)
+        year = when.year
+        self._years.setdefault(year, Totals()).add(amounts, sign)
+        self._months.setdefault((year, when.month), Totals()).add(amounts, sign)
+        self._weekdays.setdefault((year, when.weekday()), Totals()).add(amounts, sign)
+        store_uuid = order.get("store_uuid") or ""
+        if store_uuid:
+            self._restaurants.setdefault(year, _TopRestaurants()).add(
+                store_uuid, order.get("restaurant_name") or "", total, sign
+            )
+        self._version += 1
+
+    def add_orders(self, orders: Iterable[dict[str, Any]]) -> None:
+        """Count new orders."""
+        with self._lock:
+            for order in orders:
+                self._apply(order, 1)
+
+    def remove_orders(self, orders: Iterable[dict[str, Any]]) -> None:
+        """Stop counting orders (e.g. the stored versions of re-synced orders)."""
+        with self._lock:
+            for order in orders:
+                self._apply(order, -1)
+
+    def replace_orders(self, previous: Iterable[dict[str, Any]], current: Iterable[dict[str, Any]]) -> None:
+        """Swap stored versions of orders for their freshly synced versions."""
+        with self._lock:
+            self.remove_orders(previous)
+            self.add_orders(current)
+
+    @property
+    def years(self) -> list[int]:
+        """Years that have at least one counted order, newest first."""
+        with self._lock:
+            return sorted((year for year, totals in self._years.items() if totals.orders > 0), reverse=True)
+
+    def year_totals(self, year: int) -> dict[str, Any]:
+        """Totals for one year."""
+        with self._lock:
+            return (self._years.get(year) or Totals()).as_dict()
+
+    def summary(self, year: int, top: int = DEFAULT_TOP_RESTAURANTS) -> dict[str, Any]:
+        """Year statistics with month, weekday and top-restaurant breakdowns.
+
+        The result is cached until the next change, so frequent readers
+        (sensors on every coordinator update) cost a dict lookup.
+        """
+        with self._lock:
+            return self._summary(year, top)
+
+    def _summary(self, year: int, top: int) -> dict[str, Any]:
+        cached = self._summaries.get((year, top))
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        restaurants = self._restaurants.get(year)
+        result = {
+            "year": year,
+            **self.year_totals(year),
+            "top_restaurants": restaurants.top(top) if restaurants else [],
+            "months": {
+                f"{year}-{month:02d}": totals.as_dict()
+                for (bucket_year, month), totals in sorted(self._months.items())
+                if bucket_year == year and totals.orders > 0
+            },
+            "weekdays": {
+                _WEEKDAYS[weekday]: (self._weekdays.get((year, weekday)) or Totals()).as_dict()
+                for weekday in range(7)
+            },
+        }
+        self._summaries[(year, top)] = (self._version, result)
+        return result
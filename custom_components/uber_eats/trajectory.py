@@ -0,0 +1,144 @@
+"""Courier trajectory per active order.
+
+Every poll overwrites the order's driver position; this keeps where the
+courier has been so the panel can draw the route. Each order's track is a
+fixed-size ring of array('d') columns (lat, lon, unix time), so an account
+never holds more than TRAJECTORY_MAX_ORDERS * TRAJECTORY_MAX_POINTS points
+however long a delivery runs. Points closer than TRAJECTORY_MIN_DISTANCE_M
+to the last kept one are skipped unless TRAJECTORY_MAX_INTERVAL has passed,
+and a track is released as soon as its order leaves getActiveOrdersV1.
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Any, Iterable
+
+from .const import (
+    TRAJECTORY_MAX_INTERVAL,
+    TRAJECTORY_MAX_ORDERS,
+    TRAJECTORY_MAX_POINTS,
+    TRAJECTORY_MIN_DISTANCE_M,
+)
+from .geo import equirectangular_m
+from .models import ParsedOrder
+
+
+class Trajectory:
+    """Bounded, downsampled track of one order's courier positions."""
+
+    __slots__ = ("_lat", "_lon", "_ts", "_start", "_size", "capacity", "dropped", "updated")
+
+    def __init__(self, capacity: int = TRAJECTORY_MAX_POINTS) -> None:
+        zeros = bytes(8 * capacity)  # preallocated: the ring never grows
+        self._lat = array("d", zeros)
+        self._lon = array("d", zeros)
+        self._ts = array("d", zeros)
+        self._start = 0
+        self._size = 0
+        self.capacity = capacity
+        self.dropped = 0  # oldest points overwritten once the ring was full
+        self.updated = 0.0  # time of the last append attempt (least-recently-updated eviction)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last(self) -> tuple[float, float, float] | None:
+        """Most recent kept point as (lat, lon, ts)."""
+        if not self._size:
+            return None
+        i = (self._start + self._size - 1) % self.capacity
+        return self._lat[i], self._lon[i], self._ts[i]
+
+    @property
+    def nbytes(self) -> int:
+        return 3 * self.capacity * self._lat.itemsize
+
+    def append(self, lat: float, lon: float, ts: float) -> bool:
+        """Add a position unless it is too close to the last kept one. True if kept."""
+        self.updated = ts
+        last = self.last
+        if last is not None:
+            if ts <= last[2]:
+                return False
+            if (
+                ts - last[2] < TRAJECTORY_MAX_INTERVAL
+                and equirectangular_m(last[0], last[1], lat, lon) < TRAJECTORY_MIN_DISTANCE_M
+            ):
+                return False
+        if self._size < self.capacity:
+            i = (self._start + self._size) % self.capacity
+            self._size += 1
+        else:
+            i = self._start
+            self._start = (self._start + 1) % self.capacity
+            self.dropped += 1
+        self._lat[i] = lat
+        self._lon[i] = lon
+        self._ts[i] = ts
+        return True
+
+    def points(self) -> list[list[float]]:
+        """Kept points, oldest first, as [lat, lon, ts]."""
+        result = []
+        for n in range(self._size):
+            i = (self._start + n) % self.capacity
+            result.append([self._lat[i], self._lon[i], self._ts[i]])
+        return result
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"points": self.points(), "dropped": self.dropped}
+
+
+class TrajectoryStore:
+    """Trajectories of one account's active orders."""
+
+    def __init__(self, max_orders: int = TRAJECTORY_MAX_ORDERS, capacity: int = TRAJECTORY_MAX_POINTS) -> None:
+        self.max_orders = max_orders
+        self.capacity = capacity
+        self._tracks: dict[str, Trajectory] = {}
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def get(self, order_id: str) -> Trajectory | None:
+        return self._tracks.get(order_id)
+
+    def update(self, orders: Iterable[ParsedOrder], now: float) -> None:
+        """Record each order's courier position and release tracks of orders that are gone."""
+        orders = [order for order in orders if order.order_id]
+        current = {order.order_id for order in orders}
+        for order_id in [order_id for order_id in self._tracks if order_id not in current]:
+            del self._tracks[order_id]
+
+        for order in orders:
+            coords = order.driver_coords
+            if coords is None:
+                continue
+            track = self._tracks.get(order.order_id)
+            if track is None:
+                if len(self._tracks) >= self.max_orders:
+                    stale = min(self._tracks, key=lambda order_id: self._tracks[order_id].updated)
+                    del self._tracks[stale]
+                track = self._tracks[order.order_id] = Trajectory(self.capacity)
+            track.append(coords[0], coords[1], now)
+
+    def clear(self) -> None:
+        self._tracks.clear()
+
+    def as_dict(self, order_id: str | None = None) -> dict[str, dict[str, Any]]:
+        """Tracks keyed by order id (only order_id's, if given)."""
+        if order_id is not None:
+            track = self._tracks.get(order_id)
+            return {order_id: track.as_dict()} if track is not None else {}
+        return {order_id: track.as_dict() for order_id, track in self._tracks.items()}
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "orders": len(self._tracks),
+            "points": sum(len(track) for track in self._tracks.values()),
+            "dropped": sum(track.dropped for track in self._tracks.values()),
+            "bytes": sum(track.nbytes for track in self._tracks.values()),
+            "max_bytes": self.max_orders * 3 * self.capacity * array("d").itemsize,
+        }
@@ -1,16 +1,14 @@
 """TTS notification service for Uber Eats order events.
 
-Messages from Agent-Files/tts.md. Sends one TTS per media player in parallel,
-with volume_set before each. No idle check.
+Messages from Agent-Files/tts.md. Announcements are handed to the per-player
+queue (see tts_queue.py), which orders, merges and paces them.
 """
 from __future__ import annotations
 
-import asyncio
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
-from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, callback
 
 from .const import (
     CONF_TTS_ENTITY_ID,
@@ -18,6 +16,7 @@ from .const import (
     CONF_TTS_MESSAGE_PREFIX,
     DEFAULT_TTS_MESSAGE_PREFIX,
 )
+from .tts_queue import Speech, async_get_tts_queue
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -59,76 +58,38 @@ def build_message(
             place = county or suburb or "unknown area"
         eta = (order_data.get("driver_eta_str") or "—").strip()
         ett = order_data.get("minutes_remaining")
+        if order_data.get("estimated_eta_str"):
+            # Estimated from the courier's movement (see eta.py), finer than Uber's ETA
+            eta = order_data["estimated_eta_str"]
+            ett = order_data.get("estimated_minutes_remaining")
         ett_str = f"{ett} minutes" if ett is not None and ett != "" else "—"
         return f"{prefix}, {driver} was last seen near {street} in {place}, expected to arrive at {eta} in {ett_str}."
 
     return ""
 
 
-async def _find_tts_entity(hass: HomeAssistant, language: str | None = None) -> str | None:
+def _find_tts_entity(hass: HomeAssistant, language: str | None = None) -> str | None:
     """Find an available TTS entity (fallback if user config missing)."""
     lang = (language or "en").lower()
-    tts_entities = []
-    for state in hass.states.async_all():
-        if state.entity_id.startswith("tts."):
-            tts_entities.append(state.entity_id)
+    tts_entities = hass.states.async_entity_ids("tts")
     if not tts_entities:
         _LOGGER.warning("No TTS entities found in Home Assistant")
         return None
     for entity_id in tts_entities:
         if lang in entity_id.lower():
             return entity_id
-    return tts_entities[0] if tts_entities else None
+    return tts_entities[0]
 
 
-async def _send_tts_to_one(
-    hass: HomeAssistant,
-    tts_entity: str,
-    media_player_id: str,
-    message: str,
-    volume_level: float,
-    cache: bool,
-    language: str | None = None,
-    options: dict[str, Any] | None = None,
-) -> None:
-    """Set volume then send TTS to a single media player."""
-    volume_level = max(0.0, min(1.0, volume_level))
-    try:
-        await hass.services.async_call(
-            "media_player",
-            "volume_set",
-            {ATTR_ENTITY_ID: media_player_id, "volume_level": volume_level},
-            blocking=True,
-        )
-    except Exception as e:
-        _LOGGER.warning("Volume set failed for %s: %s", media_player_id, e)
-    try:
-        speak_data: dict[str, Any] = {
-            "media_player_entity_id": media_player_id,
-            "message": message,
-            "cache": cache,
-        }
-        if language:
-            speak_data["language"] = language
-        if options and isinstance(options, dict):
-            speak_data["options"] = options
-        await hass.services.async_call(
-            "tts",
-            "speak",
-            speak_data,
-            target={"entity_id": tts_entity},
-            blocking=True,
-        )
-        _LOGGER.debug("TTS sent to %s via %s", media_player_id, tts_entity)
-    except Exception as e:
-        _LOGGER.error("TTS speak failed for %s: %s", media_player_id, e)
-
-
-async def send_tts_if_idle(
+@callback
+def async_announce(
     hass: HomeAssistant,
     tts_entity_id: str,
     media_player_ids: list[str],
     message: str,
+    kind: str,
+    key: str,
+    prefix: str = "",
     cache: bool = True,
     volume_level: float = 0.5,
     per_player_volumes: dict[str, float] | None = None,
@@ -136,8 +97,9 @@ async def send_tts_if_idle(
     options: dict[str, Any] | None = None,
     per_player_settings: dict[str, dict[str, Any]] | None = None,
 ) -> bool:
-    """Send TTS to each media player in parallel; volume_set before each. No idle check.
-    
+    """Queue an announcement on each media player (see tts_queue.py).
+
+    kind is the message type (it sets the priority), key the config entry.
     Supports per-player TTS entities via per_player_settings[player_id]["tts_entity_id"].
     """
     if not message or not message.strip():
@@ -148,36 +110,35 @@ async def send_tts_if_idle(
         _LOGGER.warning("TTS skipped: no media players configured")
         return False
 
-    global_tts_entity = (tts_entity_id or "").strip()
-    if not global_tts_entity:
-        global_tts_entity = await _find_tts_entity(hass, language)
-
     valid_players = [mp for mp in media_player_ids if hass.states.get(mp) is not None]
     if not valid_players:
         _LOGGER.error("TTS skipped: no media players found: %s", media_player_ids)
         return False
 
+    global_tts_entity = (tts_entity_id or "").strip()
+    if not global_tts_entity:
+        global_tts_entity = _find_tts_entity(hass, language)
+
     ppv = per_player_volumes or {}
     pps = per_player_settings or {}
     msg = message.strip()
-
-    async def _send_for_player(mp: str):
+    tts_queue = async_get_tts_queue(hass)
+    queued = False
+    for mp in valid_players:
         player_settings = pps.get(mp, {})
         # Per-player TTS entity takes precedence
         player_tts_entity = (player_settings.get("tts_entity_id") or "").strip() or global_tts_entity
         if not player_tts_entity:
             _LOGGER.warning("TTS skipped for %s: no TTS entity configured", mp)
-            return
+            continue
         player_cache = player_settings.get("cache", cache)
-        player_lang = player_settings.get("language") or language
-        player_opts = player_settings.get("options") or options
-        await _send_tts_to_one(
-            hass, player_tts_entity, mp, msg,
-            volume_level=ppv.get(mp, volume_level),
+        speech = Speech(
+            tts_entity=player_tts_entity,
+            volume=float(ppv.get(mp, volume_level)),
             cache=player_cache if player_cache is not None else cache,
-            language=player_lang,
-            options=player_opts,
+            language=player_settings.get("language") or language,
+            options=player_settings.get("options") or options,
         )
-
-    await asyncio.gather(*[_send_for_player(mp) for mp in valid_players])
-    return True
+        tts_queue.async_enqueue(mp, msg, speech, kind, key, prefix)
+        queued = True
+    return queued
@@ -0,0 +1,278 @@
+"""Integration-wide announcement queue, one lane per media player.
+
+Each poll can produce several announcements (and several accounts can share a
+speaker), which used to race their volume_set/tts.speak pairs against the same
+player. Every player now has its own queue and a single worker that:
+
+- waits TTS_COALESCE_WINDOW so a burst from one poll arrives together
+- waits for the player to stop playing (state events, up to TTS_IDLE_TIMEOUT)
+- speaks the highest-priority announcements first, merging up to
+  TTS_MAX_MERGED of them that share the same voice settings into one utterance
+- keeps only the newest interval update per account, and drops it once stale
+
+At most TTS_MAX_CONCURRENT_PLAYERS players are sent volume_set/tts.speak at once.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from typing import Any, NamedTuple
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import (
+    DATA_TTS_QUEUE,
+    TTS_COALESCE_WINDOW,
+    TTS_IDLE_TIMEOUT,
+    TTS_INTERVAL_MAX_AGE,
+    TTS_MAX_CONCURRENT_PLAYERS,
+    TTS_MAX_MERGED,
+    TTS_SETTLE_DELAY,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+INTERVAL_UPDATE = "interval_update"
+
+# Message type -> priority (lower is spoken first). Follows an order's lifecycle,
+# so a merged utterance announces the order before its driver or status
+PRIORITIES = {
+    "new_order": 0,
+    "driver_assigned": 1,
+    "status_change": 2,
+    INTERVAL_UPDATE: 3,
+}
+
+BUSY_STATES = ("playing", "buffering")
+
+
+class Speech(NamedTuple):
+    """How to speak on one player; only announcements with equal settings are merged."""
+
+    tts_entity: str
+    volume: float
+    cache: bool
+    language: str | None = None
+    options: dict[str, Any] | None = None
+
+
+class _Announcement:
+    __slots__ = ("priority", "seq", "kind", "key", "message", "prefix", "speech", "created")
+
+    def __init__(self, seq: int, kind: str, key: str, message: str, prefix: str, speech: Speech) -> None:
+        self.priority = PRIORITIES.get(kind, len(PRIORITIES))
+        self.seq = seq
+        self.kind = kind
+        self.key = key  # config entry the announcement belongs to
+        self.message = message
+        self.prefix = prefix
+        self.speech = speech
+        self.created = time.monotonic()
+
+
+class _PlayerQueue:
+    __slots__ = ("pending", "worker")
+
+    def __init__(self) -> None:
+        self.pending: list[_Announcement] = []
+        self.worker: asyncio.Task | None = None
+
+
+def merge_messages(batch: list[_Announcement]) -> str:
+    """Join announcements into one utterance, saying the shared prefix once."""
+    parts = [batch[0].message]
+    for item in batch[1:]:
+        text = item.message
+        lead = f"{item.prefix}, " if item.prefix else ""
+        if lead and text.startswith(lead) and batch[0].message.startswith(lead):
+            text = text[len(lead):]
+            text = text[:1].upper() + text[1:]
+        parts.append(text)
+    return " ".join(parts)
+
+
+async def _async_speak(hass: HomeAssistant, media_player_id: str, message: str, speech: Speech) -> None:
+    """Set volume then send TTS to a single media player."""
+    volume_level = max(0.0, min(1.0, speech.volume))
+    try:
+        await hass.services.async_call(
+            "media_player",
+            "volume_set",
+            {ATTR_ENTITY_ID: media_player_id, "volume_level": volume_level},
+            blocking=True,
+        )
+    except Exception as e:
+        _LOGGER.warning("Volume set failed for %s: %s", media_player_id, e)
+    try:
+        speak_data: dict[str, Any] = {
+            "media_player_entity_id": media_player_id,
+            "message": message,
+            "cache": speech.cache,
+        }
+        if speech.language:
+            speak_data["language"] = speech.language
+        if speech.options and isinstance(speech.options, dict):
+            speak_data["options"] = speech.options
+        await hass.services.async_call(
+            "tts",
+            "speak",
+            speak_data,
+            target={"entity_id": speech.tts_entity},
+            blocking=True,
+        )
+        _LOGGER.debug("TTS sent to %s via %s", media_player_id, speech.tts_entity)
+    except Exception as e:
+        _LOGGER.error("TTS speak failed for %s: %s", media_player_id, e)
+
+
+def _is_busy(hass: HomeAssistant, media_player_id: str) -> bool:
+    state = hass.states.get(media_player_id)
+    return state is not None and state.state in BUSY_STATES
+
+
+class UberEatsTtsQueue:
+    """Announcement queues for every media player, shared by all accounts."""
+
+    def __init__(self, hass: HomeAssistant, max_players: int = TTS_MAX_CONCURRENT_PLAYERS) -> None:
+        self._hass = hass
+        self._players: dict[str, _PlayerQueue] = {}
+        self._speaking = asyncio.Semaphore(max_players)
+        self._seq = itertools.count()
+        self.enqueued = 0
+        self.spoken = 0  # utterances sent
+        self.merged = 0  # announcements folded into another's utterance
+        self.superseded = 0  # interval updates replaced by a newer one
+        self.dropped = 0  # stale interval updates and duplicates
+        self.idle_timeouts = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return queue counters."""
+        return {
+            "players": len(self._players),
+            "pending": sum(len(queue.pending) for queue in self._players.values()),
+            "enqueued": self.enqueued,
+            "spoken": self.spoken,
+            "merged": self.merged,
+            "superseded": self.superseded,
+            "dropped": self.dropped,
+            "idle_timeouts": self.idle_timeouts,
+        }
+
+    @callback
+    def async_enqueue(
+        self,
+        media_player_id: str,
+        message: str,
+        speech: Speech,
+        kind: str,
+        key: str,
+        prefix: str = "",
+    ) -> None:
+        """Queue an announcement for a player and start its worker if needed."""
+        queue = self._players.setdefault(media_player_id, _PlayerQueue())
+        if kind == INTERVAL_UPDATE:
+            before = len(queue.pending)
+            queue.pending = [
+                item for item in queue.pending if not (item.kind == INTERVAL_UPDATE and item.key == key)
+            ]
+            self.superseded += before - len(queue.pending)
+        queue.pending.append(_Announcement(next(self._seq), kind, key, message, prefix, speech))
+        self.enqueued += 1
+        if queue.worker is None:
+            queue.worker = self._hass.async_create_background_task(
+                self._async_run(media_player_id, queue),
+                name=f"uber_eats_tts_{media_player_id}",
+            )
+
+    @callback
+    def async_cancel(self, key: str) -> None:
+        """Drop the pending announcements of an account (it is being unloaded)."""
+        for queue in self._players.values():
+            queue.pending = [item for item in queue.pending if item.key != key]
+
+    async def _async_run(self, media_player_id: str, queue: _PlayerQueue) -> None:
+        try:
+            while queue.pending:
+                await asyncio.sleep(TTS_COALESCE_WINDOW)
+                if not await self._async_wait_idle(media_player_id):
+                    # Talk over it after all, but not with a position that is minutes old
+                    self.idle_timeouts += 1
+                    _LOGGER.debug("%s still playing after %ss", media_player_id, TTS_IDLE_TIMEOUT)
+                    before = len(queue.pending)
+                    queue.pending = [item for item in queue.pending if item.kind != INTERVAL_UPDATE]
+                    self.dropped += before - len(queue.pending)
+                batch = self._take_batch(queue)
+                if not batch:
+                    continue
+                async with self._speaking:
+                    await _async_speak(self._hass, media_player_id, merge_messages(batch), batch[0].speech)
+                self.spoken += 1
+                self.merged += len(batch) - 1
+                # Give the player time to report "playing" before the next idle check
+                await asyncio.sleep(TTS_SETTLE_DELAY)
+        finally:
+            queue.worker = None
+            if not queue.pending and self._players.get(media_player_id) is queue:
+                del self._players[media_player_id]
+
+    async def _async_wait_idle(self, media_player_id: str) -> bool:
+        """Wait until the player is not playing; False if it still is after TTS_IDLE_TIMEOUT."""
+        if not _is_busy(self._hass, media_player_id):
+            return True
+        idle = self._hass.loop.create_future()
+
+        @callback
+        def _state_changed(event) -> None:
+            new_state = event.data.get("new_state")
+            if not idle.done() and (new_state is None or new_state.state not in BUSY_STATES):
+                idle.set_result(None)
+
+        unsub = async_track_state_change_event(self._hass, [media_player_id], _state_changed)
+        try:
+            async with asyncio.timeout(TTS_IDLE_TIMEOUT):
+                await idle
+            return True
+        except TimeoutError:
+            return False
+        finally:
+            unsub()
+
+    def _take_batch(self, queue: _PlayerQueue) -> list[_Announcement]:
+        """Pop the next utterance's announcements, highest priority first."""
+        now = time.monotonic()
+        pending = []
+        for item in queue.pending:
+            if item.kind == INTERVAL_UPDATE and now - item.created > TTS_INTERVAL_MAX_AGE:
+                self.dropped += 1
+                continue
+            pending.append(item)
+        pending.sort(key=lambda item: (item.priority, item.seq))
+
+        batch: list[_Announcement] = []
+        rest: list[_Announcement] = []
+        texts = set()
+        for item in pending:
+            if batch and (len(batch) >= TTS_MAX_MERGED or item.speech != batch[0].speech):
+                rest.append(item)
+            elif item.message in texts:
+                self.dropped += 1  # e.g. two accounts announcing the same thing
+            else:
+                texts.add(item.message)
+                batch.append(item)
+        queue.pending = rest
+        return batch
+
+
+@callback
+def async_get_tts_queue(hass: HomeAssistant) -> UberEatsTtsQueue:
+    """Return the integration-wide TTS queue, creating it if needed."""
+    tts_queue: UberEatsTtsQueue | None = hass.data.get(DATA_TTS_QUEUE)
+    if tts_queue is None:
+        tts_queue = UberEatsTtsQueue(hass)
+        hass.data[DATA_TTS_QUEUE] = tts_queue
+    return tts_queue
@@ -4,16 +4,26 @@ from __future__ import annotations
 import json
 import logging
 import os
+from datetime import date, datetime, timedelta
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.config_entries import ConfigEntryState
-
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.util import dt as dt_util
+
+from .geocode import async_get_geocode_cache
+from .history_store import DEFAULT_SORT, SORT_KEYS
+from .http_client import async_get_http_client
+from .polling import clamp_poll_bounds
+from .scheduler import async_get_poll_scheduler
 from .const import (
     DOMAIN,
+    SIGNAL_ACCOUNT_UPDATED,
     CONF_ACCOUNT_NAME,
     CONF_TIME_ZONE,
     CONF_TTS_ENABLED,
@@ -35,6 +45,14 @@ from .const import (
     DEFAULT_DRIVER_NEARBY_DISTANCE_FEET,
     DEFAULT_TTS_VOLUME,
     DEFAULT_TTS_INTERVAL_MINUTES,
+    CONF_POLL_INTERVAL_MIN,
+    CONF_POLL_INTERVAL_MAX,
+    CONF_PAST_ORDERS_FRESHNESS,
+    DEFAULT_POLL_INTERVAL_MIN,
+    DEFAULT_POLL_INTERVAL_MAX,
+    DEFAULT_PAST_ORDERS_FRESHNESS,
+    PAST_ORDERS_PAGE_SIZE,
+    PAST_ORDERS_MAX_PAGE_SIZE,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -55,179 +73,124 @@ def _get_integration_version() -> str:
     return _INTEGRATION_VERSION
 
 
-@callback
-def async_setup(hass: HomeAssistant) -> None:
-    """Set up WebSocket API."""
-    websocket_api.async_register_command(hass, websocket_get_accounts)
-    websocket_api.async_register_command(hass, websocket_get_account_data)
-    websocket_api.async_register_command(hass, websocket_delete_account)
-    websocket_api.async_register_command(hass, websocket_get_tts_entities)
-    websocket_api.async_register_command(hass, websocket_get_tts_settings)
-    websocket_api.async_register_command(hass, websocket_update_tts_settings)
-    websocket_api.async_register_command(hass, websocket_get_automations)
-    websocket_api.async_register_command(hass, websocket_test_tts)
-    websocket_api.async_register_command(hass, websocket_get_past_orders)
-    websocket_api.async_register_command(hass, websocket_get_user_profile)
+def _orders_array(data: dict[str, Any]) -> list[dict[str, Any]]:
+    """Serialized orders, each with its kinematic arrival estimate (see eta.py) if any."""
+    estimates = data.get("eta_estimates") or {}
+    result = []
+    for order in data.get("orders", []):
+        estimate = estimates.get(order.order_id)
+        order_dict = order.as_dict()
+        result.append({**order_dict, "estimated_eta": estimate.as_dict()} if estimate is not None else order_dict)
+    return result
 
 
-@websocket_api.websocket_command(
-    {
-        "type": "uber_eats/get_accounts",
-    }
-)
-@websocket_api.async_response
-async def websocket_get_accounts(
-    hass: HomeAssistant,
-    connection: websocket_api.ActiveConnection,
-    msg: dict[str, Any],
-) -> None:
-    """Get all Uber Eats accounts."""
-    accounts = []
-    
+def _build_account_summary(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Build the account list entry used by get_accounts."""
     # Get home coordinates for fallback
     home_lat = hass.config.latitude
     home_lon = hass.config.longitude
-    
-    for entry in hass.config_entries.async_entries(DOMAIN):
-        # Determine connection status based on entry state
-        if entry.state == ConfigEntryState.LOADED:
-            connection_status = "connected"
-        elif entry.state == ConfigEntryState.SETUP_ERROR:
-            connection_status = "error"
-        elif entry.state == ConfigEntryState.SETUP_RETRY:
-            connection_status = "retrying"
-        else:
-            connection_status = "unknown"
-        
-        coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
-        
-        if not coordinator:
-            # Entry exists but coordinator not loaded - might be auth error
-            accounts.append({
-                "entry_id": entry.entry_id,
-                "account_name": entry.data.get(CONF_ACCOUNT_NAME, "Unknown"),
-                "time_zone": entry.data.get(CONF_TIME_ZONE, "UTC"),
-                "active": False,
-                "connection_status": "error" if entry.state == ConfigEntryState.SETUP_ERROR else connection_status,
-                "order_stage": "No Active Order",
-                "order_status": "No Active Order",
-                "restaurant_name": "No Restaurant",
-                "driver_name": "No Driver Assigned",
-                "driver_eta": "No ETA",
-                "minutes_remaining": None,
-                "order_id": "No Active Order",
-                "latest_arrival": "No Latest Arrival",
-                "driver_location": {
-                    "lat": home_lat,
-                    "lon": home_lon,
-                    "street": "Home",
-                    "suburb": "Unknown",
-                    "address": "Home",
-                },
-                "user_picture_url": None,
-                "driver_picture_url": None,
-                "driver_phone_formatted": "",
-                "home_location": {"lat": home_lat, "lon": home_lon},
-                "store_location": None,
-                "driver_location_coords": None,
-            })
-            continue
-        
-        data = coordinator.data or {}
-        
-        # Check if last update was successful
-        if not coordinator.last_update_success:
-            connection_status = "error"
-        
-        # Get driver location or fall back to home
-        is_active = data.get("active", False)
-        driver_name = data.get("driver_name", "No Driver Assigned")
-        driver_assigned = driver_name not in ("No Driver Assigned", "Unknown", None, "")
-        
-        lat = data.get("driver_location_lat")
-        lon = data.get("driver_location_lon")
-        
-        has_valid_coords = (
-            lat not in (None, "No Active Order") and
-            lon not in (None, "No Active Order") and
-            isinstance(lat, (int, float)) and
-            isinstance(lon, (int, float))
-        )
-        
-        # Use driver location only if order active and driver assigned with valid coords
-        if is_active and driver_assigned and has_valid_coords:
-            display_lat = float(lat)
-            display_lon = float(lon)
-        else:
-            display_lat = home_lat
-            display_lon = home_lon
-        
-        # Get orders array for multi-order support
-        orders_array = data.get("orders", [])
-        orders_count = data.get("orders_count", 0)
-
-        accounts.append({
+
+    # Determine connection status based on entry state
+    if entry.state == ConfigEntryState.LOADED:
+        connection_status = "connected"
+    elif entry.state == ConfigEntryState.SETUP_ERROR:
+        connection_status = "error"
+    elif entry.state == ConfigEntryState.SETUP_RETRY:
+        connection_status = "retrying"
+    else:
+        connection_status = "unknown"
+
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+
+    if not coordinator:
+        # Entry exists but coordinator not loaded - might be auth error
+        return {
             "entry_id": entry.entry_id,
             "account_name": entry.data.get(CONF_ACCOUNT_NAME, "Unknown"),
             "time_zone": entry.data.get(CONF_TIME_ZONE, "UTC"),
-            "active": is_active,
-            "connection_status": connection_status,
-            "orders": orders_array,
-            "orders_count": orders_count,
-            # Flat fields for backward compatibility (first order)
-            "order_stage": data.get("order_stage", "No Active Order"),
-            "order_status": data.get("order_status", "No Active Order"),
-            "restaurant_name": data.get("restaurant_name", "No Restaurant"),
-            "driver_name": driver_name,
-            "driver_eta": data.get("driver_eta_str", "No ETA"),
-            "minutes_remaining": data.get("minutes_remaining"),
-            "order_id": data.get("order_id", "No Active Order"),
-            "latest_arrival": data.get("latest_arrival", "No Latest Arrival"),
+            "active": False,
+            "connection_status": "error" if entry.state == ConfigEntryState.SETUP_ERROR else connection_status,
+            "order_stage": "No Active Order",
+            "order_status": "No Active Order",
+            "restaurant_name": "No Restaurant",
+            "driver_name": "No Driver Assigned",
+            "driver_eta": "No ETA",
+            "minutes_remaining": None,
+            "order_id": "No Active Order",
+            "latest_arrival": "No Latest Arrival",
             "driver_location": {
-                "lat": display_lat,
-                "lon": display_lon,
-                "street": data.get("driver_location_street", "Unknown"),
-                "suburb": data.get("driver_location_suburb", "Unknown"),
-                "address": data.get("driver_location_address", "Unknown"),
+                "lat": home_lat,
+                "lon": home_lon,
+                "street": "Home",
+                "suburb": "Unknown",
+                "address": "Home",
             },
-            "user_picture_url": data.get("user_picture_url"),
-            "driver_picture_url": data.get("driver_picture_url"),
-            "driver_phone_formatted": data.get("driver_phone_formatted", ""),
-            "home_location": data.get("home_location"),
-            "store_location": data.get("store_location"),
-            "driver_location_coords": data.get("driver_location_coords"),
-        })
-    
-    try:
-        version = _get_integration_version()
-    except Exception:
-        version = "1.0.0"
-    connection.send_result(msg["id"], {
-        "accounts": accounts,
-        "version": version,
-    })
+            "user_picture_url": None,
+            "driver_picture_url": None,
+            "driver_phone_formatted": "",
+            "home_location": {"lat": home_lat, "lon": home_lon},
+            "store_location": None,
+            "driver_location_coords": None,
+        }
 
+    data = coordinator.data or {}
 
-@websocket_api.websocket_command(
-    {
-        "type": "uber_eats/get_account_data",
-        vol.Required("entry_id"): str,
+    # Check if last update was successful
+    if not coordinator.last_update_success:
+        connection_status = "error"
+
+    # Get driver location or fall back to home
+    is_active = data.get("active", False)
+    driver_name = data.get("driver_name", "No Driver Assigned")
+    orders = data.get("orders", [])
+    first = orders[0] if orders else None
+
+    # Use driver location only if order active and driver assigned with valid coords
+    if first is not None and first.tracking_active:
+        display_lat, display_lon = (float(v) for v in first.coords)
+    else:
+        display_lat = home_lat
+        display_lon = home_lon
+
+    # Get orders array for multi-order support
+    orders_array = _orders_array(data)
+    orders_count = data.get("orders_count", 0)
+
+    return {
+        "entry_id": entry.entry_id,
+        "account_name": entry.data.get(CONF_ACCOUNT_NAME, "Unknown"),
+        "time_zone": entry.data.get(CONF_TIME_ZONE, "UTC"),
+        "active": is_active,
+        "connection_status": connection_status,
+        "orders": orders_array,
+        "orders_count": orders_count,
+        # Flat fields for backward compatibility (first order)
+        "order_stage": data.get("order_stage", "No Active Order"),
+        "order_status": data.get("order_status", "No Active Order"),
+        "restaurant_name": data.get("restaurant_name", "No Restaurant"),
+        "driver_name": driver_name,
+        "driver_eta": data.get("driver_eta_str", "No ETA"),
+        "minutes_remaining": data.get("minutes_remaining"),
+        "order_id": data.get("order_id", "No Active Order"),
+        "latest_arrival": data.get("latest_arrival", "No Latest Arrival"),
+        "driver_location": {
+            "lat": display_lat,
+            "lon": display_lon,
+            "street": data.get("driver_location_street", "Unknown"),
+            "suburb": data.get("driver_location_suburb", "Unknown"),
+            "address": data.get("driver_location_address", "Unknown"),
+        },
+        "user_picture_url": data.get("user_picture_url"),
+        "driver_picture_url": data.get("driver_picture_url"),
+        "driver_phone_formatted": data.get("driver_phone_formatted", ""),
+        "home_location": data.get("home_location"),
+        "store_location": data.get("store_location"),
+        "driver_location_coords": data.get("driver_location_coords"),
     }
-)
-@websocket_api.async_response
-async def websocket_get_account_data(
-    hass: HomeAssistant,
-    connection: websocket_api.ActiveConnection,
-    msg: dict[str, Any],
-) -> None:
-    """Get detailed data for a specific account."""
-    entry_id = msg["entry_id"]
-    
-    entry = hass.config_entries.async_get_entry(entry_id)
-    if not entry:
-        connection.send_error(msg["id"], "not_found", "Config entry not found")
-        return
-    
+
+
+def _build_account_details(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Build the detailed account dict used by get_account_data and subscribe."""
     # Get home coordinates
     home_lat = hass.config.latitude
     home_lon = hass.config.longitude
@@ -242,11 +205,11 @@ async def websocket_get_account_data(
     else:
         connection_status = "unknown"
     
-    coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
     if not coordinator:
         # Return basic info if coordinator not available
         result = {
-            "entry_id": entry_id,
+            "entry_id": entry.entry_id,
             "account_name": entry.data.get(CONF_ACCOUNT_NAME, "Unknown"),
             "time_zone": entry.data.get(CONF_TIME_ZONE, "UTC"),
             "active": False,
@@ -279,8 +242,7 @@ async def websocket_get_account_data(
             "driver_phone_formatted": "",
             "map_url": "No Map Available",
         }
-        connection.send_result(msg["id"], result)
-        return
+        return result
 
     data = coordinator.data or {}
     
@@ -291,26 +253,17 @@ async def websocket_get_account_data(
     # Determine if driver tracking is active
     driver_name = data.get("driver_name", "No Driver Assigned")
     is_active = data.get("active", False)
-    driver_assigned = driver_name not in ("No Driver Assigned", "Unknown", None, "")
-    
-    lat = data.get("driver_location_lat")
-    lon = data.get("driver_location_lon")
-    
-    has_valid_coords = (
-        lat not in (None, "No Active Order") and
-        lon not in (None, "No Active Order") and
-        isinstance(lat, (int, float)) and
-        isinstance(lon, (int, float))
-    )
-    
-    tracking_active = is_active and driver_assigned and has_valid_coords
+    orders = data.get("orders", [])
+    first = orders[0] if orders else None
+    driver_assigned = first is not None and first.has_driver
+    tracking_active = first is not None and first.tracking_active
     
     # Get orders array for multi-order support
-    orders_array = data.get("orders", [])
+    orders_array = _orders_array(data)
     orders_count = data.get("orders_count", 0)
 
     result = {
-        "entry_id": entry_id,
+        "entry_id": entry.entry_id,
         "account_name": entry.data.get(CONF_ACCOUNT_NAME, "Unknown"),
         "time_zone": entry.data.get(CONF_TIME_ZONE, "UTC"),
         "active": is_active,
@@ -330,8 +283,8 @@ async def websocket_get_account_data(
         "order_id": data.get("order_id", "No Active Order"),
         "latest_arrival": data.get("latest_arrival", "No Latest Arrival"),
         "driver_location": {
-            "lat": float(lat) if tracking_active else home_lat,
-            "lon": float(lon) if tracking_active else home_lon,
+            "lat": float(first.latitude) if tracking_active else home_lat,
+            "lon": float(first.longitude) if tracking_active else home_lon,
             "street": data.get("driver_location_street", "Unknown"),
             "suburb": data.get("driver_location_suburb", "Unknown"),
             "quarter": data.get("driver_location_quarter", "Unknown"),
@@ -347,7 +300,133 @@ async def websocket_get_account_data(
         "map_url": data.get("map_url", "No Map Available"),
     }
 
-    connection.send_result(msg["id"], result)
+    return result
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Set up WebSocket API."""
+    websocket_api.async_register_command(hass, websocket_get_accounts)
+    websocket_api.async_register_command(hass, websocket_get_account_data)
+    websocket_api.async_register_command(hass, websocket_subscribe)
+    websocket_api.async_register_command(hass, websocket_delete_account)
+    websocket_api.async_register_command(hass, websocket_get_tts_entities)
+    websocket_api.async_register_command(hass, websocket_get_tts_settings)
+    websocket_api.async_register_command(hass, websocket_update_tts_settings)
+    websocket_api.async_register_command(hass, websocket_get_automations)
+    websocket_api.async_register_command(hass, websocket_test_tts)
+    websocket_api.async_register_command(hass, websocket_get_past_orders)
+    websocket_api.async_register_command(hass, websocket_get_statistics)
+    websocket_api.async_register_command(hass, websocket_get_user_profile)
+    websocket_api.async_register_command(hass, websocket_get_http_stats)
+    websocket_api.async_register_command(hass, websocket_get_trajectory)
+
+
+@websocket_api.websocket_command(
+    {
+        "type": "uber_eats/get_accounts",
+    }
+)
+@websocket_api.async_response
+async def websocket_get_accounts(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Get all Uber Eats accounts."""
+    accounts = [
+        _build_account_summary(hass, entry)
+        for entry in hass.config_entries.async_entries(DOMAIN)
+    ]
+    
+    try:
+        version = _get_integration_version()
+    except Exception:
+        version = "1.0.0"
+    connection.send_result(msg["id"], {
+        "accounts": accounts,
+        "version": version,
+    })
+
+
+@websocket_api.websocket_command(
+    {
+        "type": "uber_eats/get_account_data",
+        vol.Required("entry_id"): str,
+    }
+)
+@websocket_api.async_response
+async def websocket_get_account_data(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Get detailed data for a specific account."""
+    entry_id = msg["entry_id"]
+    
+    entry = hass.config_entries.async_get_entry(entry_id)
+    if not entry:
+        connection.send_error(msg["id"], "not_found", "Config entry not found")
+        return
+    
+    connection.send_result(msg["id"], _build_account_details(hass, entry))
+
+
+@websocket_api.websocket_command(
+    {
+        "type": "uber_eats/subscribe",
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Push account data: one snapshot, then only changed fields per account.
+
+    Events are sent whenever a coordinator updates (or an account is added or
+    removed); nothing is sent between updates.
+    """
+    last_sent: dict[str, dict[str, Any]] = {}
+
+    @callback
+    def _async_send_changes(entry_id: str | None = None) -> None:
+        entries = {entry.entry_id: entry for entry in hass.config_entries.async_entries(DOMAIN)}
+        changed: dict[str, dict[str, Any]] = {}
+        for eid, entry in entries.items():
+            if entry_id is not None and eid != entry_id:
+                continue
+            account = _build_account_details(hass, entry)
+            previous = last_sent.get(eid)
+            if previous is None:
+                changed[eid] = account
+            else:
+                diff = {key: value for key, value in account.items() if previous.get(key) != value}
+                if diff:
+                    changed[eid] = diff
+            last_sent[eid] = account
+        removed = [eid for eid in last_sent if eid not in entries]
+        for eid in removed:
+            del last_sent[eid]
+        if changed or removed:
+            connection.send_message(
+                websocket_api.event_message(msg["id"], {"changed": changed, "removed": removed})
+            )
+
+    connection.subscriptions[msg["id"]] = async_dispatcher_connect(
+        hass, SIGNAL_ACCOUNT_UPDATED, _async_send_changes
+    )
+    connection.send_result(msg["id"])
+
+    accounts = []
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        account = _build_account_details(hass, entry)
+        last_sent[entry.entry_id] = account
+        accounts.append(account)
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"snapshot": accounts, "version": _get_integration_version()})
+    )
 
 
 @websocket_api.websocket_command(
@@ -449,6 +528,10 @@ async def websocket_get_tts_settings(
         return
 
     options = entry.options or {}
+    poll_min, poll_max = clamp_poll_bounds(
+        options.get(CONF_POLL_INTERVAL_MIN, DEFAULT_POLL_INTERVAL_MIN),
+        options.get(CONF_POLL_INTERVAL_MAX, DEFAULT_POLL_INTERVAL_MAX),
+    )
     connection.send_result(msg["id"], {
         "tts_enabled": options.get(CONF_TTS_ENABLED, False),
         "tts_entity_id": options.get(CONF_TTS_ENTITY_ID, ""),
@@ -465,6 +548,9 @@ async def websocket_get_tts_settings(
         "driver_nearby_automation_enabled": options.get(CONF_DRIVER_NEARBY_AUTOMATION_ENABLED, False),
         "driver_nearby_automation_entity": options.get(CONF_DRIVER_NEARBY_AUTOMATION_ENTITY, ""),
         "driver_nearby_distance_feet": int(options.get(CONF_DRIVER_NEARBY_DISTANCE_FEET, DEFAULT_DRIVER_NEARBY_DISTANCE_FEET)),
+        "poll_interval_min": poll_min,
+        "poll_interval_max": poll_max,
+        "past_orders_freshness_minutes": int(options.get(CONF_PAST_ORDERS_FRESHNESS, DEFAULT_PAST_ORDERS_FRESHNESS)),
     })
 
 
@@ -487,6 +573,9 @@ async def websocket_get_tts_settings(
         vol.Optional("driver_nearby_automation_enabled"): bool,
         vol.Optional("driver_nearby_automation_entity"): str,
         vol.Optional("driver_nearby_distance_feet"): int,
+        vol.Optional("poll_interval_min"): int,
+        vol.Optional("poll_interval_max"): int,
+        vol.Optional("past_orders_freshness_minutes"): int,
     }
 )
 @websocket_api.async_response
@@ -548,6 +637,15 @@ async def websocket_update_tts_settings(
         options[CONF_DRIVER_NEARBY_AUTOMATION_ENTITY] = (msg["driver_nearby_automation_entity"] or "").strip()
     if "driver_nearby_distance_feet" in msg and msg["driver_nearby_distance_feet"] is not None:
         options[CONF_DRIVER_NEARBY_DISTANCE_FEET] = max(50, min(2000, int(msg["driver_nearby_distance_feet"])))
+    if msg.get("poll_interval_min") is not None or msg.get("poll_interval_max") is not None:
+        poll_min, poll_max = clamp_poll_bounds(
+            msg.get("poll_interval_min", options.get(CONF_POLL_INTERVAL_MIN, DEFAULT_POLL_INTERVAL_MIN)),
+            msg.get("poll_interval_max", options.get(CONF_POLL_INTERVAL_MAX, DEFAULT_POLL_INTERVAL_MAX)),
+        )
+        options[CONF_POLL_INTERVAL_MIN] = poll_min
+        options[CONF_POLL_INTERVAL_MAX] = poll_max
+    if msg.get("past_orders_freshness_minutes") is not None:
+        options[CONF_PAST_ORDERS_FRESHNESS] = max(1, min(1440, int(msg["past_orders_freshness_minutes"])))
 
     hass.config_entries.async_update_entry(entry, options=options)
     connection.send_result(msg["id"], {"success": True})
@@ -621,10 +719,30 @@ async def websocket_test_tts(
         connection.send_error(msg["id"], "tts_failed", str(e))
 
 
+def _utc_day_start(hass: HomeAssistant, day: date) -> str:
+    """UTC instant of local midnight at the start of day, comparable with stored completed_at.
+
+    completed_at is a UTC ISO string; the bound has no suffix so an order at
+    exactly midnight still sorts after it.
+    """
+    time_zone = dt_util.get_time_zone(hass.config.time_zone) or dt_util.UTC
+    midnight = datetime.combine(day, datetime.min.time(), tzinfo=time_zone)
+    return dt_util.as_utc(midnight).strftime("%Y-%m-%dT%H:%M:%S")
+
+
 @websocket_api.websocket_command(
     {
         "type": "uber_eats/get_past_orders",
         vol.Required("entry_id"): str,
+        vol.Optional("cursor"): vol.Any(str, None),
+        vol.Optional("page_size", default=PAST_ORDERS_PAGE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1), vol.Clamp(max=PAST_ORDERS_MAX_PAGE_SIZE)
+        ),
+        vol.Optional("start_date"): cv.date,
+        vol.Optional("end_date"): cv.date,
+        vol.Optional("restaurant"): str,
+        vol.Optional("cancelled"): cv.boolean,
+        vol.Optional("sort", default=DEFAULT_SORT): vol.In(SORT_KEYS),
     }
 )
 @websocket_api.async_response
@@ -633,7 +751,12 @@ async def websocket_get_past_orders(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Get past orders for an account by calling Uber Eats API."""
+    """Get one page of past orders for an account from its history store.
+
+    Dates are inclusive local days in Home Assistant's time zone; restaurant
+    is a store uuid. The first page (no cursor) also lists the restaurants in
+    the date range for the filter.
+    """
     entry_id = msg["entry_id"]
     entry = hass.config_entries.async_get_entry(entry_id)
     if not entry:
@@ -645,16 +768,55 @@ async def websocket_get_past_orders(
         connection.send_error(msg["id"], "no_coordinator", "Coordinator not loaded")
         return
 
+    start = _utc_day_start(hass, msg["start_date"]) if msg.get("start_date") else None
+    end = _utc_day_start(hass, msg["end_date"] + timedelta(days=1)) if msg.get("end_date") else None
     try:
-        # Use cached method - returns cached data immediately, refreshes in background
-        result = await coordinator.get_past_orders_cached()
-        # result is {"orders": [...], "statistics": {...}, "from_cache": bool}
+        # Served from the history store immediately, refreshed in background when stale
+        result = await coordinator.get_past_orders_cached(
+            start=start,
+            end=end,
+            store_uuid=msg.get("restaurant") or None,
+            cancelled=msg.get("cancelled"),
+            sort=msg["sort"],
+            cursor=msg.get("cursor"),
+            limit=msg["page_size"],
+        )
+        if not msg.get("cursor"):
+            result["restaurants"] = await coordinator.get_past_order_restaurants(start, end)
         connection.send_result(msg["id"], result)
     except Exception as e:
         _LOGGER.error("Failed to fetch past orders: %s", e)
         connection.send_error(msg["id"], "fetch_failed", str(e))
 
 
+@websocket_api.websocket_command(
+    {
+        "type": "uber_eats/get_statistics",
+        vol.Required("entry_id"): str,
+        vol.Optional("year"): vol.Coerce(int),
+        vol.Optional("top", default=3): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+    }
+)
+@callback
+def websocket_get_statistics(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Get past-order statistics for a year (monthly, weekday and top-restaurant breakdowns)."""
+    coordinator = hass.data.get(DOMAIN, {}).get(msg["entry_id"])
+    if not coordinator:
+        connection.send_error(msg["id"], "no_coordinator", "Coordinator not loaded")
+        return
+
+    statistics = coordinator.statistics
+    year = msg.get("year") or datetime.now().year
+    connection.send_result(msg["id"], {
+        **statistics.summary(year, msg["top"]),
+        "years": statistics.years,
+    })
+
+
 @websocket_api.websocket_command(
     {
         "type": "uber_eats/get_user_profile",
@@ -667,7 +829,7 @@ async def websocket_get_user_profile(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """Get user profile for an account by calling Uber Eats API."""
+    """Get user profile for an account (cached, revalidated against the Uber Eats API)."""
     entry_id = msg["entry_id"]
     entry = hass.config_entries.async_get_entry(entry_id)
     if not entry:
@@ -680,8 +842,54 @@ async def websocket_get_user_profile(
         return
 
     try:
-        result = await coordinator.fetch_user_profile()
+        # Stale-while-revalidate: answer from cache, refresh getUserV1 in the background
+        result = await coordinator.async_get_user_profile(force_refresh=True)
         connection.send_result(msg["id"], result)
     except Exception as e:
         _LOGGER.error("Failed to fetch user profile: %s", e)
         connection.send_error(msg["id"], "fetch_failed", str(e))
+
+
+@websocket_api.websocket_command(
+    {
+        "type": "uber_eats/get_http_stats",
+    }
+)
+@callback
+def websocket_get_http_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Get connection pool, geocode cache and request budget statistics."""
+    connection.send_result(msg["id"], {
+        **async_get_http_client(hass).stats,
+        "geocode_cache": async_get_geocode_cache(hass).stats,
+        "scheduler": async_get_poll_scheduler(hass).stats,
+    })
+
+
+@websocket_api.websocket_command(
+    {
+        "type": "uber_eats/get_trajectory",
+        vol.Required("entry_id"): str,
+        vol.Optional("order_id"): str,
+    }
+)
+@callback
+def websocket_get_trajectory(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Get the courier track of an account's active orders (points are [lat, lon, unix time])."""
+    coordinator = hass.data.get(DOMAIN, {}).get(msg["entry_id"])
+    if not coordinator:
+        connection.send_error(msg["id"], "no_coordinator", "Coordinator not loaded")
+        return
+
+    trajectories = coordinator.trajectories
+    connection.send_result(msg["id"], {
+        "orders": trajectories.as_dict(msg.get("order_id")),
+        "max_points": trajectories.capacity,
+    })